@@ -0,0 +1,105 @@
+"""
+Benchmark da importação de jogos em lote.
+
+Compara, num banco SQLite temporário provisionado com `init-db`, o tempo
+para cadastrar N jogos com um POST /api/admin/games por jogo e com um único
+POST /api/admin/games/bulk (JSON e CSV).
+
+Uso:
+    python benchmarks/bulk_import.py [--rows 1000]
+"""
+import argparse
+import csv
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+def provision(env):
+    subprocess.run(
+        [sys.executable, '-m', 'flask', '--app', 'main', 'init-db'],
+        cwd=SRC_DIR, env=env, check=True, capture_output=True
+    )
+
+
+def make_rows(client, count, start):
+    # Jogos a cada hora, para não esbarrar na verificação de choques de horário
+    sports = client.get('/api/sports').get_json()
+    teams = client.get('/api/teams').get_json()
+    return [{
+        'sport_id': sports[i % len(sports)]['sport_id'],
+        'team_a_id': teams[i % len(teams)]['team_id'],
+        'team_b_id': teams[(i + 1) % len(teams)]['team_id'],
+        'game_date': (start + timedelta(hours=i)).isoformat(),
+        'location': f'Quadra {i % 3 + 1}'
+    } for i in range(count)]
+
+
+def to_csv(rows):
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+    return output.getvalue()
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['POSTGRES_URL'] = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+        provision(dict(os.environ))
+        sys.path.insert(0, SRC_DIR)
+        import main as api
+
+        client = api.app.test_client()
+        token = client.post('/api/login', json={'username': 'admin', 'password': 'admin@123'}).get_json()['access_token']
+        headers = {'Authorization': f'Bearer {token}'}
+        start = datetime(2025, 6, 1, 8, 0)
+        rows = make_rows(client, args.rows, start)
+        json_rows = make_rows(client, args.rows, start + timedelta(days=365))
+        csv_rows = make_rows(client, args.rows, start + timedelta(days=730))
+
+        def one_by_one():
+            for row in rows:
+                response = client.post('/api/admin/games', json=row, headers=headers)
+                assert response.status_code == 201, response.get_json()
+
+        def bulk_json():
+            response = client.post('/api/admin/games/bulk', json=json_rows, headers=headers)
+            assert response.get_json()['created'] == len(json_rows), response.get_json()
+
+        def bulk_csv():
+            response = client.post('/api/admin/games/bulk', data=to_csv(csv_rows),
+                                   content_type='text/csv', headers=headers)
+            assert response.get_json()['created'] == len(csv_rows), response.get_json()
+
+        results = [
+            ('um POST por jogo', timed(one_by_one)),
+            ('bulk (JSON)', timed(bulk_json)),
+            ('bulk (CSV)', timed(bulk_csv)),
+        ]
+
+    baseline = results[0][1]
+    print(f'jogos por rodada: {args.rows}')
+    for name, seconds in results:
+        print(f'{name:18s} {seconds * 1000:9.1f} ms  {args.rows / seconds:9.0f} jogos/s  ({baseline / seconds:5.1f}x)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
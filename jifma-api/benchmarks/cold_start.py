@@ -0,0 +1,80 @@
+"""
+Benchmark de cold start da API.
+
+Cada rodada sobe um interpretador novo (como uma instância serverless fria),
+importa src/main.py e mede o tempo até a primeira resposta de /api/sports,
+usando um banco SQLite local já provisionado com `init-db`.
+
+Uso:
+    python benchmarks/cold_start.py [--runs 5] [--max-ms 1500]
+
+Com --max-ms o script termina com código 1 se a mediana passar do limite,
+o que permite usá-lo como verificação de regressão no CI.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+PROBE = r'''
+import json, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {src!r})
+import main
+imported = time.perf_counter()
+response = main.app.test_client().get('/api/sports')
+first_response = time.perf_counter()
+assert response.status_code == 200, response.status_code
+print(json.dumps({{
+    'import_ms': (imported - start) * 1000,
+    'first_response_ms': (first_response - start) * 1000
+}}))
+'''
+
+
+def provision(env):
+    subprocess.run(
+        [sys.executable, '-m', 'flask', '--app', 'main', 'init-db'],
+        cwd=SRC_DIR, env=env, check=True, capture_output=True
+    )
+
+
+def run_once(env):
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE.format(src=SRC_DIR)],
+        cwd=SRC_DIR, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-ms', type=float, default=None,
+                        help='Falha se a mediana do tempo até a primeira resposta passar deste valor')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(os.environ, POSTGRES_URL='sqlite:///' + os.path.join(tmp, 'bench.db'))
+        provision(env)
+        results = [run_once(env) for _ in range(args.runs)]
+
+    imports = [r['import_ms'] for r in results]
+    firsts = [r['first_response_ms'] for r in results]
+    print(f'rodadas: {args.runs}')
+    print(f'import de main.py:       mediana {statistics.median(imports):8.1f} ms  (min {min(imports):.1f}, max {max(imports):.1f})')
+    print(f'até a primeira resposta: mediana {statistics.median(firsts):8.1f} ms  (min {min(firsts):.1f}, max {max(firsts):.1f})')
+
+    if args.max_ms is not None and statistics.median(firsts) > args.max_ms:
+        print(f'REGRESSÃO: mediana acima de {args.max_ms:.0f} ms')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
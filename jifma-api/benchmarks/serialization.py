@@ -0,0 +1,137 @@
+"""
+Micro-benchmark da serialização das listagens de jogos.
+
+Num banco SQLite temporário com N jogos, compara o caminho antigo (objetos do
+ORM + to_dict() + provider JSON padrão do Flask) com o caminho por colunas
+(tuplas + game_list_row + provider orjson), separando o tempo de montar a
+lista do tempo de codificar o JSON.
+
+Uso:
+    python benchmarks/serialization.py [--games 10000] [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+def provision(env):
+    subprocess.run(
+        [sys.executable, '-m', 'flask', '--app', 'main', 'init-db'],
+        cwd=SRC_DIR, env=env, check=True, capture_output=True
+    )
+
+
+def seed_games(count):
+    from models.user import db
+    from models.sports import Sport
+    from models.teams import Team
+    from services import bulk_games
+
+    sports = [sport_id for sport_id, in db.session.query(Sport.sport_id)]
+    teams = [team_id for team_id, in db.session.query(Team.team_id)]
+    start = datetime(2025, 1, 1, 8, 0)
+    bulk_games.insert_games([{
+        'game_id': str(uuid.uuid4()),
+        'sport_id': sports[i % len(sports)],
+        'team_a_id': teams[i % len(teams)],
+        'team_b_id': teams[(i + 1) % len(teams)],
+        'game_date': start + timedelta(hours=i),
+        'location': f'Quadra {i % 3 + 1}',
+        'status': 'Agendado'
+    } for i in range(count)])
+    db.session.commit()
+
+
+def games_query(columns):
+    from sqlalchemy.orm import aliased
+    from models.user import db
+    from models.games import Game
+    from models.sports import Sport
+    from models.teams import Team
+
+    TeamA = aliased(Team, name='team_a')
+    TeamB = aliased(Team, name='team_b')
+    names = (TeamA.name.label('team_a_name'), TeamB.name.label('team_b_name'), Sport.name.label('sport_name'))
+    selected = (*Game.list_columns(), *names) if columns else (Game, *names)
+    return db.session.query(*selected) \
+        .join(TeamA, Game.team_a_id == TeamA.team_id) \
+        .join(TeamB, Game.team_b_id == TeamB.team_id) \
+        .join(Sport, Game.sport_id == Sport.sport_id) \
+        .order_by(Game.game_date.asc(), Game.game_id.asc())
+
+
+def orm_path():
+    result = []
+    for game, team_a_name, team_b_name, sport_name in games_query(columns=False).all():
+        game_dict = game.to_dict()
+        game_dict['team_a_name'] = team_a_name
+        game_dict['team_b_name'] = team_b_name
+        game_dict['sport_name'] = sport_name
+        result.append(game_dict)
+    return result
+
+
+def column_path():
+    from models.games import game_list_row
+    return [game_list_row(row) for row in games_query(columns=True).all()]
+
+
+def measure(build, provider, runs):
+    from models.user import db
+    build_times, encode_times = [], []
+    for _ in range(runs):
+        db.session.expunge_all()
+        start = time.perf_counter()
+        data = build()
+        built = time.perf_counter()
+        provider.response(data).get_data()
+        encoded = time.perf_counter()
+        build_times.append(built - start)
+        encode_times.append(encoded - built)
+    return statistics.median(build_times), statistics.median(encode_times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['POSTGRES_URL'] = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+        provision(dict(os.environ))
+        sys.path.insert(0, SRC_DIR)
+        import main as api
+        from flask.json.provider import DefaultJSONProvider
+        from services.json_provider import OrjsonProvider, orjson
+
+        app = api.app
+        with app.app_context():
+            seed_games(args.games)
+            fast_provider = OrjsonProvider(app) if orjson is not None else DefaultJSONProvider(app)
+            results = [
+                ('ORM + to_dict + json padrão', measure(orm_path, DefaultJSONProvider(app), args.runs)),
+                ('colunas + serializer + json padrão', measure(column_path, DefaultJSONProvider(app), args.runs)),
+                (f'colunas + serializer + {type(fast_provider).__name__}',
+                 measure(column_path, fast_provider, args.runs)),
+            ]
+
+    baseline = sum(results[0][1])
+    print(f'jogos: {args.games}  rodadas: {args.runs} (medianas)')
+    for name, (build, encode) in results:
+        total = build + encode
+        print(f'{name:42s} montar {build * 1000:8.1f} ms  json {encode * 1000:8.1f} ms  '
+              f'total {total * 1000:8.1f} ms  ({baseline / total:4.1f}x)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
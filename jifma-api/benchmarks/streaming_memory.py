@@ -0,0 +1,104 @@
+"""
+Benchmark de memória das listagens administrativas em stream.
+
+Num banco SQLite temporário com N jogos, mede com tracemalloc o pico de
+memória e o tempo de GET /api/admin/games no caminho normal (lista inteira
+em memória + jsonify) e em stream (stream=1 e format=ndjson), consumindo o
+corpo da resposta pedaço a pedaço como faria o servidor WSGI.
+
+Uso:
+    python benchmarks/streaming_memory.py [--games 200000]
+"""
+import argparse
+import gc
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+def provision(env):
+    subprocess.run(
+        [sys.executable, '-m', 'flask', '--app', 'main', 'init-db'],
+        cwd=SRC_DIR, env=env, check=True, capture_output=True
+    )
+
+
+def seed_games(count, chunk=20000):
+    from models.user import db
+    from models.sports import Sport
+    from models.teams import Team
+    from services import bulk_games
+
+    sports = [sport_id for sport_id, in db.session.query(Sport.sport_id)]
+    teams = [team_id for team_id, in db.session.query(Team.team_id)]
+    start = datetime(2025, 1, 1, 8, 0)
+    for offset in range(0, count, chunk):
+        bulk_games.insert_games([{
+            'game_id': str(uuid.uuid4()),
+            'sport_id': sports[i % len(sports)],
+            'team_a_id': teams[i % len(teams)],
+            'team_b_id': teams[(i + 1) % len(teams)],
+            'game_date': start + timedelta(hours=i),
+            'location': f'Quadra {i % 3 + 1}',
+            'status': 'Agendado'
+        } for i in range(offset, min(offset + chunk, count))])
+        db.session.commit()
+
+
+def measure(client, url, headers):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = client.get(url, headers=headers, buffered=False)
+    size = 0
+    for chunk in response.response:
+        size += len(chunk)
+    response.close()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert response.status_code == 200, response.status_code
+    return elapsed, peak, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['POSTGRES_URL'] = 'sqlite:///' + os.path.join(tmp, 'bench.db')
+        provision(dict(os.environ))
+        sys.path.insert(0, SRC_DIR)
+        import main as api
+
+        app = api.app
+        with app.app_context():
+            seed_games(args.games)
+
+        client = app.test_client()
+        token = client.post('/api/login', json={'username': 'admin', 'password': 'admin@123'}).get_json()['access_token']
+        headers = {'Authorization': f'Bearer {token}'}
+        results = [
+            ('lista + jsonify', measure(client, '/api/admin/games', headers)),
+            ('stream=1 (array JSON)', measure(client, '/api/admin/games?stream=1', headers)),
+            ('format=ndjson', measure(client, '/api/admin/games?format=ndjson', headers)),
+        ]
+
+    baseline = results[0][1][1]
+    print(f'jogos: {args.games}')
+    for name, (elapsed, peak, size) in results:
+        print(f'{name:22s} tempo {elapsed * 1000:9.1f} ms  pico {peak / 2 ** 20:8.1f} MiB  '
+              f'corpo {size / 2 ** 20:7.1f} MiB  ({baseline / peak:5.1f}x menos memória)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
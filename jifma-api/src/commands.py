@@ -0,0 +1,88 @@
+import time
+import click
+
+
+def register_commands(app):
+    """Comandos de manutenção disponíveis via `flask --app main <comando>`"""
+
+    # Os módulos são importados dentro de cada comando para não pesar no
+    # cold start das requisições.
+
+    @app.cli.command('init-db')
+    @click.option('--seed/--no-seed', default=True, help='Insere os dados padrão em um banco vazio.')
+    def init_db(seed):
+        """Cria o schema, aplica as migrações e insere os dados padrão."""
+        from services import bootstrap
+        applied = bootstrap.init_schema(log=click.echo)
+        click.echo(f'{len(applied)} migração(ões) aplicada(s).')
+        if seed and bootstrap.seed_defaults():
+            click.echo('Dados padrão inseridos.')
+
+    @app.cli.command('db-upgrade')
+    def db_upgrade():
+        """Aplica as migrações pendentes no banco configurado."""
+        from services import migrations
+        applied = migrations.upgrade(log=click.echo)
+        click.echo(f'{len(applied)} migração(ões) aplicada(s).')
+
+    @app.cli.command('db-explain')
+    def db_explain():
+        """Mostra o plano de execução das consultas públicas."""
+        from services import query_plans
+        query_plans.explain_public_queries(log=click.echo)
+
+    @app.cli.command('rebuild-standings')
+    @click.option('--check', is_flag=True, help='Apenas compara a tabela incremental com o recálculo completo.')
+    def rebuild_standings(check):
+        """Recalcula a classificação a partir dos jogos finalizados."""
+        from services import standings
+        differences = standings.diff()
+        for (sport_id, team_id), actual, expected in differences:
+            click.echo(f'{sport_id} / {team_id}: tabela={actual} recalculado={expected}')
+        if check:
+            click.echo(f'{len(differences)} divergência(s).')
+            if differences:
+                raise SystemExit(1)
+            return
+        standings.rebuild()
+        click.echo('Classificação recalculada.')
+
+    @app.cli.command('rebuild-medals')
+    @click.option('--check', is_flag=True, help='Apenas compara o quadro de medalhas com o livro-razão.')
+    def rebuild_medals(check):
+        """Recalcula o quadro de medalhas a partir do livro-razão."""
+        from services import medals
+        differences = medals.diff()
+        for team_id, actual, expected in differences:
+            click.echo(f'{team_id}: quadro={actual} livro-razão={expected}')
+        if check:
+            click.echo(f'{len(differences)} divergência(s).')
+            if differences:
+                raise SystemExit(1)
+            return
+        medals.rebuild()
+        click.echo('Quadro de medalhas recalculado.')
+
+    @app.cli.command('publish-snapshots')
+    @click.option('--full', is_flag=True, help='Refaz todos os documentos, não só os alterados.')
+    @click.option('--interval', type=float, default=0,
+                  help='Repete a publicação a cada N segundos (0: publica uma vez).')
+    def publish_snapshots(full, interval):
+        """
+        Publica os snapshots JSON estáticos em SNAPSHOT_DIR, refazendo só o
+        que mudou desde a última publicação. Com RESPONSE_CACHE_VERSIONS=memory
+        as versões não são compartilhadas e toda publicação é completa.
+        """
+        from services.snapshots import snapshot_publisher
+        if snapshot_publisher.target is None:
+            raise click.UsageError('Defina SNAPSHOT_DIR para publicar os snapshots.')
+        while True:
+            # Contexto novo a cada rodada: sessão e versões lidas do zero
+            with app.app_context():
+                result = snapshot_publisher.publish(full=full)
+            click.echo(f"{result['documents']} documento(s), {result['written']} gravado(s), "
+                       f"{result['removed']} removido(s).")
+            if not interval:
+                return
+            full = False
+            time.sleep(interval)
@@ -1,171 +1,188 @@
-import os
-import sys
-from functools import wraps
-from datetime import timedelta
-
-# DON'T CHANGE THIS LINE
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
-from flask import Flask, jsonify
-from flask_cors import CORS
-from flask_jwt_extended import JWTManager, jwt_required, get_jwt_identity, get_jwt, verify_jwt_in_request
-from models.user import db, User
-from models.news import News
-from models.sports import Sport
-from models.teams import Team
-from models.games import Game
-from models.medals import MedalStanding
-
-# Import blueprints
-from routes.admin_users import user_bp
-from routes.news import news_bp
-from routes.sports import sports_bp
-from routes.teams import teams_bp
-from routes.games import games_bp
-from routes.admin_medals import medals_bp
-from routes.auth import auth_bp
-from routes.admin_news import admin_news_bp
-from routes.admin_games import admin_games_bp
-from routes.admin_teams import admin_teams_bp
-
-def create_app():
-    app = Flask(__name__)
-    
-    # Configuration
-    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
-    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('POSTGRES_URL', 'sqlite:///jifma.db')
-    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-    app.config['JWT_SECRET_KEY'] = os.environ.get('JWT_SECRET_KEY', 'super-secret-key-change-in-production')
-    app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(days=7)  # 7 dias para expirar o token
-    
-    # Initialize extensions
-    db.init_app(app)
-    CORS(app, origins="*")
-    jwt = JWTManager(app)
-    
-    # Custom decorator for admin verification
-    def admin_required():
-        def wrapper(fn):
-            @wraps(fn)
-            def decorator(*args, **kwargs):
-                verify_jwt_in_request()
-                claims = get_jwt()
-                if not claims.get('is_admin', False):
-                    return jsonify({'message': 'Acesso negado: requer privilégios de admin'}), 403
-                return fn(*args, **kwargs)
-            return decorator
-        return wrapper
-    
-    # Make the decorator available to all blueprints
-    app.admin_required = admin_required
-    
-    # Register blueprints
-    app.register_blueprint(user_bp, url_prefix='/api')
-    app.register_blueprint(news_bp, url_prefix='/api')
-    app.register_blueprint(sports_bp, url_prefix='/api')
-    app.register_blueprint(teams_bp, url_prefix='/api')
-    app.register_blueprint(games_bp, url_prefix='/api')
-    app.register_blueprint(medals_bp, url_prefix='/api')
-    app.register_blueprint(auth_bp, url_prefix='/api')
-    app.register_blueprint(admin_news_bp, url_prefix='/api')
-    app.register_blueprint(admin_games_bp, url_prefix='/api')
-    app.register_blueprint(admin_teams_bp, url_prefix='/api')
-    
-    # JWT callbacks for custom responses
-    @jwt.expired_token_loader
-    def expired_token_callback(jwt_header, jwt_payload):
-        return jsonify({
-            'message': 'Token expirado',
-            'error': 'token_expired'
-        }), 401
-
-    @jwt.invalid_token_loader
-    def invalid_token_callback(error):
-        return jsonify({
-            'message': 'Token inválido',
-            'error': 'invalid_token'
-        }), 401
-
-    @jwt.unauthorized_loader
-    def missing_token_callback(error):
-        return jsonify({
-            'message': 'Token de acesso não encontrado',
-            'error': 'authorization_required'
-        }), 401
-    
-    # Create tables
-    with app.app_context():
-        db.create_all()
-        
-        # Initialize default data if tables are empty
-        if Sport.query.count() == 0:
-            sports = [
-                Sport(name='Futsal', description='Modalidade de futebol indoor'),
-                Sport(name='Futebol de Campo', description='Futebol tradicional em campo aberto'),
-                Sport(name='Vôlei de Praia', description='Voleibol na areia'),
-                Sport(name='Vôlei de Quadra', description='Voleibol em quadra coberta'),
-                Sport(name='Handebol', description='Esporte coletivo com as mãos'),
-                Sport(name='Basquete', description='Basquetebol em quadra')
-            ]
-            for sport in sports:
-                db.session.add(sport)
-            
-            teams = [
-                Team(name='Informática', city='Caxias'),
-                Team(name='Administração', city='Caxias'),
-                Team(name='Agropecuária', city='Caxias'),
-                Team(name='Edificações', city='Caxias')
-            ]
-            for team in teams:
-                db.session.add(team)
-            
-            # Criar usuário administrador padrão
-            admin_user = User(
-                username='admin',
-                email='admin@jifma.com',
-                is_admin=True
-            )
-            admin_user.set_password('admin@123')
-            db.session.add(admin_user)
-            
-            db.session.commit()
-    
-    @app.route('/')
-    def index():
-        return {
-            'message': 'JIFMA API - Portal dos Jogos Internos do IFMA Campus Caxias',
-            'version': '2.0.0',
-            'endpoints': {
-                'public': {
-                    'news': '/api/news',
-                    'sports': '/api/sports',
-                    'teams': '/api/teams',
-                    'games': '/api/games',
-                    'medals': '/api/medals'
-                },
-                'auth': {
-                    'login': '/api/login',
-                    'register': '/api/register',
-                    'profile': '/api/profile',
-                    'verify_admin': '/api/verify-admin'
-                },
-                'admin': {
-                    'news': '/api/admin/news',
-                    'games': '/api/admin/games',
-                    'teams': '/api/admin/teams',
-                    'sports': '/api/admin/sports'
-                }
-            }
-        }
-    
-    @app.route('/health')
-    def health():
-        return {'status': 'healthy', 'message': 'API is running'}
-    
-    return app
-
-app = create_app()
-
-if __name__ == '__main__':
-    port = int(os.environ.get('PORT', 5000))
+import os
+import sys
+from datetime import timedelta
+
+# DON'T CHANGE THIS LINE
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from flask import Flask, jsonify
+from flask_cors import CORS
+from flask_jwt_extended import JWTManager
+from models.user import db
+from services.auth import admin_required, admin_tokens
+from services.cache import response_cache
+from services import http_cache, json_provider, live
+from services.snapshots import snapshot_publisher
+from services.database import default_pool_profile, engine_options, pool_stats
+from commands import register_commands
+
+# Import blueprints
+from routes.admin_users import user_bp
+from routes.news import news_bp
+from routes.sports import sports_bp
+from routes.teams import teams_bp
+from routes.games import games_bp
+from routes.admin_medals import medals_bp
+from routes.auth import auth_bp
+from routes.admin_news import admin_news_bp
+from routes.admin_games import admin_games_bp
+from routes.admin_teams import admin_teams_bp
+from routes.internal import internal_bp
+from routes.tags import tags_bp
+from routes.standings import standings_bp
+from routes.admin_fixtures import admin_fixtures_bp
+from routes.dashboard import dashboard_bp
+from routes.batch import batch_bp
+from routes.admin_export import admin_export_bp
+from routes.calendar import calendar_bp
+
+def create_app():
+    app = Flask(__name__)
+    
+    # Configuration
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('POSTGRES_URL', 'sqlite:///jifma.db')
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    app.config['DB_POOL_PROFILE'] = os.environ.get('DB_POOL_PROFILE', default_pool_profile(app.config['SQLALCHEMY_DATABASE_URI']))
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['DB_POOL_PROFILE'], app.config['SQLALCHEMY_DATABASE_URI'])
+    app.config['JWT_SECRET_KEY'] = os.environ.get('JWT_SECRET_KEY', 'super-secret-key-change-in-production')
+    app.config['JWT_ACCESS_TOKEN_EXPIRES'] = timedelta(days=7)  # 7 dias para expirar o token
+    app.config['RESPONSE_CACHE_MAX_ENTRIES'] = int(os.environ.get('RESPONSE_CACHE_MAX_ENTRIES', 512))
+    app.config['RESPONSE_CACHE_MAX_BYTES'] = int(os.environ.get('RESPONSE_CACHE_MAX_BYTES', 16 * 1024 * 1024))
+    # database: versões compartilhadas entre instâncias; memory: só um processo
+    app.config['RESPONSE_CACHE_VERSIONS'] = os.environ.get('RESPONSE_CACHE_VERSIONS', 'database')
+    app.config['RESPONSE_CACHE_TTL'] = int(os.environ.get('RESPONSE_CACHE_TTL', 300))
+    app.config['ADMIN_TOKEN_CACHE_TTL'] = int(os.environ.get('ADMIN_TOKEN_CACHE_TTL', 30))
+    app.config['PUBLIC_CACHE_MAX_AGE'] = int(os.environ.get('PUBLIC_CACHE_MAX_AGE', 10))
+    app.config['COMPRESS_MIN_SIZE'] = int(os.environ.get('COMPRESS_MIN_SIZE', 1024))
+    app.config['GAME_DURATION_MINUTES'] = int(os.environ.get('GAME_DURATION_MINUTES', 60))
+    app.config['BATCH_MAX_REQUESTS'] = int(os.environ.get('BATCH_MAX_REQUESTS', 20))
+    app.config['JSON_PROVIDER'] = os.environ.get('JSON_PROVIDER')  # orjson (se instalado) ou std
+    app.config['CALENDAR_TIMEZONE'] = os.environ.get('CALENDAR_TIMEZONE', 'America/Fortaleza')
+    app.config['SNAPSHOT_DIR'] = os.environ.get('SNAPSHOT_DIR')  # vazio: snapshots estáticos desativados
+    # Publicação incremental em segundo plano após cada escrita de admin (0/false: só pelo CLI)
+    app.config['SNAPSHOT_AUTO_PUBLISH'] = os.environ.get('SNAPSHOT_AUTO_PUBLISH', '1').lower() not in ('0', 'false')
+    app.config['SNAPSHOT_PUBLISH_DELAY'] = float(os.environ.get('SNAPSHOT_PUBLISH_DELAY', 1))
+    app.config['EXPORT_CACHE_DIR'] = os.environ.get('EXPORT_CACHE_DIR')  # padrão: <tmp>/jifma-exports
+    app.config['EXPORT_CACHE_TTL'] = int(os.environ.get('EXPORT_CACHE_TTL', 3600))  # segundos sem download até apagar
+    # memory: um único worker; database: vários workers (LISTEN/NOTIFY no Postgres)
+    app.config['LIVE_BROKER'] = os.environ.get('LIVE_BROKER', 'memory' if app.config['DB_POOL_PROFILE'] == 'default' else 'database')
+    app.config['LIVE_HEARTBEAT'] = int(os.environ.get('LIVE_HEARTBEAT', 15))
+    app.config['LIVE_STREAM_MAX_SECONDS'] = int(os.environ.get('LIVE_STREAM_MAX_SECONDS', 300))
+    app.config['LIVE_GAP_TIMEOUT'] = int(os.environ.get('LIVE_GAP_TIMEOUT', 30))
+    
+    # Initialize extensions
+    json_provider.init_app(app)
+    db.init_app(app)
+    with app.app_context():
+        pool_stats.init_app(app, db.engine)
+        live.init_app(app, db.engine)
+    response_cache.init_app(app)
+    admin_tokens.init_app(app)
+    CORS(app, origins="*", expose_headers=['ETag'])
+    http_cache.init_app(app)
+    snapshot_publisher.init_app(app)
+    jwt = JWTManager(app)
+    
+    # Make the decorator available to all blueprints
+    app.admin_required = admin_required
+    
+    # Register blueprints
+    app.register_blueprint(user_bp, url_prefix='/api')
+    app.register_blueprint(news_bp, url_prefix='/api')
+    app.register_blueprint(sports_bp, url_prefix='/api')
+    app.register_blueprint(teams_bp, url_prefix='/api')
+    app.register_blueprint(games_bp, url_prefix='/api')
+    app.register_blueprint(medals_bp, url_prefix='/api')
+    app.register_blueprint(auth_bp, url_prefix='/api')
+    app.register_blueprint(admin_news_bp, url_prefix='/api')
+    app.register_blueprint(admin_games_bp, url_prefix='/api')
+    app.register_blueprint(admin_teams_bp, url_prefix='/api')
+    app.register_blueprint(internal_bp, url_prefix='/api')
+    app.register_blueprint(tags_bp, url_prefix='/api')
+    app.register_blueprint(standings_bp, url_prefix='/api')
+    app.register_blueprint(admin_fixtures_bp, url_prefix='/api')
+    app.register_blueprint(dashboard_bp, url_prefix='/api')
+    app.register_blueprint(batch_bp, url_prefix='/api')
+    app.register_blueprint(admin_export_bp, url_prefix='/api')
+    app.register_blueprint(calendar_bp, url_prefix='/api')
+
+    # Maintenance commands (init-db, db-upgrade, db-explain, rebuild-standings, rebuild-medals, publish-snapshots)
+    register_commands(app)
+    
+    # JWT callbacks for custom responses
+    @jwt.expired_token_loader
+    def expired_token_callback(jwt_header, jwt_payload):
+        return jsonify({
+            'message': 'Token expirado',
+            'error': 'token_expired'
+        }), 401
+
+    @jwt.invalid_token_loader
+    def invalid_token_callback(error):
+        return jsonify({
+            'message': 'Token inválido',
+            'error': 'invalid_token'
+        }), 401
+
+    @jwt.unauthorized_loader
+    def missing_token_callback(error):
+        return jsonify({
+            'message': 'Token de acesso não encontrado',
+            'error': 'authorization_required'
+        }), 401
+    
+    # Schema e dados iniciais ficam fora do caminho das requisições:
+    # execute `flask --app main init-db` ao provisionar o banco.
+    
+    @app.route('/')
+    def index():
+        return {
+            'message': 'JIFMA API - Portal dos Jogos Internos do IFMA Campus Caxias',
+            'version': '2.0.0',
+            'endpoints': {
+                'public': {
+                    'dashboard': '/api/dashboard',
+                    'batch': '/api/batch',
+                    'news': '/api/news',
+                    'sports': '/api/sports',
+                    'teams': '/api/teams',
+                    'games': '/api/games',
+                    'live': '/api/games/live',
+                    'calendar': '/api/calendar/<team|sport>/<id>.ics',
+                    'medals': '/api/medals'
+                },
+                'auth': {
+                    'login': '/api/login',
+                    'register': '/api/register',
+                    'profile': '/api/profile',
+                    'verify_admin': '/api/verify-admin'
+                },
+                'admin': {
+                    'news': '/api/admin/news',
+                    'games': '/api/admin/games',
+                    'fixtures': '/api/admin/fixtures',
+                    'export': '/api/admin/export/<games|medals>',
+                    'teams': '/api/admin/teams',
+                    'sports': '/api/admin/sports'
+                }
+            }
+        }
+    
+    @app.route('/health')
+    def health():
+        return {'status': 'healthy', 'message': 'API is running'}
+    
+    return app
+
+app = create_app()
+
+if __name__ == '__main__':
+    # Ambiente local: garante o schema e os dados padrão antes de subir o servidor
+    from services import bootstrap
+    with app.app_context():
+        bootstrap.init_schema(log=app.logger.info)
+        bootstrap.seed_defaults()
+
+    port = int(os.environ.get('PORT', 5000))
     app.run(host='0.0.0.0', port=port, debug=False, use_reloader=True)
\ No newline at end of file
@@ -0,0 +1,13 @@
+from models.user import db
+from datetime import datetime
+
+class CacheVersion(db.Model):
+    """
+    Versão de uma tabela (ou escopo, como 'games:team:<id>') usada nas chaves
+    dos caches. Fica no banco para que todas as instâncias vejam o mesmo valor.
+    """
+    __tablename__ = 'cache_versions'
+    
+    name = db.Column(db.String(120), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,43 @@
+from models.user import db
+import uuid
+
+class BracketSlot(db.Model):
+    """
+    Vaga de um chaveamento eliminatório. O jogo só é criado quando as duas
+    equipes da vaga são conhecidas; o vencedor segue para next_slot_id, no
+    lado next_side ('a' ou 'b').
+    """
+    __tablename__ = 'bracket_slots'
+    __table_args__ = (
+        db.Index('ix_bracket_slots_bracket', 'bracket_id', 'round', 'position'),
+        db.Index('ux_bracket_slots_game', 'game_id', unique=True),
+    )
+    
+    slot_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    bracket_id = db.Column(db.String(36), nullable=False)
+    sport_id = db.Column(db.String(36), db.ForeignKey('sports.sport_id'), nullable=False)
+    round = db.Column(db.Integer, nullable=False)
+    position = db.Column(db.Integer, nullable=False)
+    team_a_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=True)
+    team_b_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=True)
+    game_id = db.Column(db.String(36), db.ForeignKey('games.game_id'), nullable=True)
+    game_date = db.Column(db.DateTime, nullable=True)  # vazio nas vagas com bye
+    location = db.Column(db.String(200), nullable=True)
+    next_slot_id = db.Column(db.String(36), db.ForeignKey('bracket_slots.slot_id'), nullable=True)
+    next_side = db.Column(db.String(1), nullable=True)
+    
+    def to_dict(self):
+        return {
+            'slot_id': self.slot_id,
+            'bracket_id': self.bracket_id,
+            'sport_id': self.sport_id,
+            'round': self.round,
+            'position': self.position,
+            'team_a_id': self.team_a_id,
+            'team_b_id': self.team_b_id,
+            'game_id': self.game_id,
+            'game_date': self.game_date.isoformat() if self.game_date else None,
+            'location': self.location,
+            'next_slot_id': self.next_slot_id,
+            'next_side': self.next_side
+        }
@@ -1,32 +1,115 @@
-from models.user import db
-from datetime import datetime
-import uuid
-
-class Game(db.Model):
-    __tablename__ = 'games'
-    
-    game_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    sport_id = db.Column(db.String(36), db.ForeignKey('sports.sport_id'), nullable=False)
-    team_a_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=False)
-    team_b_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=False)
-    score_a = db.Column(db.Integer, nullable=True)
-    score_b = db.Column(db.Integer, nullable=True)
-    game_date = db.Column(db.DateTime, nullable=False)
-    location = db.Column(db.String(200), nullable=True)
-    status = db.Column(db.String(20), nullable=False, default='Agendado')  # Agendado, Em Andamento, Finalizado, Cancelado
-    winner_team_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=True)
-    
-    def to_dict(self):
-        return {
-            'game_id': self.game_id,
-            'sport_id': self.sport_id,
-            'team_a_id': self.team_a_id,
-            'team_b_id': self.team_b_id,
-            'score_a': self.score_a,
-            'score_b': self.score_b,
-            'game_date': self.game_date.isoformat(),
-            'location': self.location,
-            'status': self.status,
-            'winner_team_id': self.winner_team_id
-        }
-
+from models.user import db
+from datetime import datetime
+from sqlalchemy.orm import selectinload
+from services.serializers import isoformat, row_serializer
+import uuid
+
+# Objetos relacionados que podem ser embutidos com ?include=
+INCLUDES = ('teams', 'sport')
+
+class Game(db.Model):
+    __tablename__ = 'games'
+    __table_args__ = (
+        db.Index('ix_games_game_date', 'game_date', 'game_id'),
+        db.Index('ix_games_sport_date', 'sport_id', 'game_date'),
+        db.Index('ix_games_status_date', 'status', 'game_date'),
+        db.Index('ix_games_team_a', 'team_a_id'),
+        db.Index('ix_games_team_b', 'team_b_id'),
+        db.Index('ix_games_winner', 'winner_team_id'),
+    )
+    
+    game_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    sport_id = db.Column(db.String(36), db.ForeignKey('sports.sport_id'), nullable=False)
+    team_a_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=False)
+    team_b_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=False)
+    score_a = db.Column(db.Integer, nullable=True)
+    score_b = db.Column(db.Integer, nullable=True)
+    game_date = db.Column(db.DateTime, nullable=False)
+    location = db.Column(db.String(200), nullable=True)
+    status = db.Column(db.String(20), nullable=False, default='Agendado')  # Agendado, Em Andamento, Finalizado, Cancelado
+    winner_team_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=True)
+    # Controle otimista de concorrência: todo UPDATE confere e incrementa a versão
+    version = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+
+    __mapper_args__ = {'version_id_col': version}
+
+    # Somente leitura: as rotas gravam os ids, os objetos servem para ?include=
+    sport = db.relationship('Sport', foreign_keys=[sport_id], viewonly=True)
+    team_a = db.relationship('Team', foreign_keys=[team_a_id], viewonly=True)
+    team_b = db.relationship('Team', foreign_keys=[team_b_id], viewonly=True)
+    winner = db.relationship('Team', foreign_keys=[winner_team_id], viewonly=True)
+    
+    def to_dict(self, include=()):
+        game_dict = self._columns_dict()
+        if 'teams' in include:
+            game_dict['team_a'] = self.team_a.to_dict() if self.team_a else None
+            game_dict['team_b'] = self.team_b.to_dict() if self.team_b else None
+            game_dict['winner'] = self.winner.to_dict() if self.winner else None
+        if 'sport' in include:
+            game_dict['sport'] = self.sport.to_dict() if self.sport else None
+        return game_dict
+
+    # Colunas das listagens somente leitura (tuplas, sem objetos do ORM)
+    LIST_COLUMNS = ('game_id', 'sport_id', 'team_a_id', 'team_b_id', 'score_a', 'score_b',
+                    'game_date', 'location', 'status', 'winner_team_id', 'version')
+
+    @classmethod
+    def list_columns(cls):
+        return [getattr(cls, name) for name in cls.LIST_COLUMNS]
+
+    def _columns_dict(self):
+        return {
+            'game_id': self.game_id,
+            'sport_id': self.sport_id,
+            'team_a_id': self.team_a_id,
+            'team_b_id': self.team_b_id,
+            'score_a': self.score_a,
+            'score_b': self.score_b,
+            'game_date': self.game_date.isoformat(),
+            'location': self.location,
+            'status': self.status,
+            'winner_team_id': self.winner_team_id,
+            'version': self.version
+        }
+
+
+# Mesma saída de to_dict(), a partir de Game.list_columns() (+ nomes das equipes/modalidade)
+game_row = row_serializer(Game.LIST_COLUMNS, game_date=isoformat)
+game_list_row = row_serializer(Game.LIST_COLUMNS + ('team_a_name', 'team_b_name', 'sport_name'),
+                               game_date=isoformat)
+
+
+def parse_include(value):
+    """Lê o parâmetro include (ex.: "teams,sport"); ValueError se houver opção desconhecida"""
+    include = {item.strip() for item in (value or '').split(',') if item.strip()}
+    unknown = include - set(INCLUDES)
+    if unknown:
+        raise ValueError(f'include inválido: {", ".join(sorted(unknown))}. Use {", ".join(INCLUDES)}.')
+    return include
+
+
+def include_options(include):
+    """selectinload das relações pedidas: uma consulta IN por relação, sem N+1"""
+    options = []
+    if 'teams' in include:
+        options += [selectinload(Game.team_a), selectinload(Game.team_b), selectinload(Game.winner)]
+    if 'sport' in include:
+        options.append(selectinload(Game.sport))
+    return options
+
+
+class GameEvent(db.Model):
+    """
+    Eventos de placar/status publicados no stream /api/games/live quando o
+    broker de banco está em uso. O event_id crescente é o Last-Event-ID do SSE.
+    """
+    __tablename__ = 'game_events'
+    __table_args__ = (
+        db.Index('ix_game_events_sport', 'sport_id', 'event_id'),
+    )
+    
+    event_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    game_id = db.Column(db.String(36), nullable=False)
+    sport_id = db.Column(db.String(36), nullable=False)
+    payload = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
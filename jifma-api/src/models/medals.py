@@ -1,26 +1,73 @@
-from models.user import db
-import uuid
-
-class MedalStanding(db.Model):
-    __tablename__ = 'medal_standings'
-    
-    medal_standing_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    team_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=False)
-    gold_medals = db.Column(db.Integer, nullable=False, default=0)
-    silver_medals = db.Column(db.Integer, nullable=False, default=0)
-    bronze_medals = db.Column(db.Integer, nullable=False, default=0)
-    
-    @property
-    def total_medals(self):
-        return self.gold_medals + self.silver_medals + self.bronze_medals
-    
-    def to_dict(self):
-        return {
-            'medal_standing_id': self.medal_standing_id,
-            'team_id': self.team_id,
-            'gold_medals': self.gold_medals,
-            'silver_medals': self.silver_medals,
-            'bronze_medals': self.bronze_medals,
-            'total_medals': self.total_medals
-        }
-
+from models.user import db
+from datetime import datetime
+import uuid
+
+MEDAL_TYPES = ('gold', 'silver', 'bronze')
+AWARD_KINDS = ('award', 'revoke', 'adjustment')
+
+class MedalStanding(db.Model):
+    __tablename__ = 'medal_standings'
+    __table_args__ = (
+        db.Index('ux_medal_standings_team', 'team_id', unique=True),
+        db.Index('ix_medal_standings_ranking', 'gold_medals', 'silver_medals', 'bronze_medals'),
+    )
+    
+    medal_standing_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    team_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=False)
+    gold_medals = db.Column(db.Integer, nullable=False, default=0)
+    silver_medals = db.Column(db.Integer, nullable=False, default=0)
+    bronze_medals = db.Column(db.Integer, nullable=False, default=0)
+    
+    @property
+    def total_medals(self):
+        return self.gold_medals + self.silver_medals + self.bronze_medals
+    
+    def to_dict(self):
+        return {
+            'medal_standing_id': self.medal_standing_id,
+            'team_id': self.team_id,
+            'gold_medals': self.gold_medals,
+            'silver_medals': self.silver_medals,
+            'bronze_medals': self.bronze_medals,
+            'total_medals': self.total_medals
+        }
+
+
+class MedalAward(db.Model):
+    """
+    Lançamento do livro-razão de medalhas. Os registros nunca são alterados:
+    uma revogação é um novo lançamento com delta -1 apontando para o original.
+    Ajustes manuais do quadro (e a carga inicial dos totais antigos) entram
+    como kind='adjustment', com delta livre e sem modalidade.
+    """
+    __tablename__ = 'medal_awards'
+    __table_args__ = (
+        db.Index('ix_medal_awards_sport_team', 'sport_id', 'team_id'),
+        db.Index('ix_medal_awards_team', 'team_id'),
+        db.Index('ux_medal_awards_revokes', 'revokes_award_id', unique=True),
+    )
+    
+    award_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    sport_id = db.Column(db.String(36), db.ForeignKey('sports.sport_id'), nullable=True)  # NULL só em ajustes
+    team_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), nullable=False)
+    game_id = db.Column(db.String(36), db.ForeignKey('games.game_id', ondelete='SET NULL'), nullable=True)
+    medal_type = db.Column(db.String(10), nullable=False)  # gold, silver, bronze
+    kind = db.Column(db.String(20), nullable=False, default='award', server_default='award')  # award, revoke, adjustment
+    delta = db.Column(db.Integer, nullable=False, default=1)  # 1 = concessão, -1 = revogação, livre em ajustes
+    revokes_award_id = db.Column(db.String(36), db.ForeignKey('medal_awards.award_id'), nullable=True)
+    created_by = db.Column(db.String(36), nullable=True)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            'award_id': self.award_id,
+            'sport_id': self.sport_id,
+            'team_id': self.team_id,
+            'game_id': self.game_id,
+            'medal_type': self.medal_type,
+            'kind': self.kind,
+            'delta': self.delta,
+            'revokes_award_id': self.revokes_award_id,
+            'created_by': self.created_by,
+            'created_at': self.created_at.isoformat()
+        }
@@ -1,26 +1,82 @@
-from models.user import db
-from datetime import datetime
-import uuid
-
-class News(db.Model):
-    __tablename__ = 'news'
-    
-    news_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    title = db.Column(db.String(200), nullable=False)
-    content = db.Column(db.Text, nullable=False)
-    author = db.Column(db.String(100), nullable=False)
-    publication_date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
-    image_url = db.Column(db.String(500), nullable=True)
-    tags = db.Column(db.String(500), nullable=True)  # JSON string for tags array
-    
-    def to_dict(self):
-        return {
-            'news_id': self.news_id,
-            'title': self.title,
-            'content': self.content,
-            'author': self.author,
-            'publication_date': self.publication_date.isoformat(),
-            'image_url': self.image_url,
-            'tags': self.tags.split(',') if self.tags else []
-        }
-
+from models.user import db
+from datetime import datetime
+import math
+import re
+import uuid
+from services.serializers import isoformat, row_serializer, split_list
+
+EXCERPT_LENGTH = 200
+WORDS_PER_MINUTE = 200
+_TAGS = re.compile(r'<[^>]+>')
+
+class News(db.Model):
+    __tablename__ = 'news'
+    __table_args__ = (
+        db.Index('ix_news_publication_date', 'publication_date', 'news_id'),
+    )
+    
+    news_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    title = db.Column(db.String(200), nullable=False)
+    content = db.Column(db.Text, nullable=False)
+    author = db.Column(db.String(100), nullable=False)
+    publication_date = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    image_url = db.Column(db.String(500), nullable=True)
+    tags = db.Column(db.String(500), nullable=True)  # JSON string for tags array
+    # Calculados na escrita por refresh_summary(), nunca na leitura
+    excerpt = db.Column(db.String(EXCERPT_LENGTH + 1), nullable=True)
+    word_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    reading_time = db.Column(db.Integer, nullable=False, default=1, server_default='1')
+    
+    def refresh_summary(self):
+        """Recalcula resumo, contagem de palavras e tempo de leitura a partir do conteúdo"""
+        self.excerpt, self.word_count, self.reading_time = summarize(self.content)
+
+    def to_dict(self):
+        return {
+            'news_id': self.news_id,
+            'title': self.title,
+            'content': self.content,
+            'author': self.author,
+            'publication_date': self.publication_date.isoformat(),
+            'image_url': self.image_url,
+            'tags': self.tags.split(',') if self.tags else [],
+            'excerpt': self.excerpt,
+            'word_count': self.word_count,
+            'reading_time': self.reading_time
+        }
+
+    # Colunas de to_dict(), para a listagem completa sem hidratar objetos
+    FULL_COLUMNS = ('news_id', 'title', 'content', 'author', 'publication_date', 'image_url',
+                    'tags', 'excerpt', 'word_count', 'reading_time')
+
+    @classmethod
+    def full_columns(cls):
+        return [getattr(cls, name) for name in cls.FULL_COLUMNS]
+
+    # Colunas da projeção "summary" usada nas listagens (sem o conteúdo)
+    SUMMARY_COLUMNS = ('news_id', 'title', 'author', 'publication_date', 'image_url',
+                       'tags', 'excerpt', 'word_count', 'reading_time')
+
+    @classmethod
+    def summary_columns(cls):
+        return [getattr(cls, name) for name in cls.SUMMARY_COLUMNS]
+
+
+# Mesma saída de to_dict(), a partir de News.full_columns()
+news_row = row_serializer(News.FULL_COLUMNS, publication_date=isoformat, tags=split_list)
+
+# Projeção summary, a partir de News.summary_columns() (colunas extras no fim da linha são ignoradas)
+news_summary_row = row_serializer(News.SUMMARY_COLUMNS, publication_date=isoformat, tags=split_list)
+
+
+def summarize(content):
+    """Retorna (excerpt, word_count, reading_time) para o texto da notícia"""
+    text = ' '.join(_TAGS.sub(' ', content or '').split())
+    words = text.split(' ') if text else []
+    if len(text) <= EXCERPT_LENGTH:
+        excerpt = text
+    else:
+        cut = text.rfind(' ', 0, EXCERPT_LENGTH)
+        excerpt = text[:cut if cut > 0 else EXCERPT_LENGTH].rstrip(' .,;:') + '…'
+    return excerpt, len(words), max(1, math.ceil(len(words) / WORDS_PER_MINUTE))
+
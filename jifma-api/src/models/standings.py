@@ -0,0 +1,34 @@
+from models.user import db
+
+class TeamStanding(db.Model):
+    """Linha da classificação de uma equipe em uma modalidade, mantida de forma incremental"""
+    __tablename__ = 'standings'
+    __table_args__ = (
+        db.Index('ix_standings_sport_points', 'sport_id', 'points'),
+    )
+    
+    sport_id = db.Column(db.String(36), db.ForeignKey('sports.sport_id'), primary_key=True)
+    team_id = db.Column(db.String(36), db.ForeignKey('teams.team_id'), primary_key=True)
+    played = db.Column(db.Integer, nullable=False, default=0)
+    wins = db.Column(db.Integer, nullable=False, default=0)
+    draws = db.Column(db.Integer, nullable=False, default=0)
+    losses = db.Column(db.Integer, nullable=False, default=0)
+    points_for = db.Column(db.Integer, nullable=False, default=0)
+    points_against = db.Column(db.Integer, nullable=False, default=0)
+    points = db.Column(db.Integer, nullable=False, default=0)
+
+    STAT_FIELDS = ('played', 'wins', 'draws', 'losses', 'points_for', 'points_against', 'points')
+
+    def to_dict(self):
+        return {
+            'sport_id': self.sport_id,
+            'team_id': self.team_id,
+            'played': self.played,
+            'wins': self.wins,
+            'draws': self.draws,
+            'losses': self.losses,
+            'points_for': self.points_for,
+            'points_against': self.points_against,
+            'goal_difference': self.points_for - self.points_against,
+            'points': self.points
+        }
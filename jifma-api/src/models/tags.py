@@ -0,0 +1,36 @@
+from models.user import db
+import re
+import unicodedata
+import uuid
+
+# Associação notícia <-> tag. A chave primária cobre a busca por notícia;
+# o índice (tag_id, news_id) cobre o filtro /api/news?tag=
+news_tags = db.Table(
+    'news_tags',
+    db.Column('news_id', db.String(36), db.ForeignKey('news.news_id', ondelete='CASCADE'), primary_key=True),
+    db.Column('tag_id', db.String(36), db.ForeignKey('tags.tag_id', ondelete='CASCADE'), primary_key=True),
+    db.Index('ix_news_tags_tag', 'tag_id', 'news_id')
+)
+
+class Tag(db.Model):
+    __tablename__ = 'tags'
+    __table_args__ = (
+        db.Index('ix_tags_news_count', 'news_count'),
+    )
+    
+    tag_id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    name = db.Column(db.String(50), nullable=False)
+    slug = db.Column(db.String(60), nullable=False, unique=True)
+    news_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    def to_dict(self):
+        return {
+            'tag_id': self.tag_id,
+            'name': self.name,
+            'slug': self.slug,
+            'news_count': self.news_count
+        }
+
+def slugify(value):
+    value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode()
+    return re.sub(r'[^a-z0-9]+', '-', value.lower()).strip('-')
@@ -0,0 +1,27 @@
+from flask import Blueprint, request, jsonify, send_file
+from services import exports
+from services.auth import admin_required
+
+admin_export_bp = Blueprint('admin_export', __name__)
+
+@admin_export_bp.route('/admin/export/<dataset>', methods=['GET'])
+@admin_required()
+def export_dataset(dataset):
+    """
+    Baixa um conjunto de dados completo como planilha: games (jogos com
+    modalidade, equipes, placar e vencedor) ou medals (quadro de medalhas).
+    format=csv (padrão) ou xlsx, se o openpyxl estiver instalado. O arquivo
+    é reaproveitado enquanto os dados não mudarem.
+    """
+    try:
+        file_format = request.args.get('format', 'csv').lower()
+        path, mimetype, etag = exports.export(dataset, file_format)
+        response = send_file(path, mimetype=mimetype, as_attachment=True,
+                             download_name=f'jifma-{dataset}.{file_format}',
+                             etag=etag, conditional=True, max_age=0)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+    except exports.ExportError as e:
+        return jsonify({'error': str(e)}), e.status
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,62 @@
+from flask import Blueprint, request, jsonify
+from models.user import db
+from services import bulk_games, fixtures
+from services.auth import admin_required
+from services.cache import bump_version, game_scopes
+
+admin_fixtures_bp = Blueprint('admin_fixtures', __name__)
+
+def _plan_dict(plan):
+    return {
+        'format': plan['format'],
+        'bracket_id': plan['bracket_id'],
+        'rounds': plan['rounds'],
+        'games_created': len(plan['games']),
+        'games': [{**game, 'game_date': game['game_date'].isoformat()} for game in plan['games']],
+        'slots': [{**slot, 'game_date': slot['game_date'].isoformat() if slot['game_date'] else None}
+                  for slot in plan['slots']]
+    }
+
+@admin_fixtures_bp.route('/admin/fixtures', methods=['POST'])
+@admin_required()
+def generate_fixtures():
+    """
+    Gera a tabela de jogos de uma modalidade: pontos corridos (round_robin,
+    com legs=2 para ida e volta) ou mata-mata (knockout, na ordem de
+    cabeças de chave de team_ids). Campos: sport_id, team_ids, start_date,
+    slot_minutes, venues, format, legs e dry_run.
+    """
+    try:
+        data = request.get_json() or {}
+        if not data.get('start_date'):
+            return jsonify({'error': 'Data de início é obrigatória'}), 400
+        try:
+            start = bulk_games.parse_date(data['start_date'])
+        except ValueError:
+            return jsonify({'error': 'Formato de data inválido. Use ISO format.'}), 400
+
+        dry_run = bool(data.get('dry_run'))
+        plan = fixtures.generate(
+            sport_id=data.get('sport_id'),
+            team_ids=data.get('team_ids'),
+            start=start,
+            slot_minutes=data.get('slot_minutes', 60),
+            venues=data.get('venues'),
+            format=data.get('format', 'round_robin'),
+            legs=data.get('legs', 1),
+            dry_run=dry_run
+        )
+        if dry_run:
+            return jsonify(_plan_dict(plan)), 200
+
+        db.session.commit()
+        bump_version('games', *game_scopes(*plan['games']))
+
+        return jsonify(_plan_dict(plan)), 201
+
+    except fixtures.FixtureError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), e.status
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
@@ -1,175 +1,317 @@
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
-from models.user import db, User
-from models.games import Game
-from models.teams import Team
-from models.sports import Sport
-from datetime import datetime
-
-admin_games_bp = Blueprint('admin_games', __name__)
-
-def require_admin():
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
-    if not user or not user.is_admin:
-        return False
-    return True
-
-@admin_games_bp.route('/admin/games', methods=['POST'])
-@jwt_required()
-def create_game():
-    try:
-        if not require_admin():
-            return jsonify({'error': 'Acesso negado. Apenas administradores.'}), 403
-        
-        data = request.get_json()
-        sport_id = data.get('sport_id')
-        team_a_id = data.get('team_a_id')
-        team_b_id = data.get('team_b_id')
-        game_date = data.get('game_date')
-        location = data.get('location')
-        
-        if not all([sport_id, team_a_id, team_b_id, game_date, location]):
-            return jsonify({'error': 'Todos os campos são obrigatórios'}), 400
-        
-        # Verificar se modalidade e equipes existem
-        sport = Sport.query.get(sport_id)
-        team_a = Team.query.get(team_a_id)
-        team_b = Team.query.get(team_b_id)
-        
-        if not sport:
-            return jsonify({'error': 'Modalidade não encontrada'}), 404
-        if not team_a:
-            return jsonify({'error': 'Equipe A não encontrada'}), 404
-        if not team_b:
-            return jsonify({'error': 'Equipe B não encontrada'}), 404
-        
-        # Converter string de data para datetime
-        try:
-            game_datetime = datetime.fromisoformat(game_date.replace('Z', '+00:00'))
-        except:
-            return jsonify({'error': 'Formato de data inválido. Use ISO format.'}), 400
-        
-        game = Game(
-            sport_id=sport_id,
-            team_a_id=team_a_id,
-            team_b_id=team_b_id,
-            game_date=game_datetime,
-            location=location,
-            status='Agendado'
-        )
-        
-        db.session.add(game)
-        db.session.commit()
-        
-        return jsonify({
-            'message': 'Jogo criado com sucesso',
-            'game': game.to_dict()
-        }), 201
-        
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': str(e)}), 500
-
-@admin_games_bp.route('/admin/games/<game_id>', methods=['PUT'])
-@jwt_required()
-def update_game(game_id):
-    try:
-        if not require_admin():
-            return jsonify({'error': 'Acesso negado. Apenas administradores.'}), 403
-        
-        game = Game.query.get(game_id)
-        if not game:
-            return jsonify({'error': 'Jogo não encontrado'}), 404
-        
-        data = request.get_json()
-        
-        if 'sport_id' in data:
-            sport = Sport.query.get(data['sport_id'])
-            if not sport:
-                return jsonify({'error': 'Modalidade não encontrada'}), 404
-            game.sport_id = data['sport_id']
-        
-        if 'team_a_id' in data:
-            team_a = Team.query.get(data['team_a_id'])
-            if not team_a:
-                return jsonify({'error': 'Equipe A não encontrada'}), 404
-            game.team_a_id = data['team_a_id']
-        
-        if 'team_b_id' in data:
-            team_b = Team.query.get(data['team_b_id'])
-            if not team_b:
-                return jsonify({'error': 'Equipe B não encontrada'}), 404
-            game.team_b_id = data['team_b_id']
-        
-        if 'game_date' in data:
-            try:
-                game.game_date = datetime.fromisoformat(data['game_date'].replace('Z', '+00:00'))
-            except:
-                return jsonify({'error': 'Formato de data inválido'}), 400
-        
-        if 'location' in data:
-            game.location = data['location']
-        
-        if 'status' in data:
-            game.status = data['status']
-        
-        if 'score_a' in data:
-            game.score_a = str(data['score_a'])
-
-        if 'score_b' in data:
-            game.score_b = str(data['score_b'])
-        
-        # Determinar vencedor se ambos os placares estão definidos
-        if game.score_a is not None and game.score_b is not None:
-            if game.score_a > game.score_b:
-                game.winner_team_id = game.team_a_id
-            elif game.score_b > game.score_a:
-                game.winner_team_id = game.team_b_id
-            else:
-                game.winner_team_id = None  # Empate
-        
-        db.session.commit()
-        
-        return jsonify({
-            'message': 'Jogo atualizado com sucesso',
-            'game': game.to_dict()
-        }), 200
-        
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': str(e)}), 500
-
-@admin_games_bp.route('/admin/games/<game_id>', methods=['DELETE'])
-@jwt_required()
-def delete_game(game_id):
-    try:
-        if not require_admin():
-            return jsonify({'error': 'Acesso negado. Apenas administradores.'}), 403
-        
-        game = Game.query.get(game_id)
-        if not game:
-            return jsonify({'error': 'Jogo não encontrado'}), 404
-        
-        db.session.delete(game)
-        db.session.commit()
-        
-        return jsonify({'message': 'Jogo excluído com sucesso'}), 200
-        
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': str(e)}), 500
-
-@admin_games_bp.route('/admin/games', methods=['GET'])
-@jwt_required()
-def get_all_games_admin():
-    try:
-        if not require_admin():
-            return jsonify({'error': 'Acesso negado. Apenas administradores.'}), 403
-        
-        games = Game.query.order_by(Game.game_date.desc()).all()
-        return jsonify([game.to_dict() for game in games]), 200
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
+from flask import Blueprint, request, jsonify
+from models.user import db
+from models.games import Game, game_row, include_options, parse_include
+from models.teams import Team
+from models.sports import Sport
+from datetime import datetime
+from sqlalchemy.orm.exc import StaleDataError
+from services import bulk_games, conflicts, fixtures, live, medals, scores, standings
+from services.pagination import PaginationError, parse_date_arg
+from services.streaming import stream_format, streaming_response
+from services.auth import admin_required
+from services.cache import bump_version, game_scopes
+
+admin_games_bp = Blueprint('admin_games', __name__)
+
+@admin_games_bp.route('/admin/games', methods=['POST'])
+@admin_required()
+def create_game():
+    try:
+        data = request.get_json()
+        sport_id = data.get('sport_id')
+        team_a_id = data.get('team_a_id')
+        team_b_id = data.get('team_b_id')
+        game_date = data.get('game_date')
+        location = data.get('location')
+        
+        if not all([sport_id, team_a_id, team_b_id, game_date, location]):
+            return jsonify({'error': 'Todos os campos são obrigatórios'}), 400
+        
+        # Verificar se modalidade e equipes existem
+        sport = Sport.query.get(sport_id)
+        team_a = Team.query.get(team_a_id)
+        team_b = Team.query.get(team_b_id)
+        
+        if not sport:
+            return jsonify({'error': 'Modalidade não encontrada'}), 404
+        if not team_a:
+            return jsonify({'error': 'Equipe A não encontrada'}), 404
+        if not team_b:
+            return jsonify({'error': 'Equipe B não encontrada'}), 404
+        
+        # Converter string de data para datetime
+        try:
+            game_datetime = datetime.fromisoformat(game_date.replace('Z', '+00:00'))
+        except:
+            return jsonify({'error': 'Formato de data inválido. Use ISO format.'}), 400
+        
+        game = Game(
+            sport_id=sport_id,
+            team_a_id=team_a_id,
+            team_b_id=team_b_id,
+            game_date=game_datetime,
+            location=location,
+            status='Agendado'
+        )
+        
+        # Choque de equipe ou local com outro jogo (force ignora)
+        if not data.get('force'):
+            clashes = conflicts.check_game(game)
+            if clashes:
+                return jsonify({'error': 'Conflito de horário', 'conflicts': clashes}), 409
+        
+        db.session.add(game)
+        scopes = game_scopes(game)
+        db.session.commit()
+        bump_version('games', *scopes)
+        
+        return jsonify({
+            'message': 'Jogo criado com sucesso',
+            'game': game.to_dict()
+        }), 201
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@admin_games_bp.route('/admin/games/bulk', methods=['POST'])
+@admin_required()
+def bulk_create_games():
+    """
+    Importa vários jogos de uma vez, a partir de um array JSON (ou
+    {"games": [...]}) ou de um CSV (corpo text/csv ou arquivo "file").
+    As linhas válidas são inseridas numa única transação e as inválidas
+    (inclusive as com choque de horário, a menos que force=1) voltam com
+    seus erros. Com dry_run=1 nada é gravado.
+    """
+    try:
+        dry_run = request.args.get('dry_run', '').lower() in ('1', 'true')
+        force = request.args.get('force', '').lower() in ('1', 'true')
+        if request.mimetype == 'text/csv':
+            rows = bulk_games.parse_csv(request.get_data(as_text=True))
+        elif 'file' in request.files:
+            rows = bulk_games.parse_csv(request.files['file'].read().decode('utf-8-sig'))
+        else:
+            data = request.get_json(silent=True)
+            if isinstance(data, dict):
+                dry_run = dry_run or bool(data.get('dry_run'))
+                force = force or bool(data.get('force'))
+                data = data.get('games')
+            if not isinstance(data, list):
+                return jsonify({'error': 'Envie um array JSON de jogos ou um CSV'}), 400
+            rows = data
+
+        valid, errors = bulk_games.validate(rows, check_conflicts=not force)
+        result = {'dry_run': dry_run, 'total': len(rows), 'valid': len(valid), 'errors': errors}
+
+        if dry_run:
+            return jsonify(result), 200
+        if not valid:
+            return jsonify({**result, 'created': 0, 'game_ids': []}), 400
+
+        game_ids = bulk_games.insert_games(valid)
+        db.session.commit()
+        bump_version('games', *game_scopes(*valid))
+
+        return jsonify({**result, 'created': len(game_ids), 'game_ids': game_ids}), 201
+
+    except bulk_games.BulkImportError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@admin_games_bp.route('/admin/games/conflicts', methods=['GET'])
+@admin_required()
+def get_game_conflicts():
+    """Lista os choques de equipe e de local entre os jogos (filtros date_from e date_to)"""
+    try:
+        result = conflicts.all_conflicts(parse_date_arg('date_from'), parse_date_arg('date_to'))
+        return jsonify(result), 200
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@admin_games_bp.route('/admin/games/<game_id>', methods=['PUT'])
+@admin_required()
+def update_game(game_id):
+    try:
+        game = Game.query.get(game_id)
+        if not game:
+            return jsonify({'error': 'Jogo não encontrado'}), 404
+        
+        before = standings.snapshot(game)
+        live_before = live.game_state(game)
+        scopes = game_scopes(game)
+        data = request.get_json()
+
+        if 'version' in data and data['version'] != game.version:
+            return jsonify({'error': 'O jogo foi alterado por outra requisição. Recarregue e tente novamente.'}), 409
+        
+        if 'sport_id' in data:
+            sport = Sport.query.get(data['sport_id'])
+            if not sport:
+                return jsonify({'error': 'Modalidade não encontrada'}), 404
+            game.sport_id = data['sport_id']
+        
+        if 'team_a_id' in data:
+            team_a = Team.query.get(data['team_a_id'])
+            if not team_a:
+                return jsonify({'error': 'Equipe A não encontrada'}), 404
+            game.team_a_id = data['team_a_id']
+        
+        if 'team_b_id' in data:
+            team_b = Team.query.get(data['team_b_id'])
+            if not team_b:
+                return jsonify({'error': 'Equipe B não encontrada'}), 404
+            game.team_b_id = data['team_b_id']
+        
+        if 'game_date' in data:
+            try:
+                game.game_date = datetime.fromisoformat(data['game_date'].replace('Z', '+00:00'))
+            except:
+                return jsonify({'error': 'Formato de data inválido'}), 400
+        
+        if 'location' in data:
+            game.location = data['location']
+        
+        if 'status' in data:
+            game.status = data['status']
+        
+        try:
+            if 'score_a' in data:
+                game.score_a = scores.parse_score(data['score_a'])
+
+            if 'score_b' in data:
+                game.score_b = scores.parse_score(data['score_b'])
+        except scores.ScoreError as e:
+            return jsonify({'error': str(e)}), e.status
+        
+        # Determinar vencedor se ambos os placares estão definidos
+        game.winner_team_id = scores.winner_of(game.team_a_id, game.team_b_id,
+                                               game.score_a, game.score_b, game.winner_team_id)
+        
+        # Só reavalia choques se horário, local, equipes ou status mudaram
+        scheduling = ('game_date', 'location', 'team_a_id', 'team_b_id', 'status')
+        if not data.get('force') and any(field in data for field in scheduling):
+            clashes = conflicts.check_game(game)
+            if clashes:
+                db.session.rollback()
+                return jsonify({'error': 'Conflito de horário', 'conflicts': clashes}), 409
+        
+        standings.record_change(before, standings.snapshot(game))
+        live.publish_change(live_before, game)
+        next_game = None
+        if game.status == standings.FINISHED:
+            # Mata-mata: o vencedor avança para a próxima vaga do chaveamento
+            next_game = fixtures.advance(game, check_conflicts=not data.get('force'))
+        scopes += game_scopes(game, next_game)
+        db.session.commit()
+        bump_version('games', *scopes)
+        
+        return jsonify({
+            'message': 'Jogo atualizado com sucesso',
+            'game': game.to_dict()
+        }), 200
+        
+    except fixtures.FixtureError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e), **e.extra}), e.status
+    except StaleDataError:
+        db.session.rollback()
+        return jsonify({'error': 'O jogo foi alterado por outra requisição. Recarregue e tente novamente.'}), 409
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@admin_games_bp.route('/admin/games/<game_id>/score', methods=['PATCH'])
+@admin_required()
+def update_game_score(game_id):
+    """
+    Atualização rápida de placar para jogos em andamento: um único UPDATE
+    condicionado à versão enviada. Responde só com o necessário para o
+    próximo envio (placares, vencedor e nova versão).
+    """
+    try:
+        data = request.get_json() or {}
+        changes = {field: scores.parse_score(data[field]) for field in scores.SCORE_FIELDS if field in data}
+        if not changes:
+            return jsonify({'error': 'Informe score_a e/ou score_b'}), 400
+        if not isinstance(data.get('version'), int):
+            return jsonify({'error': 'A versão do jogo é obrigatória'}), 400
+
+        row = scores.update_score(game_id, data['version'], changes)
+        live.publish(row, list(changes))
+        db.session.commit()
+        bump_version('games', *game_scopes(row))
+
+        return jsonify({
+            'game_id': row.game_id,
+            'score_a': row.score_a,
+            'score_b': row.score_b,
+            'winner_team_id': row.winner_team_id,
+            'version': row.version
+        }), 200
+
+    except scores.ScoreError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e), **e.extra}), e.status
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@admin_games_bp.route('/admin/games/<game_id>', methods=['DELETE'])
+@admin_required()
+def delete_game(game_id):
+    try:
+        game = Game.query.get(game_id)
+        if not game:
+            return jsonify({'error': 'Jogo não encontrado'}), 404
+        
+        standings.record_change(standings.snapshot(game), None)
+        fixtures.detach_game(game_id)
+        medals.detach_game(game_id)
+        scopes = game_scopes(game)
+        db.session.delete(game)
+        db.session.commit()
+        bump_version('games', *scopes)
+        
+        return jsonify({'message': 'Jogo excluído com sucesso'}), 200
+        
+    except StaleDataError:
+        db.session.rollback()
+        return jsonify({'error': 'O jogo foi alterado por outra requisição. Recarregue e tente novamente.'}), 409
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@admin_games_bp.route('/admin/games', methods=['GET'])
+@admin_required()
+def get_all_games_admin():
+    """
+    Lista todos os jogos. Com stream=1 (array JSON) ou format=ndjson a
+    resposta é enviada em lotes, sem montar a lista inteira em memória; o
+    stream não aceita include.
+    """
+    try:
+        include = parse_include(request.args.get('include'))
+        mode = stream_format()
+        if mode and include:
+            return jsonify({'error': 'include não é suportado com stream=1 ou format=ndjson'}), 400
+        if mode:
+            query = db.session.query(*Game.list_columns()).order_by(Game.game_date.desc(), Game.game_id.desc())
+            return streaming_response(query, game_row, mode)
+        if not include:
+            rows = db.session.query(*Game.list_columns()).order_by(Game.game_date.desc()).all()
+            return jsonify([game_row(row) for row in rows]), 200
+
+        games = Game.query.options(*include_options(include)).order_by(Game.game_date.desc()).all()
+        return jsonify([game.to_dict(include) for game in games]), 200
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
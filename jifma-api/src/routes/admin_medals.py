@@ -1,130 +1,220 @@
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity # Import JWT functions
-from models.user import db, User # Import User model to use require_admin
-from models.medals import MedalStanding
-from models.teams import Team
-
-medals_bp = Blueprint('admin_medals', __name__)
-
-def require_admin():
-    """
-    Helper function to check if the current authenticated user is an admin.
-    (Duplicated for clarity in this specific blueprint, but in a larger app,
-    you might centralize this or import it from a common utility file.)
-    """
-    current_user_id = get_jwt_identity()
-    user = User.query.get(current_user_id)
-    if not user or not user.is_admin:
-        return False
-    return True
-
-@medals_bp.route('/medals', methods=['GET'])
-def get_medal_standings():
-    """Retorna o quadro de medalhas ordenado por ouro, prata e bronze"""
-    try:
-        standings = db.session.query(MedalStanding, Team.name.label('team_name')) \
-            .join(Team, MedalStanding.team_id == Team.team_id) \
-            .order_by(MedalStanding.gold_medals.desc(),
-                      MedalStanding.silver_medals.desc(),
-                      MedalStanding.bronze_medals.desc()).all()
-
-        result = []
-        for standing, team_name in standings:
-            standing_dict = standing.to_dict()
-            standing_dict['team_name'] = team_name
-            result.append(standing_dict)
-
-        return jsonify(result), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@medals_bp.route('/admin/medals/<team_id>', methods=['GET'])
-def get_team_medals(team_id):
-    """Retorna as medalhas de uma equipe específica"""
-    try:
-        standing = MedalStanding.query.filter_by(team_id=team_id).first()
-        if not standing:
-            return jsonify({'error': 'Quadro de medalhas não encontrado para esta equipe'}), 404
-        return jsonify(standing.to_dict()), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@medals_bp.route('/admin/medals', methods=['POST'])
-@jwt_required()
-def create_medal_standing():
-    """Cria um novo registro no quadro de medalhas"""
-    try:
-        if not require_admin():
-            return jsonify({'error': 'Acesso negado. Apenas administradores.'}), 403
-
-        data = request.get_json()
-
-        if not data or not data.get('team_id'):
-            return jsonify({'error': 'ID da equipe é obrigatório'}), 400
-
-        existing_standing = MedalStanding.query.filter_by(team_id=data['team_id']).first()
-        if existing_standing:
-            return jsonify({'error': 'Quadro de medalhas já existe para esta equipe'}), 400
-
-        standing = MedalStanding(
-            team_id=data['team_id'],
-            gold_medals=data.get('gold_medals', 0),
-            silver_medals=data.get('silver_medals', 0),
-            bronze_medals=data.get('bronze_medals', 0)
-        )
-
-        db.session.add(standing)
-        db.session.commit()
-
-        return jsonify(standing.to_dict()), 201
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': str(e)}), 500
-
-@medals_bp.route('/admin/medals/<team_id>', methods=['PUT'])
-@jwt_required()
-def update_medal_standing(team_id):
-    """Atualiza o quadro de medalhas de uma equipe"""
-    try:
-        if not require_admin():
-            return jsonify({'error': 'Acesso negado. Apenas administradores.'}), 403
-
-        standing = MedalStanding.query.filter_by(team_id=team_id).first()
-        if not standing:
-            return jsonify({'error': 'Quadro de medalhas não encontrado para esta equipe'}), 404
-
-        data = request.get_json()
-
-        if 'gold_medals' in data and data['gold_medals'] is not None:
-            standing.gold_medals = data['gold_medals']
-        if 'silver_medals' in data and data['silver_medals'] is not None:
-            standing.silver_medals = data['silver_medals']
-        if 'bronze_medals' in data and data['bronze_medals'] is not None:
-            standing.bronze_medals = data['bronze_medals']
-
-        db.session.commit()
-
-        return jsonify(standing.to_dict()), 200
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({'error': str(e)}), 500
-
-@medals_bp.route('/admin/medals/<team_id>', methods=['DELETE'])
-@jwt_required()
-def delete_medal_standing(team_id):
-    """Deleta o quadro de medalhas de uma equipe"""
-    try:
-        if not require_admin():
-            return jsonify({'error': 'Acesso negado. Apenas administradores.'}), 403
-
-        standing = MedalStanding.query.filter_by(team_id=team_id).first()
-        if not standing:
-            return jsonify({'error': 'Quadro de medalhas não encontrado para esta equipe'}), 404
-
-        db.session.delete(standing)
-        db.session.commit()
-
-        return jsonify({'message': 'Quadro de medalhas deletado com sucesso'}), 200
-    except Exception as e:
-        db.session.rollback()
+from flask import Blueprint, request, jsonify
+from models.user import db
+from flask_jwt_extended import get_jwt_identity
+from models.medals import MEDAL_TYPES, MedalAward, MedalStanding
+from models.sports import Sport
+from models.teams import Team
+from services.auth import admin_required
+from services import medals
+from services.cache import cached_response, bump_version
+
+medals_bp = Blueprint('admin_medals', __name__)
+
+@medals_bp.route('/medals', methods=['GET'])
+@cached_response('medals', 'teams')
+def get_medal_standings():
+    """
+    Retorna o quadro de medalhas ordenado por ouro, prata e bronze, com a
+    posição de cada equipe (empates dividem a mesma posição)
+    """
+    try:
+        standings = db.session.query(MedalStanding, Team.name.label('team_name')) \
+            .join(Team, MedalStanding.team_id == Team.team_id) \
+            .order_by(MedalStanding.gold_medals.desc(),
+                      MedalStanding.silver_medals.desc(),
+                      MedalStanding.bronze_medals.desc(),
+                      Team.name.asc()).all()
+
+        result = []
+        for standing, team_name in standings:
+            standing_dict = standing.to_dict()
+            standing_dict['team_name'] = team_name
+            result.append(standing_dict)
+
+        return jsonify(medals.with_ranks(result)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@medals_bp.route('/medals/sport/<sport_id>', methods=['GET'])
+@cached_response('medals', 'teams')
+def get_sport_medal_table(sport_id):
+    """Retorna o quadro de medalhas de uma modalidade"""
+    try:
+        if not Sport.query.get(sport_id):
+            return jsonify({'error': 'Modalidade não encontrada'}), 404
+        return jsonify(medals.sport_table(sport_id)), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@medals_bp.route('/admin/medals/awards', methods=['GET'])
+@admin_required()
+def get_medal_awards():
+    """Lista os lançamentos do livro-razão, opcionalmente por modalidade ou equipe"""
+    try:
+        query = MedalAward.query
+        if request.args.get('sport_id'):
+            query = query.filter(MedalAward.sport_id == request.args['sport_id'])
+        if request.args.get('team_id'):
+            query = query.filter(MedalAward.team_id == request.args['team_id'])
+        awards = query.order_by(MedalAward.created_at.desc()).all()
+        return jsonify([award.to_dict() for award in awards]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@medals_bp.route('/admin/medals/awards', methods=['POST'])
+@admin_required()
+def create_medal_award():
+    """Concede uma medalha e atualiza o quadro da equipe na mesma transação"""
+    try:
+        data = request.get_json() or {}
+        sport_id = data.get('sport_id')
+        team_id = data.get('team_id')
+
+        if not sport_id or not team_id or not data.get('medal_type'):
+            return jsonify({'error': 'Modalidade, equipe e tipo de medalha são obrigatórios'}), 400
+        if not Sport.query.get(sport_id):
+            return jsonify({'error': 'Modalidade não encontrada'}), 404
+        if not Team.query.get(team_id):
+            return jsonify({'error': 'Equipe não encontrada'}), 404
+
+        award = medals.award(sport_id, team_id, data['medal_type'],
+                             game_id=data.get('game_id'), user_id=get_jwt_identity())
+        db.session.commit()
+        bump_version('medals')
+
+        return jsonify(award.to_dict()), 201
+    except medals.MedalError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), e.status
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@medals_bp.route('/admin/medals/awards/<award_id>', methods=['DELETE'])
+@admin_required()
+def revoke_medal_award(award_id):
+    """Revoga uma medalha com um lançamento de estorno"""
+    try:
+        revocation = medals.revoke(award_id, user_id=get_jwt_identity())
+        db.session.commit()
+        bump_version('medals')
+
+        return jsonify(revocation.to_dict()), 201
+    except medals.MedalError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), e.status
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@medals_bp.route('/admin/medals/<team_id>', methods=['GET'])
+@cached_response('medals')
+def get_team_medals(team_id):
+    """Retorna as medalhas de uma equipe específica"""
+    try:
+        standing = MedalStanding.query.filter_by(team_id=team_id).first()
+        if not standing:
+            return jsonify({'error': 'Quadro de medalhas não encontrado para esta equipe'}), 404
+        return jsonify(standing.to_dict()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def _requested_totals(data):
+    """
+    {medal_type: total} a partir dos campos gold_medals/silver_medals/bronze_medals
+    enviados. O painel manda o valor do input como texto: "3" vira 3 e "" conta
+    como campo não enviado.
+    """
+    totals = {}
+    for medal_type, column in medals.MEDAL_COLUMNS.items():
+        value = data.get(column.key)
+        if isinstance(value, str):
+            if not value.strip():
+                continue
+            try:
+                value = int(value.strip())
+            except ValueError:
+                raise medals.MedalError('Quantidade de medalhas inválida')
+        if value is not None:
+            totals[medal_type] = value
+    return totals
+
+@medals_bp.route('/admin/medals', methods=['POST'])
+@admin_required()
+def create_medal_standing():
+    """
+    Cria um novo registro no quadro de medalhas. Os totais informados entram
+    no livro-razão como ajustes manuais.
+    """
+    try:
+        data = request.get_json()
+
+        if not data or not data.get('team_id'):
+            return jsonify({'error': 'ID da equipe é obrigatório'}), 400
+        if not Team.query.get(data['team_id']):
+            return jsonify({'error': 'Equipe não encontrada'}), 404
+
+        existing_standing = MedalStanding.query.filter_by(team_id=data['team_id']).first()
+        if existing_standing:
+            return jsonify({'error': 'Quadro de medalhas já existe para esta equipe'}), 400
+
+        standing = MedalStanding(team_id=data['team_id'], gold_medals=0, silver_medals=0, bronze_medals=0)
+        db.session.add(standing)
+        medals.set_totals(data['team_id'], _requested_totals(data), user_id=get_jwt_identity())
+        db.session.commit()
+        bump_version('medals')
+
+        return jsonify(standing.to_dict()), 201
+    except medals.MedalError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), e.status
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@medals_bp.route('/admin/medals/<team_id>', methods=['PUT'])
+@admin_required()
+def update_medal_standing(team_id):
+    """
+    Corrige o quadro de medalhas de uma equipe. A diferença para o total atual
+    é gravada no livro-razão como ajuste manual.
+    """
+    try:
+        standing = MedalStanding.query.filter_by(team_id=team_id).first()
+        if not standing:
+            return jsonify({'error': 'Quadro de medalhas não encontrado para esta equipe'}), 404
+
+        data = request.get_json() or {}
+        medals.set_totals(team_id, _requested_totals(data), user_id=get_jwt_identity())
+        db.session.commit()
+        bump_version('medals')
+
+        return jsonify(standing.to_dict()), 200
+    except medals.MedalError as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), e.status
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@medals_bp.route('/admin/medals/<team_id>', methods=['DELETE'])
+@admin_required()
+def delete_medal_standing(team_id):
+    """
+    Deleta o quadro de medalhas de uma equipe, zerando antes o livro-razão com
+    ajustes manuais para que um recálculo não traga os totais de volta
+    """
+    try:
+        standing = MedalStanding.query.filter_by(team_id=team_id).first()
+        if not standing:
+            return jsonify({'error': 'Quadro de medalhas não encontrado para esta equipe'}), 404
+
+        medals.set_totals(team_id, dict.fromkeys(MEDAL_TYPES, 0), user_id=get_jwt_identity())
+        db.session.delete(standing)
+        db.session.commit()
+        bump_version('medals')
+
+        return jsonify({'message': 'Quadro de medalhas deletado com sucesso'}), 200
+    except Exception as e:
+        db.session.rollback()
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
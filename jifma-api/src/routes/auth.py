@@ -1,98 +1,99 @@
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
-from models.user import db, User
-
-auth_bp = Blueprint('auth', __name__)
-
-@auth_bp.route('/login', methods=['POST'])
-def login():
-    try:
-        data = request.get_json()
-        username = data.get('username')
-        password = data.get('password')
-        
-        if not username or not password:
-            return jsonify({'error': 'Username e password são obrigatórios'}), 400
-        
-        user = User.query.filter_by(username=username).first()
-        
-        if user and user.check_password(password):
-            access_token = create_access_token(identity=user.user_id)
-            return jsonify({
-                'access_token': access_token,
-                'user': user.to_dict()
-            }), 200
-        else:
-            return jsonify({'error': 'Credenciais inválidas'}), 401
-            
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-# @auth_bp.route('/register', methods=['POST'])
-# def register():
-#     try:
-#         data = request.get_json()
-#         username = data.get('username')
-#         email = data.get('email')
-#         password = data.get('password')
-#         is_admin = data.get('is_admin', False)
-#
-#         if not username or not email or not password:
-#             return jsonify({'error': 'Username, email e password são obrigatórios'}), 400
-#
-#         # Verificar se usuário já existe
-#         if User.query.filter_by(username=username).first():
-#             return jsonify({'error': 'Username já existe'}), 400
-#
-#         if User.query.filter_by(email=email).first():
-#             return jsonify({'error': 'Email já existe'}), 400
-#
-#         # Criar novo usuário
-#         user = User(username=username, email=email, is_admin=is_admin)
-#         user.set_password(password)
-#
-#         db.session.add(user)
-#         db.session.commit()
-#
-#         return jsonify({
-#             'message': 'Usuário criado com sucesso',
-#             'user': user.to_dict()
-#         }), 201
-#
-#     except Exception as e:
-#         db.session.rollback()
-#         return jsonify({'error': str(e)}), 500
-
-@auth_bp.route('/profile', methods=['GET'])
-@jwt_required()
-def get_profile():
-    try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        
-        if not user:
-            return jsonify({'error': 'Usuário não encontrado'}), 404
-        
-        return jsonify({'user': user.to_dict()}), 200
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@auth_bp.route('/verify-admin', methods=['GET'])
-@jwt_required()
-def verify_admin():
-    try:
-        current_user_id = get_jwt_identity()
-        user = User.query.get(current_user_id)
-        
-        if not user:
-            return jsonify({'error': 'Usuário não encontrado'}), 404
-        
-        if not user.is_admin:
-            return jsonify({'error': 'Acesso negado. Apenas administradores.'}), 403
-        
-        return jsonify({'message': 'Acesso autorizado', 'user': user.to_dict()}), 200
-        
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from models.user import db, User
+from services.auth import admin_claims
+
+auth_bp = Blueprint('auth', __name__)
+
+@auth_bp.route('/login', methods=['POST'])
+def login():
+    try:
+        data = request.get_json()
+        username = data.get('username')
+        password = data.get('password')
+        
+        if not username or not password:
+            return jsonify({'error': 'Username e password são obrigatórios'}), 400
+        
+        user = User.query.filter_by(username=username).first()
+        
+        if user and user.check_password(password):
+            access_token = create_access_token(identity=user.user_id, additional_claims=admin_claims(user))
+            return jsonify({
+                'access_token': access_token,
+                'user': user.to_dict()
+            }), 200
+        else:
+            return jsonify({'error': 'Credenciais inválidas'}), 401
+            
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# @auth_bp.route('/register', methods=['POST'])
+# def register():
+#     try:
+#         data = request.get_json()
+#         username = data.get('username')
+#         email = data.get('email')
+#         password = data.get('password')
+#         is_admin = data.get('is_admin', False)
+#
+#         if not username or not email or not password:
+#             return jsonify({'error': 'Username, email e password são obrigatórios'}), 400
+#
+#         # Verificar se usuário já existe
+#         if User.query.filter_by(username=username).first():
+#             return jsonify({'error': 'Username já existe'}), 400
+#
+#         if User.query.filter_by(email=email).first():
+#             return jsonify({'error': 'Email já existe'}), 400
+#
+#         # Criar novo usuário
+#         user = User(username=username, email=email, is_admin=is_admin)
+#         user.set_password(password)
+#
+#         db.session.add(user)
+#         db.session.commit()
+#
+#         return jsonify({
+#             'message': 'Usuário criado com sucesso',
+#             'user': user.to_dict()
+#         }), 201
+#
+#     except Exception as e:
+#         db.session.rollback()
+#         return jsonify({'error': str(e)}), 500
+
+@auth_bp.route('/profile', methods=['GET'])
+@jwt_required()
+def get_profile():
+    try:
+        current_user_id = get_jwt_identity()
+        user = User.query.get(current_user_id)
+        
+        if not user:
+            return jsonify({'error': 'Usuário não encontrado'}), 404
+        
+        return jsonify({'user': user.to_dict()}), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@auth_bp.route('/verify-admin', methods=['GET'])
+@jwt_required()
+def verify_admin():
+    try:
+        current_user_id = get_jwt_identity()
+        user = User.query.get(current_user_id)
+        
+        if not user:
+            return jsonify({'error': 'Usuário não encontrado'}), 404
+        
+        if not user.is_admin:
+            return jsonify({'error': 'Acesso negado. Apenas administradores.'}), 403
+        
+        return jsonify({'message': 'Acesso autorizado', 'user': user.to_dict()}), 200
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
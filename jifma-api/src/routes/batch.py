@@ -0,0 +1,88 @@
+import time
+from flask import Blueprint, current_app, request, jsonify
+from werkzeug.test import EnvironBuilder
+
+batch_bp = Blueprint('batch', __name__)
+
+FORWARDED_HEADERS = ('Authorization', 'Accept-Language')
+BLOCKED_PREFIXES = ('/api/batch', '/api/games/live')
+# Corpos sem fim definido (ou feitos para consumo incremental); arrays JSON
+# em stream são finitos e lidos inteiros como qualquer outra resposta
+STREAM_MIMETYPES = ('text/event-stream', 'application/x-ndjson')
+
+def _sub_request(item, position):
+    """Normaliza um item do lote: "/api/teams" ou {"id": ..., "path": ...}"""
+    if isinstance(item, str):
+        item = {'path': item}
+    if not isinstance(item, dict) or not isinstance(item.get('path'), str):
+        raise ValueError(f'Requisição {position} inválida: informe path')
+    method = str(item.get('method', 'GET')).upper()
+    if method != 'GET':
+        raise ValueError(f'Requisição {position}: apenas GET é permitido no lote')
+    path = item['path']
+    if not path.startswith('/api/') or path.startswith(BLOCKED_PREFIXES):
+        raise ValueError(f'Requisição {position}: caminho não permitido ({path})')
+    return {'id': item.get('id', position), 'path': path}
+
+def _dispatch(app, path, headers):
+    """Executa a rota pelo mesmo pipeline de uma requisição normal, sem sair do processo"""
+    builder = EnvironBuilder(path=path, base_url=request.host_url, method='GET', headers=headers)
+    try:
+        with app.request_context(builder.get_environ()):
+            return app.full_dispatch_request()
+    finally:
+        builder.close()
+
+@batch_bp.route('/batch', methods=['POST'])
+def run_batch():
+    """
+    Executa várias leituras GET numa única ida e volta. Corpo:
+    {"requests": ["/api/teams", {"id": "medalhas", "path": "/api/admin/medals/<id>"}]}.
+    O cabeçalho Authorization é repassado a todas as sub-requisições; cada
+    resultado traz id, status, body, etag e duration_ms.
+    """
+    try:
+        data = request.get_json(silent=True)
+        items = data.get('requests') if isinstance(data, dict) else data
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'Informe a lista de requisições'}), 400
+
+        max_requests = current_app.config.get('BATCH_MAX_REQUESTS', 20)
+        if len(items) > max_requests:
+            return jsonify({'error': f'No máximo {max_requests} requisições por lote'}), 413
+
+        try:
+            sub_requests = [_sub_request(item, position) for position, item in enumerate(items)]
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        app = current_app._get_current_object()
+        headers = {name: request.headers[name] for name in FORWARDED_HEADERS if name in request.headers}
+        started = time.perf_counter()
+        results = []
+        for sub_request in sub_requests:
+            sub_started = time.perf_counter()
+            response = _dispatch(app, sub_request['path'], headers)
+            # is_streamed também vale para respostas de erro (404, 405...),
+            # cujo corpo é um iterável de um item: só o mimetype identifica um stream
+            if response.mimetype in STREAM_MIMETYPES:
+                body, status = {'error': 'Resposta em stream não suportada no lote'}, 400
+            else:
+                body = response.get_json(silent=True) if response.is_json else response.get_data(as_text=True)
+                status = response.status_code
+            results.append({
+                'id': sub_request['id'],
+                'path': sub_request['path'],
+                'status': status,
+                'etag': response.get_etag()[0],
+                'body': body,
+                'duration_ms': round((time.perf_counter() - sub_started) * 1000, 3)
+            })
+            response.close()
+
+        return jsonify({
+            'results': results,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 3)
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,39 @@
+from flask import Blueprint, Response, jsonify
+from models.sports import Sport
+from models.teams import Team
+from services import calendar
+from services.cache import cached_response
+
+calendar_bp = Blueprint('calendar', __name__)
+
+def _ics(body, filename):
+    return Response(body, mimetype='text/calendar', headers={
+        'Content-Disposition': f'inline; filename={filename}.ics'
+    })
+
+@calendar_bp.route('/calendar/team/<team_id>.ics', methods=['GET'])
+@cached_response('teams', 'sports', 'games:team:{team_id}')
+def get_team_calendar(team_id):
+    """
+    Agenda iCalendar dos jogos de uma equipe, para assinar no celular. Só é
+    regerada quando um jogo da equipe (ou o nome de equipe/modalidade) muda.
+    """
+    try:
+        team = Team.query.get(team_id)
+        if not team:
+            return jsonify({'error': 'Equipe não encontrada'}), 404
+        return _ics(calendar.team_feed(team), f'jifma-equipe-{team_id}')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@calendar_bp.route('/calendar/sport/<sport_id>.ics', methods=['GET'])
+@cached_response('teams', 'sports', 'games:sport:{sport_id}')
+def get_sport_calendar(sport_id):
+    """Agenda iCalendar dos jogos de uma modalidade"""
+    try:
+        sport = Sport.query.get(sport_id)
+        if not sport:
+            return jsonify({'error': 'Modalidade não encontrada'}), 404
+        return _ics(calendar.sport_feed(sport), f'jifma-modalidade-{sport_id}')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
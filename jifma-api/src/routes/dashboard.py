@@ -0,0 +1,79 @@
+from datetime import datetime
+from flask import Blueprint, request, jsonify
+from sqlalchemy.orm import aliased
+from models.user import db
+from models.games import Game
+from models.medals import MedalStanding
+from models.news import News, news_summary_row
+from models.sports import Sport
+from models.teams import Team
+from services import medals
+from services.cache import cached_response
+
+dashboard_bp = Blueprint('dashboard', __name__)
+
+LIVE_STATUS = 'Em Andamento'
+SCHEDULED_STATUS = 'Agendado'
+MAX_ITEMS = 50
+
+def _limit(name, default):
+    try:
+        return max(1, min(int(request.args.get(name, default)), MAX_ITEMS))
+    except ValueError:
+        return default
+
+def _games(*criteria, limit=None):
+    TeamA = aliased(Team, name='team_a')
+    TeamB = aliased(Team, name='team_b')
+    query = db.session.query(
+        Game.game_id, Game.sport_id, Game.team_a_id, Game.team_b_id, Game.score_a, Game.score_b,
+        Game.game_date, Game.location, Game.status, Game.winner_team_id,
+        TeamA.name.label('team_a_name'), TeamB.name.label('team_b_name'), Sport.name.label('sport_name')
+    ).join(TeamA, Game.team_a_id == TeamA.team_id) \
+        .join(TeamB, Game.team_b_id == TeamB.team_id) \
+        .join(Sport, Game.sport_id == Sport.sport_id) \
+        .filter(*criteria) \
+        .order_by(Game.game_date.asc(), Game.game_id.asc())
+    if limit:
+        query = query.limit(limit)
+    return [{**row._asdict(), 'game_date': row.game_date.isoformat()} for row in query]
+
+@dashboard_bp.route('/dashboard', methods=['GET'])
+@cached_response('news', 'games', 'teams', 'sports', 'medals', ttl=60)
+def get_dashboard():
+    """
+    Dados da página inicial numa única resposta: últimas notícias (resumo),
+    jogos em andamento, próximos jogos, topo do quadro de medalhas e
+    modalidades. Limites opcionais: news_limit, games_limit e medals_limit.
+    """
+    try:
+        news = db.session.query(*News.summary_columns()) \
+            .order_by(News.publication_date.desc(), News.news_id.desc()) \
+            .limit(_limit('news_limit', 5)).all()
+
+        standings = db.session.query(
+            MedalStanding.team_id, Team.name.label('team_name'),
+            MedalStanding.gold_medals, MedalStanding.silver_medals, MedalStanding.bronze_medals
+        ).join(Team, MedalStanding.team_id == Team.team_id) \
+            .order_by(MedalStanding.gold_medals.desc(),
+                      MedalStanding.silver_medals.desc(),
+                      MedalStanding.bronze_medals.desc(),
+                      Team.name.asc()) \
+            .limit(_limit('medals_limit', 10)).all()
+        medal_table = medals.with_ranks([{
+            **row._asdict(),
+            'total_medals': row.gold_medals + row.silver_medals + row.bronze_medals
+        } for row in standings])
+
+        sports = db.session.query(Sport.sport_id, Sport.name, Sport.type).order_by(Sport.name.asc()).all()
+
+        return jsonify({
+            'news': [news_summary_row(row) for row in news],
+            'live_games': _games(Game.status == LIVE_STATUS),
+            'upcoming_games': _games(Game.status == SCHEDULED_STATUS, Game.game_date >= datetime.now(),
+                                     limit=_limit('games_limit', 10)),
+            'medals': medal_table,
+            'sports': [row._asdict() for row in sports]
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -1,64 +1,181 @@
-from flask import Blueprint, request, jsonify
-from models.user import db
-from models.games import Game
-from models.teams import Team
-from models.sports import Sport
-from datetime import datetime
-from sqlalchemy.orm import aliased
-
-games_bp = Blueprint('games', __name__)
-
-@games_bp.route('/games', methods=['GET'])
-def get_all_games():
-    """Retorna todos os jogos com informações das equipes e modalidades"""
-    try:
-        TeamA = aliased(Team, name='team_a')
-        TeamB = aliased(Team, name='team_b')
-
-    # Build the query using the aliases
-        games = db.session.query(
-            Game,
-            TeamA.name.label('team_a_name'),
-            TeamB.name.label('team_b_name'),
-            Sport.name.label('sport_name')
-        ).join(
-            TeamA, Game.team_a_id == TeamA.team_id  # Join with the first alias
-        ).join(
-            TeamB, Game.team_b_id == TeamB.team_id  # Join with the second alias
-        ).join(
-            Sport, Game.sport_id == Sport.sport_id
-        ).order_by(
-            Game.game_date.asc()
-        ).all()
-        
-        result = []
-        for game, team_a_name, team_b_name, sport_name in games:
-            game_dict = game.to_dict()
-            game_dict['team_a_name'] = team_a_name
-            game_dict['team_b_name'] = team_b_name
-            game_dict['sport_name'] = sport_name
-            result.append(game_dict)
-        
-        return jsonify(result), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@games_bp.route('/games/<game_id>', methods=['GET'])
-def get_game_by_id(game_id):
-    """Retorna um jogo específico pelo ID"""
-    try:
-        game = Game.query.get(game_id)
-        if not game:
-            return jsonify({'error': 'Jogo não encontrado'}), 404
-        return jsonify(game.to_dict()), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@games_bp.route('/games/sport/<sport_id>', methods=['GET'])
-def get_games_by_sport(sport_id):
-    """Retorna todos os jogos de uma modalidade específica"""
-    try:
-        games = Game.query.filter_by(sport_id=sport_id).order_by(Game.game_date.asc()).all()
-        return jsonify([game.to_dict() for game in games]), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
\ No newline at end of file
+from flask import Blueprint, Response, current_app, request, jsonify
+from models.user import db
+from models.games import Game, game_list_row, game_row, include_options, parse_include
+from models.teams import Team
+from models.sports import Sport
+from models.fixtures import BracketSlot
+from datetime import datetime
+from sqlalchemy import or_
+from sqlalchemy.orm import aliased
+from services import live
+from services.cache import cached_response
+from services.pagination import (
+    PaginationError, encode_cursor, keyset_page, parse_date_arg, parse_page_args, wants_page
+)
+
+games_bp = Blueprint('games', __name__)
+
+@games_bp.route('/games', methods=['GET'])
+@cached_response('games', 'teams', 'sports')
+def get_all_games():
+    """
+    Retorna os jogos com informações das equipes e modalidades.
+
+    Filtros opcionais: sport_id, team_id (qualquer lado), status, date_from e
+    date_to. Com limit ou cursor a resposta é paginada por chave
+    (game_date, game_id) e inclui next_cursor. include=teams,sport embute
+    os objetos das equipes (team_a, team_b, winner) e da modalidade.
+    """
+    try:
+        include = parse_include(request.args.get('include'))
+        TeamA = aliased(Team, name='team_a')
+        TeamB = aliased(Team, name='team_b')
+
+        # Sem include, a listagem lê só tuplas de colunas (sem objetos do ORM)
+        names = (TeamA.name.label('team_a_name'), TeamB.name.label('team_b_name'), Sport.name.label('sport_name'))
+        if include:
+            query = db.session.query(Game, *names).options(*include_options(include))
+        else:
+            query = db.session.query(*Game.list_columns(), *names)
+
+    # Build the query using the aliases
+        query = query.join(
+            TeamA, Game.team_a_id == TeamA.team_id  # Join with the first alias
+        ).join(
+            TeamB, Game.team_b_id == TeamB.team_id  # Join with the second alias
+        ).join(
+            Sport, Game.sport_id == Sport.sport_id
+        )
+
+        sport_id = request.args.get('sport_id')
+        if sport_id:
+            query = query.filter(Game.sport_id == sport_id)
+        team_id = request.args.get('team_id')
+        if team_id:
+            query = query.filter(or_(Game.team_a_id == team_id, Game.team_b_id == team_id))
+        status = request.args.get('status')
+        if status:
+            query = query.filter(Game.status == status)
+        date_from = parse_date_arg('date_from')
+        if date_from:
+            query = query.filter(Game.game_date >= date_from)
+        date_to = parse_date_arg('date_to')
+        if date_to:
+            query = query.filter(Game.game_date <= date_to)
+
+        if wants_page():
+            limit, after = parse_page_args()
+            games, has_more = keyset_page(query, Game.game_date, Game.game_id, limit, after)
+        else:
+            games = query.order_by(Game.game_date.asc(), Game.game_id.asc()).all()
+        
+        if include:
+            result = []
+            for game, team_a_name, team_b_name, sport_name in games:
+                game_dict = game.to_dict(include)
+                game_dict['team_a_name'] = team_a_name
+                game_dict['team_b_name'] = team_b_name
+                game_dict['sport_name'] = sport_name
+                result.append(game_dict)
+        else:
+            result = [game_list_row(row) for row in games]
+
+        if wants_page():
+            last = games[-1] if games and has_more else None
+            if last is not None and include:
+                last = last[0]
+            return jsonify({
+                'items': result,
+                'next_cursor': encode_cursor(last.game_date, last.game_id) if last else None
+            }), 200
+        
+        return jsonify(result), 200
+    except (PaginationError, ValueError) as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@games_bp.route('/games/live', methods=['GET'])
+def stream_live_games():
+    """
+    Stream SSE com as mudanças de placar e status dos jogos. Filtro opcional
+    sport_id; para retomar, o cliente envia Last-Event-ID (ou last_event_id
+    na query string) e recebe os eventos perdidos desde então.
+    """
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    if last_event_id is not None:
+        try:
+            last_event_id = int(last_event_id)
+        except ValueError:
+            return jsonify({'error': 'Last-Event-ID inválido'}), 400
+
+    events = live.stream(
+        last_event_id=last_event_id,
+        sport_id=request.args.get('sport_id') or None,
+        heartbeat=current_app.config.get('LIVE_HEARTBEAT', 15),
+        max_duration=current_app.config.get('LIVE_STREAM_MAX_SECONDS', 300)
+    )
+    return Response(events, mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@games_bp.route('/games/<game_id>', methods=['GET'])
+@cached_response('games', 'teams', 'sports')
+def get_game_by_id(game_id):
+    """Retorna um jogo específico pelo ID (aceita include=teams,sport)"""
+    try:
+        include = parse_include(request.args.get('include'))
+        game = db.session.get(Game, game_id, options=include_options(include))
+        if not game:
+            return jsonify({'error': 'Jogo não encontrado'}), 404
+        return jsonify(game.to_dict(include)), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@games_bp.route('/games/sport/<sport_id>', methods=['GET'])
+@cached_response('games', 'teams', 'sports')
+def get_games_by_sport(sport_id):
+    """Retorna todos os jogos de uma modalidade específica (aceita include=teams,sport)"""
+    try:
+        include = parse_include(request.args.get('include'))
+        if not include:
+            rows = db.session.query(*Game.list_columns()) \
+                .filter(Game.sport_id == sport_id).order_by(Game.game_date.asc()).all()
+            return jsonify([game_row(row) for row in rows]), 200
+
+        games = Game.query.options(*include_options(include)) \
+            .filter_by(sport_id=sport_id).order_by(Game.game_date.asc()).all()
+        return jsonify([game.to_dict(include) for game in games]), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@games_bp.route('/brackets/<bracket_id>', methods=['GET'])
+@cached_response('games', 'teams', 'sports')
+def get_bracket(bracket_id):
+    """Retorna as vagas de um chaveamento eliminatório, por rodada e posição (aceita include=teams,sport)"""
+    try:
+        include = parse_include(request.args.get('include'))
+        slots = BracketSlot.query.filter_by(bracket_id=bracket_id) \
+            .order_by(BracketSlot.round.asc(), BracketSlot.position.asc()).all()
+        if not slots:
+            return jsonify({'error': 'Chaveamento não encontrado'}), 404
+
+        games = {game.game_id: game for game in Game.query.options(*include_options(include)).filter(
+            Game.game_id.in_([slot.game_id for slot in slots if slot.game_id]))}
+        result = []
+        for slot in slots:
+            slot_dict = slot.to_dict()
+            game = games.get(slot.game_id)
+            slot_dict['game'] = game.to_dict(include) if game else None
+            result.append(slot_dict)
+
+        return jsonify(result), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
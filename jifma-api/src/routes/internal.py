@@ -0,0 +1,24 @@
+from flask import Blueprint, jsonify
+from services.auth import admin_required
+from services.cache import response_cache
+from services.database import pool_stats
+
+internal_bp = Blueprint('internal', __name__)
+
+@internal_bp.route('/internal/cache', methods=['GET'])
+@admin_required()
+def get_cache_stats():
+    """Retorna os contadores do cache de respostas públicas"""
+    try:
+        return jsonify(response_cache.stats()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@internal_bp.route('/internal/pool', methods=['GET'])
+@admin_required()
+def get_pool_stats():
+    """Retorna o perfil e as estatísticas do pool de conexões"""
+    try:
+        return jsonify(pool_stats.snapshot()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -1,26 +1,102 @@
-from flask import Blueprint, request, jsonify
-from models.user import db
-from models.news import News
-from datetime import datetime
-
-news_bp = Blueprint('news', __name__)
-
-@news_bp.route('/news', methods=['GET'])
-def get_all_news():
-    """Retorna todas as notícias"""
-    try:
-        news = News.query.order_by(News.publication_date.desc()).all()
-        return jsonify([article.to_dict() for article in news]), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
-
-@news_bp.route('/news/<news_id>', methods=['GET'])
-def get_news_by_id(news_id):
-    """Retorna uma notícia específica pelo ID"""
-    try:
-        news = News.query.get(news_id)
-        if not news:
-            return jsonify({'error': 'Notícia não encontrada'}), 404
-        return jsonify(news.to_dict()), 200
-    except Exception as e:
+from flask import Blueprint, request, jsonify
+from models.user import db
+from models.news import News, news_row, news_summary_row
+from datetime import datetime
+from services import search
+from services.tags import filter_by_tag
+from services.cache import cached_response
+from services.pagination import (
+    DEFAULT_LIMIT, MAX_LIMIT, PaginationError, encode_cursor, keyset_page, parse_page_args, wants_page
+)
+
+news_bp = Blueprint('news', __name__)
+
+@news_bp.route('/news', methods=['GET'])
+@cached_response('news')
+def get_all_news():
+    """
+    Retorna as notícias, da mais recente para a mais antiga.
+
+    Com tag=<nome ou slug> apenas as notícias com a tag são retornadas.
+    Com view=summary apenas as colunas da listagem são lidas (sem o conteúdo),
+    com resumo, contagem de palavras e tempo de leitura pré-calculados.
+    Com limit ou cursor a resposta é paginada por chave
+    (publication_date, news_id) e inclui next_cursor.
+    """
+    try:
+        view = request.args.get('view', 'full')
+        if view not in ('full', 'summary'):
+            return jsonify({'error': 'Parâmetro view inválido. Use full ou summary.'}), 400
+
+        if view == 'summary':
+            query = db.session.query(*News.summary_columns())
+            serialize = news_summary_row
+        else:
+            query = db.session.query(*News.full_columns())
+            serialize = news_row
+
+        tag = request.args.get('tag')
+        if tag:
+            query = filter_by_tag(query, News, tag)
+
+        if wants_page():
+            limit, after = parse_page_args()
+            news, has_more = keyset_page(query, News.publication_date, News.news_id,
+                                         limit, after, descending=True)
+            last = news[-1] if news and has_more else None
+            return jsonify({
+                'items': [serialize(article) for article in news],
+                'next_cursor': encode_cursor(last.publication_date, last.news_id) if last else None
+            }), 200
+
+        news = query.order_by(News.publication_date.desc(), News.news_id.desc()).all()
+        return jsonify([serialize(article) for article in news]), 200
+    except PaginationError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@news_bp.route('/news/search', methods=['GET'])
+@cached_response('news')
+def search_news():
+    """
+    Busca textual nas notícias (título e conteúdo), ordenada por relevância.
+    Parâmetros: q, page (a partir de 1) e limit.
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        if not query:
+            return jsonify({'error': 'Parâmetro q é obrigatório'}), 400
+        try:
+            page = max(1, int(request.args.get('page', 1)))
+            limit = max(1, min(int(request.args.get('limit', DEFAULT_LIMIT)), MAX_LIMIT))
+        except ValueError:
+            return jsonify({'error': 'Parâmetros page e limit devem ser inteiros'}), 400
+
+        rows = search.search_news(query, limit + 1, (page - 1) * limit)
+        items = []
+        for row in rows[:limit]:
+            item = news_summary_row(row)
+            item['snippet'] = row.snippet
+            item['rank'] = abs(float(row.rank))
+            items.append(item)
+
+        return jsonify({
+            'items': items,
+            'page': page,
+            'next_page': page + 1 if len(rows) > limit else None
+        }), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@news_bp.route('/news/<news_id>', methods=['GET'])
+@cached_response('news')
+def get_news_by_id(news_id):
+    """Retorna uma notícia específica pelo ID"""
+    try:
+        news = News.query.get(news_id)
+        if not news:
+            return jsonify({'error': 'Notícia não encontrada'}), 404
+        return jsonify(news.to_dict()), 200
+    except Exception as e:
         return jsonify({'error': str(e)}), 500
\ No newline at end of file
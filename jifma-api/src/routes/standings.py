@@ -0,0 +1,36 @@
+from flask import Blueprint, jsonify
+from models.user import db
+from models.sports import Sport
+from models.standings import TeamStanding
+from models.teams import Team
+from services.cache import cached_response
+
+standings_bp = Blueprint('standings', __name__)
+
+@standings_bp.route('/standings/<sport_id>', methods=['GET'])
+@cached_response('games', 'teams')
+def get_standings(sport_id):
+    """Retorna a classificação pré-calculada de uma modalidade"""
+    try:
+        if not Sport.query.get(sport_id):
+            return jsonify({'error': 'Modalidade não encontrada'}), 404
+
+        rows = db.session.query(TeamStanding, Team.name.label('team_name')) \
+            .join(Team, TeamStanding.team_id == Team.team_id) \
+            .filter(TeamStanding.sport_id == sport_id, TeamStanding.played > 0) \
+            .order_by(TeamStanding.points.desc(),
+                      TeamStanding.wins.desc(),
+                      (TeamStanding.points_for - TeamStanding.points_against).desc(),
+                      TeamStanding.points_for.desc(),
+                      Team.name.asc()).all()
+
+        result = []
+        for position, (standing, team_name) in enumerate(rows, start=1):
+            standing_dict = standing.to_dict()
+            standing_dict['team_name'] = team_name
+            standing_dict['position'] = position
+            result.append(standing_dict)
+
+        return jsonify(result), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,16 @@
+from flask import Blueprint, jsonify
+from models.tags import Tag
+from services.cache import cached_response
+
+tags_bp = Blueprint('tags', __name__)
+
+@tags_bp.route('/tags', methods=['GET'])
+@cached_response('news')
+def get_all_tags():
+    """Retorna as tags em uso com a quantidade de notícias de cada uma"""
+    try:
+        tags = Tag.query.filter(Tag.news_count > 0) \
+            .order_by(Tag.news_count.desc(), Tag.name.asc()).all()
+        return jsonify([tag.to_dict() for tag in tags]), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,84 @@
+import threading
+import time
+from functools import wraps
+from flask import jsonify
+from flask_jwt_extended import verify_jwt_in_request, get_jwt, get_jwt_identity
+from models.user import db, User
+
+
+class AdminTokenCache:
+    """
+    Cache com TTL das versões de token dos administradores ativos.
+
+    Um usuário rebaixado, excluído ou com token_version incrementado deixa de
+    constar no mapa (ou passa a ter outra versão), então seus tokens são
+    recusados. O banco só é consultado quando o TTL expira ou quando uma
+    revogação é feita nesta instância.
+    """
+
+    def __init__(self, ttl=30):
+        self.ttl = ttl
+        self._versions = {}
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.ttl = app.config.get('ADMIN_TOKEN_CACHE_TTL', self.ttl)
+        # Um novo app pode apontar para outro banco: recarrega na próxima consulta
+        with self._lock:
+            self._versions = {}
+            self._expires_at = 0.0
+
+    def _refresh(self):
+        rows = db.session.query(User.user_id, User.token_version).filter(User.is_admin.is_(True)).all()
+        self._versions = {user_id: token_version or 0 for user_id, token_version in rows}
+        self._expires_at = time.monotonic() + self.ttl
+
+    def is_current(self, user_id, token_version):
+        with self._lock:
+            if time.monotonic() >= self._expires_at:
+                self._refresh()
+            return self._versions.get(user_id) == token_version
+
+    def revoke(self, user_id):
+        with self._lock:
+            self._versions.pop(user_id, None)
+            self._expires_at = 0.0
+
+
+admin_tokens = AdminTokenCache()
+
+
+def admin_claims(user):
+    """Claims adicionais gravadas no token durante o login"""
+    return {
+        'is_admin': bool(user.is_admin),
+        'token_version': user.token_version or 0
+    }
+
+
+def bump_token_version(user):
+    """
+    Invalida os tokens já emitidos para o usuário (rebaixamento, troca de senha).
+    Após o commit, chame admin_tokens.revoke(user_id) para refletir na instância atual.
+    """
+    user.token_version = (user.token_version or 0) + 1
+
+
+def admin_required():
+    """Decorator que exige um token de administrador válido, sem consultar o usuário"""
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            verify_jwt_in_request()
+            claims = get_jwt()
+            if not claims.get('is_admin', False):
+                return jsonify({'error': 'Acesso negado. Apenas administradores.'}), 403
+            if not admin_tokens.is_current(get_jwt_identity(), claims.get('token_version')):
+                return jsonify({
+                    'message': 'Token revogado',
+                    'error': 'token_revoked'
+                }), 401
+            return fn(*args, **kwargs)
+        return decorator
+    return wrapper
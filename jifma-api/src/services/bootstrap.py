@@ -0,0 +1,48 @@
+from models.user import db, User
+from models.sports import Sport
+from models.teams import Team
+from services import migrations
+
+
+def init_schema(log=print):
+    """Cria as tabelas que faltam e aplica as migrações pendentes"""
+    db.create_all()
+    return migrations.upgrade(log=log)
+
+
+def seed_defaults():
+    """Insere modalidades, equipes e o administrador padrão em um banco vazio"""
+    if Sport.query.count() > 0:
+        return False
+
+    sports = [
+        Sport(name='Futsal', description='Modalidade de futebol indoor'),
+        Sport(name='Futebol de Campo', description='Futebol tradicional em campo aberto'),
+        Sport(name='Vôlei de Praia', description='Voleibol na areia'),
+        Sport(name='Vôlei de Quadra', description='Voleibol em quadra coberta'),
+        Sport(name='Handebol', description='Esporte coletivo com as mãos'),
+        Sport(name='Basquete', description='Basquetebol em quadra')
+    ]
+    for sport in sports:
+        db.session.add(sport)
+
+    teams = [
+        Team(name='Informática', city='Caxias'),
+        Team(name='Administração', city='Caxias'),
+        Team(name='Agropecuária', city='Caxias'),
+        Team(name='Edificações', city='Caxias')
+    ]
+    for team in teams:
+        db.session.add(team)
+
+    # Criar usuário administrador padrão
+    admin_user = User(
+        username='admin',
+        email='admin@jifma.com',
+        is_admin=True
+    )
+    admin_user.set_password('admin@123')
+    db.session.add(admin_user)
+
+    db.session.commit()
+    return True
@@ -0,0 +1,121 @@
+import csv
+import io
+import uuid
+from datetime import datetime
+from sqlalchemy import insert
+from models.user import db
+from models.games import Game
+from models.teams import Team
+from models.sports import Sport
+from services import conflicts
+
+REQUIRED_FIELDS = ('sport_id', 'team_a_id', 'team_b_id', 'game_date', 'location')
+# Campos gravados como texto: listas/objetos no JSON são erro da linha
+TEXT_FIELDS = ('sport_id', 'team_a_id', 'team_b_id', 'location', 'status')
+GAME_STATUSES = ('Agendado', 'Em Andamento', 'Finalizado', 'Cancelado')
+MAX_ROWS = 2000
+
+
+class BulkImportError(ValueError):
+    pass
+
+
+def parse_csv(text):
+    """Lê um CSV com cabeçalho (sport_id, team_a_id, team_b_id, game_date, location[, status])"""
+    reader = csv.DictReader(io.StringIO(text.lstrip('\ufeff')))
+    if not reader.fieldnames:
+        raise BulkImportError('CSV vazio')
+    return [{key.strip(): (value or '').strip() for key, value in row.items() if key} for row in reader]
+
+
+def parse_date(value):
+    return datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+
+
+def _text(row, field):
+    """Valor do campo se for texto não vazio, senão None"""
+    value = row.get(field)
+    return value if isinstance(value, str) and value else None
+
+
+def _existing_ids(column, ids):
+    if not ids:
+        return set()
+    return {value for value, in db.session.query(column).filter(column.in_(ids))}
+
+
+def validate(rows, check_conflicts=True):
+    """
+    Valida todas as linhas de uma vez: uma consulta IN para as modalidades e
+    outra para as equipes e, com check_conflicts, uma verificação de choques
+    de equipe/local entre as linhas e contra os jogos gravados. Retorna
+    (válidas, erros), em que cada válida é o dicionário pronto para o INSERT
+    e cada erro é {'row': n, 'errors': [...]}.
+    """
+    if len(rows) > MAX_ROWS:
+        raise BulkImportError(f'No máximo {MAX_ROWS} jogos por importação')
+
+    sport_ids = _existing_ids(Sport.sport_id, {_text(row, 'sport_id') for row in rows if isinstance(row, dict)} - {None})
+    team_ids = _existing_ids(Team.team_id, {
+        _text(row, field) for row in rows if isinstance(row, dict) for field in ('team_a_id', 'team_b_id')
+    } - {None})
+
+    valid, numbers, errors = [], [], []
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append({'row': number, 'errors': ['Linha deve ser um objeto']})
+            continue
+
+        problems = [f'Campo obrigatório: {field}' for field in REQUIRED_FIELDS if not row.get(field)]
+        problems += [f'Campo inválido: {field}' for field in TEXT_FIELDS
+                     if row.get(field) and not isinstance(row[field], str)]
+        if _text(row, 'sport_id') and row['sport_id'] not in sport_ids:
+            problems.append('Modalidade não encontrada')
+        if _text(row, 'team_a_id') and row['team_a_id'] not in team_ids:
+            problems.append('Equipe A não encontrada')
+        if _text(row, 'team_b_id') and row['team_b_id'] not in team_ids:
+            problems.append('Equipe B não encontrada')
+        if _text(row, 'team_a_id') and row['team_a_id'] == row.get('team_b_id'):
+            problems.append('As equipes A e B devem ser diferentes')
+
+        status = row.get('status') or 'Agendado'
+        if isinstance(status, str) and status not in GAME_STATUSES:
+            problems.append('Status inválido')
+
+        game_date = None
+        if row.get('game_date'):
+            try:
+                game_date = parse_date(row['game_date'])
+            except (TypeError, ValueError):
+                problems.append('Formato de data inválido. Use ISO format.')
+
+        if problems:
+            errors.append({'row': number, 'errors': problems})
+            continue
+
+        valid.append({
+            'game_id': str(uuid.uuid4()),
+            'sport_id': row['sport_id'],
+            'team_a_id': row['team_a_id'],
+            'team_b_id': row['team_b_id'],
+            'game_date': game_date,
+            'location': row['location'],
+            'status': status
+        })
+        numbers.append(number)
+
+    if check_conflicts and valid:
+        clashes = conflicts.check(valid)
+        if clashes:
+            errors.extend({'row': numbers[position], 'errors': ['Conflito de horário'], 'conflicts': found}
+                          for position, found in clashes.items())
+            errors.sort(key=lambda error: error['row'])
+            valid = [values for position, values in enumerate(valid) if position not in clashes]
+    return valid, errors
+
+
+def insert_games(values):
+    """INSERT em lote (executemany) na transação corrente; o commit fica com quem chama"""
+    if values:
+        db.session.execute(insert(Game), values)
+    return [row['game_id'] for row in values]
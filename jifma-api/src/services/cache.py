@@ -0,0 +1,297 @@
+import threading
+import time
+import uuid
+from datetime import datetime
+from collections import OrderedDict
+from functools import wraps
+from flask import current_app, g, has_app_context, request, make_response
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from models.user import db
+from models.cache_versions import CacheVersion
+from services.http_cache import compute_etag
+
+
+class MemoryVersions:
+    """
+    Versões só na memória do processo. Serve apenas para um único processo
+    (desenvolvimento, benchmarks): outras instâncias não veem os incrementos.
+    """
+
+    def __init__(self):
+        self._versions = {}
+        self._lock = threading.Lock()
+        # As versões recomeçam do zero a cada processo; o epoch distingue
+        # versões de processos diferentes em caches fora da memória.
+        self.epoch = uuid.uuid4().hex[:12]
+
+    def read(self, names):
+        with self._lock:
+            return {name: self._versions.get(name, 0) for name in names}
+
+    def bump(self, names):
+        with self._lock:
+            for name in names:
+                self._versions[name] = self._versions.get(name, 0) + 1
+
+    def all(self):
+        with self._lock:
+            return dict(self._versions)
+
+
+class DatabaseVersions:
+    """
+    Versões na tabela cache_versions, compartilhadas por todos os workers e
+    instâncias serverless: um incremento feito em qualquer uma invalida as
+    entradas de todas. Persistem entre reinícios, então o epoch é fixo.
+    """
+
+    epoch = 'db'
+
+    def read(self, names):
+        if not names:
+            return {}
+        rows = db.session.execute(
+            select(CacheVersion.name, CacheVersion.version).where(CacheVersion.name.in_(names))
+        )
+        found = dict(rows.all())
+        return {name: found.get(name, 0) for name in names}
+
+    def bump(self, names):
+        names = sorted(set(names))
+        if not names:
+            return
+        # Conexão própria: o incremento é confirmado fora da transação da rota.
+        # Um único upsert (SQLite e Postgres) evita corrida entre instâncias.
+        with db.engine.begin() as conn:
+            insert = postgres_insert if conn.dialect.name == 'postgresql' else sqlite_insert
+            statement = insert(CacheVersion).values(
+                name=bindparam('name'), version=1, updated_at=bindparam('updated_at')
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[CacheVersion.name],
+                set_={'version': CacheVersion.version + 1, 'updated_at': statement.excluded.updated_at}
+            )
+            now = datetime.utcnow()
+            conn.execute(statement, [{'name': name, 'updated_at': now} for name in names])
+
+    def all(self):
+        return dict(db.session.execute(select(CacheVersion.name, CacheVersion.version)).all())
+
+
+class ResponseCache:
+    """
+    Cache em memória das respostas JSON dos endpoints públicos de leitura.
+
+    Cada entrada é indexada pelo endpoint, pela query string e pelas versões
+    das tabelas das quais a resposta depende. As rotas administrativas
+    incrementam a versão da tabela após o commit, de modo que entradas antigas
+    deixam de ser alcançáveis e saem do cache pela política LRU. As versões
+    ficam no banco (RESPONSE_CACHE_VERSIONS=database), lidas uma vez por
+    requisição, e toda entrada expira após RESPONSE_CACHE_TTL segundos, o que
+    limita a defasagem mesmo se um incremento se perder.
+    """
+
+    def __init__(self, max_entries=512, max_bytes=16 * 1024 * 1024, entry_ttl=300):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entry_ttl = entry_ttl
+        self.enabled = True
+        self.store = MemoryVersions()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._listeners = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def init_app(self, app):
+        self.enabled = app.config.get('RESPONSE_CACHE_ENABLED', True)
+        self.max_entries = app.config.get('RESPONSE_CACHE_MAX_ENTRIES', self.max_entries)
+        self.max_bytes = app.config.get('RESPONSE_CACHE_MAX_BYTES', self.max_bytes)
+        self.entry_ttl = app.config.get('RESPONSE_CACHE_TTL', self.entry_ttl)
+        kind = app.config.get('RESPONSE_CACHE_VERSIONS', 'database')
+        self.store = DatabaseVersions() if kind == 'database' else MemoryVersions()
+        app.extensions['response_cache'] = self
+
+    @property
+    def epoch(self):
+        return self.store.epoch
+
+    def versions(self, tables):
+        """Versões das tabelas, lidas do armazenamento no máximo uma vez por requisição"""
+        if not has_app_context():
+            found = self.store.read(list(tables))
+            return tuple(found[table] for table in tables)
+        known = g.setdefault('_cache_versions', {})
+        missing = [table for table in tables if table not in known]
+        if missing:
+            known.update(self.store.read(missing))
+        return tuple(known[table] for table in tables)
+
+    def bump_version(self, *tables):
+        """
+        Invalida as respostas que dependem das tabelas informadas. Uma tabela
+        incrementada sem nenhum escopo '<tabela>:id:<id>' também incrementa
+        '<tabela>:all': a alteração pode ter tocado qualquer registro (ver
+        services.snapshots).
+        """
+        tables += tuple(f'{table}:all' for table in tables
+                        if ':' not in table and not any(name.startswith(f'{table}:id:') for name in tables))
+        self.store.bump(tables)
+        if has_app_context():
+            g.pop('_cache_versions', None)
+        with self._lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(tables)
+
+    def add_listener(self, listener):
+        """Registra uma função chamada com as versões incrementadas a cada bump_version"""
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[4] <= time.monotonic():
+                self._entries.pop(key)
+                self._bytes -= len(entry[0])
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[:4]
+
+    def set(self, key, body, status, mimetype, etag):
+        size = len(body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous[0])
+            self._entries[key] = (body, status, mimetype, etag, time.monotonic() + self.entry_ttl)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (old_body, *_) = self._entries.popitem(last=False)
+                self._bytes -= len(old_body)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        versions = self.store.all()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'enabled': self.enabled,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'entry_ttl': self.entry_ttl,
+                'versions_store': type(self.store).__name__,
+                'versions': versions
+            }
+
+
+response_cache = ResponseCache()
+
+
+def bump_version(*tables):
+    """
+    Incrementa as versões após o commit. Uma falha aqui não desfaz a escrita
+    já confirmada: fica registrada e o TTL das entradas limita a defasagem.
+    """
+    try:
+        response_cache.bump_version(*tables)
+    except Exception:
+        current_app.logger.exception('Falha ao incrementar as versões do cache: %s', ', '.join(tables))
+
+
+def game_scopes(*games):
+    """
+    Versões por equipe, por modalidade e por jogo tocadas pelos jogos
+    (objetos, dicts ou linhas com game_id, sport_id, team_a_id e team_b_id),
+    para invalidar apenas as respostas daquelas equipes e modalidades. Passe
+    o jogo antes e depois da alteração quando equipes ou modalidade mudarem.
+    """
+    scopes = set()
+    for game in games:
+        if game is None:
+            continue
+        value = game.get if isinstance(game, dict) else lambda field: getattr(game, field, None)
+        scopes.add(f"games:id:{value('game_id')}")
+        scopes.add(f"games:sport:{value('sport_id')}")
+        scopes.update(f"games:team:{value(field)}" for field in ('team_a_id', 'team_b_id'))
+    return sorted(scopes)
+
+
+def entity_scopes(table, *ids):
+    """Versões por registro ('<tabela>:id:<id>'), para republicar só os snapshots alterados"""
+    return [f'{table}:id:{entity_id}' for entity_id in ids]
+
+
+def cached_response(*tables, ttl=None):
+    """
+    Decorator para rotas GET públicas: reutiliza o corpo serializado enquanto
+    nenhuma das tabelas informadas for alterada. Com ttl (segundos) a entrada
+    também expira com o relógio, para respostas que dependem da hora atual.
+    Nomes com campos da URL, como 'games:team:{team_id}', usam a versão
+    daquele escopo (ver game_scopes).
+    """
+    def wrapper(fn):
+        @wraps(fn)
+        def decorator(*args, **kwargs):
+            if not response_cache.enabled or request.method != 'GET':
+                return fn(*args, **kwargs)
+
+            # As versões são lidas antes da consulta: uma escrita concorrente
+            # apenas torna a entrada inalcançável, nunca a deixa desatualizada.
+            try:
+                versions = response_cache.versions([table.format(**kwargs) for table in tables])
+            except Exception:
+                # Sem as versões não dá para validar o cache: responde sem ele
+                current_app.logger.exception('Falha ao ler as versões do cache')
+                db.session.rollback()
+                return fn(*args, **kwargs)
+            key = (
+                request.endpoint,
+                tuple(sorted(kwargs.items())),
+                tuple(sorted(request.args.items(multi=True))),
+                versions,
+                int(time.time() // ttl) if ttl else None
+            )
+            entry = response_cache.get(key)
+            if entry is not None:
+                body, status, mimetype, etag = entry
+                response = make_response(body, status)
+                response.mimetype = mimetype
+                response.set_etag(etag)
+                response.headers['X-Cache'] = 'HIT'
+                return response
+
+            response = make_response(fn(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                # O ETag é calculado uma única vez e reaproveitado nos acertos
+                body = response.get_data()
+                etag = compute_etag(body)
+                response.set_etag(etag)
+                response_cache.set(key, body, response.status_code, response.mimetype, etag)
+            response.headers['X-Cache'] = 'MISS'
+            return response
+        return decorator
+    return wrapper
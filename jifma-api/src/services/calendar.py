@@ -0,0 +1,102 @@
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import or_
+from sqlalchemy.orm import aliased
+from models.user import db
+from models.games import Game
+from models.sports import Sport
+from models.teams import Team
+from services.conflicts import CANCELLED, game_duration
+
+# Feeds iCalendar (RFC 5545) com os jogos de uma equipe ou modalidade.
+# Os horários são "flutuantes" (sem fuso), como o banco os guarda; o
+# X-WR-TIMEZONE indica aos clientes o fuso local dos jogos.
+
+PRODID = '-//JIFMA//Jogos Internos IFMA Campus Caxias//PT'
+DATE_FORMAT = '%Y%m%dT%H%M%S'
+
+
+def escape(text):
+    return (text or '').replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,') \
+        .replace('\r\n', '\\n').replace('\n', '\\n')
+
+
+def fold(line):
+    """Quebra a linha em pedaços de até 75 octetos, sem partir caracteres UTF-8"""
+    if len(line.encode('utf-8')) <= 75:
+        return line
+    parts, current, size = [], '', 0
+    for char in line:
+        width = len(char.encode('utf-8'))
+        if size + width > (75 if not parts else 74):
+            parts.append(current)
+            current, size = '', 0
+        current += char
+        size += width
+    parts.append(current)
+    return '\r\n '.join(parts)
+
+
+def _summary(row):
+    if row.score_a is not None and row.score_b is not None:
+        match = f'{row.team_a_name} {row.score_a} x {row.score_b} {row.team_b_name}'
+    else:
+        match = f'{row.team_a_name} x {row.team_b_name}'
+    return f'{row.sport_name}: {match}'
+
+
+def _event(row, duration, stamp):
+    start = row.game_date.replace(tzinfo=None)
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{row.game_id}@jifma',
+        f'DTSTAMP:{stamp}',
+        f'SEQUENCE:{row.version}',
+        f'DTSTART:{start.strftime(DATE_FORMAT)}',
+        f'DTEND:{(start + duration).strftime(DATE_FORMAT)}',
+        f'SUMMARY:{escape(_summary(row))}',
+        f'DESCRIPTION:{escape(row.status)}',
+        f'STATUS:{"CANCELLED" if row.status == CANCELLED else "CONFIRMED"}'
+    ]
+    if row.location:
+        lines.append(f'LOCATION:{escape(row.location)}')
+    lines.append('END:VEVENT')
+    return lines
+
+
+def feed(name, *filters):
+    """Monta o VCALENDAR dos jogos que atendem aos filtros, em ordem de horário"""
+    TeamA = aliased(Team, name='team_a')
+    TeamB = aliased(Team, name='team_b')
+    query = db.session.query(
+        Game.game_id, Game.game_date, Game.location, Game.status, Game.score_a, Game.score_b, Game.version,
+        TeamA.name.label('team_a_name'), TeamB.name.label('team_b_name'), Sport.name.label('sport_name')
+    ).join(TeamA, Game.team_a_id == TeamA.team_id) \
+        .join(TeamB, Game.team_b_id == TeamB.team_id) \
+        .join(Sport, Game.sport_id == Sport.sport_id) \
+        .filter(*filters) \
+        .order_by(Game.game_date.asc(), Game.game_id.asc())
+
+    duration = game_duration()
+    stamp = datetime.utcnow().strftime(DATE_FORMAT) + 'Z'
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        f'PRODID:{PRODID}',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{escape(f"JIFMA - {name}")}',
+        f'X-WR-TIMEZONE:{current_app.config.get("CALENDAR_TIMEZONE", "America/Fortaleza")}'
+    ]
+    for row in query:
+        lines.extend(_event(row, duration, stamp))
+    lines.append('END:VCALENDAR')
+    return '\r\n'.join(fold(line) for line in lines) + '\r\n'
+
+
+def team_feed(team):
+    return feed(team.name, or_(Game.team_a_id == team.team_id, Game.team_b_id == team.team_id))
+
+
+def sport_feed(sport):
+    return feed(sport.name, Game.sport_id == sport.sport_id)
@@ -0,0 +1,148 @@
+from bisect import bisect_left, bisect_right
+from collections import defaultdict, deque
+from datetime import timedelta
+from flask import current_app
+from models.user import db
+from models.games import Game
+
+# Um jogo ocupa suas duas equipes e seu local de game_date até
+# game_date + GAME_DURATION_MINUTES. Jogos cancelados não ocupam nada.
+CANCELLED = 'Cancelado'
+
+
+def game_duration():
+    return timedelta(minutes=current_app.config.get('GAME_DURATION_MINUTES', 60))
+
+
+def venue_key(location):
+    return (location or '').strip().lower()
+
+
+def naive(moment):
+    # O banco guarda o horário sem fuso (como o create_game sempre fez)
+    return moment.replace(tzinfo=None) if moment.tzinfo else moment
+
+
+def resources(game):
+    """Recursos ocupados pelo jogo: ('team', team_id) e ('location', local normalizado)"""
+    keys = [('team', game['team_a_id']), ('team', game['team_b_id'])]
+    if venue_key(game.get('location')):
+        keys.append(('location', venue_key(game['location'])))
+    return keys
+
+
+class IntervalIndex:
+    """Horários de início ordenados por recurso, para achar sobreposições por bisect"""
+
+    def __init__(self, duration):
+        self.duration = duration
+        self._starts = defaultdict(list)
+        self._ids = defaultdict(list)
+
+    def add(self, game_id, game_date, keys):
+        for key in keys:
+            position = bisect_right(self._starts[key], game_date)
+            self._starts[key].insert(position, game_date)
+            self._ids[key].insert(position, game_id)
+
+    def overlapping(self, game_date, keys):
+        found = []
+        for key in keys:
+            starts = self._starts.get(key)
+            if not starts:
+                continue
+            low = bisect_right(starts, game_date - self.duration)
+            high = bisect_left(starts, game_date + self.duration)
+            for position in range(low, high):
+                found.append({'type': key[0], 'key': key[1],
+                              'game_id': self._ids[key][position],
+                              'game_date': starts[position].isoformat()})
+        return found
+
+
+def check(candidates, duration=None):
+    """
+    Procura choques de equipe e de local para os jogos em candidates (dicts
+    com game_id, game_date, location, team_a_id e team_b_id), entre si e
+    contra os jogos gravados. Uma única consulta por faixa de game_date
+    (índice ix_games_game_date) carrega os jogos próximos, e locais são
+    comparados por venue_key, como em all_conflicts. Retorna
+    {índice do candidato: [conflitos]}.
+    """
+    active = {position: {**game, 'game_date': naive(game['game_date'])}
+              for position, game in enumerate(candidates) if game.get('status') != CANCELLED}
+    if not active:
+        return {}
+    duration = duration or game_duration()
+    dates = [game['game_date'] for game in active.values()]
+    own_ids = {game['game_id'] for game in active.values() if game.get('game_id')}
+
+    # Só a faixa de horário vai para o SQL: o local é comparado por venue_key
+    # em Python, já que lower() do SQLite não trata acentos nem espaços
+    query = db.session.query(Game.game_id, Game.game_date, Game.location, Game.team_a_id, Game.team_b_id) \
+        .filter(Game.game_date > min(dates) - duration,
+                Game.game_date < max(dates) + duration,
+                Game.status != CANCELLED)
+    if own_ids:
+        query = query.filter(Game.game_id.notin_(own_ids))
+
+    index = IntervalIndex(duration)
+    with db.session.no_autoflush:
+        for row in query:
+            index.add(row.game_id, row.game_date, resources(row._asdict()))
+
+    result = {}
+    for position, game in active.items():
+        keys = resources(game)
+        found = index.overlapping(game['game_date'], keys)
+        if found:
+            result[position] = found
+        index.add(game.get('game_id'), game['game_date'], keys)
+    return result
+
+
+def check_game(game):
+    """Conflitos de um único jogo (objeto Game ou dict), ignorando ele mesmo"""
+    values = game if isinstance(game, dict) else {
+        'game_id': game.game_id,
+        'game_date': game.game_date,
+        'location': game.location,
+        'team_a_id': game.team_a_id,
+        'team_b_id': game.team_b_id,
+        'status': game.status
+    }
+    return check([values]).get(0, [])
+
+
+def all_conflicts(date_from=None, date_to=None, duration=None):
+    """
+    Lista todos os choques atuais com uma varredura em ordem de game_date:
+    para cada recurso fica só a janela dos jogos iniciados há menos de uma
+    duração, então o custo é linear no número de jogos.
+    """
+    duration = duration or game_duration()
+    query = db.session.query(Game.game_id, Game.game_date, Game.location, Game.team_a_id, Game.team_b_id) \
+        .filter(Game.status != CANCELLED)
+    if date_from:
+        query = query.filter(Game.game_date >= date_from)
+    if date_to:
+        query = query.filter(Game.game_date <= date_to)
+
+    windows = defaultdict(deque)
+    conflicts = []
+    for row in query.order_by(Game.game_date.asc(), Game.game_id.asc()):
+        for key in resources(row._asdict()):
+            window = windows[key]
+            while window and window[0][1] <= row.game_date - duration:
+                window.popleft()
+            for other_id, other_date in window:
+                conflicts.append({
+                    'type': key[0],
+                    'key': key[1],
+                    'game_id': other_id,
+                    'game_date': other_date.isoformat(),
+                    'conflicts_with': row.game_id,
+                    'conflicts_with_date': row.game_date.isoformat()
+                })
+            window.append((row.game_id, row.game_date))
+    return conflicts
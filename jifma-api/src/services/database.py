@@ -0,0 +1,150 @@
+import os
+import threading
+import time
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool, QueuePool
+
+
+class PoolStats:
+    """Contadores do pool de conexões, alimentados pelos eventos do SQLAlchemy"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.profile = None
+        self.engine = None
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.connects = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.waits = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+
+    def init_app(self, app, engine):
+        self.profile = app.config.get('DB_POOL_PROFILE')
+        self.engine = engine
+        event.listen(engine, 'connect', self._on_connect)
+        event.listen(engine, 'checkout', self._on_checkout)
+        event.listen(engine, 'checkin', self._on_checkin)
+        event.listen(engine, 'invalidate', self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        with self._lock:
+            self.checkouts += 1
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        with self._lock:
+            self.invalidations += 1
+
+    def record_wait(self, seconds):
+        with self._lock:
+            self.waits += 1
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+
+    def snapshot(self):
+        pool = self.engine.pool if self.engine is not None else None
+        with self._lock:
+            data = {
+                'profile': self.profile,
+                'pool_class': type(pool).__name__ if pool is not None else None,
+                'connects': self.connects,
+                'checkouts': self.checkouts,
+                'checkins': self.checkins,
+                'invalidations': self.invalidations,
+                'wait_count': self.waits,
+                'wait_avg_ms': round(self.wait_total / self.waits * 1000, 3) if self.waits else 0.0,
+                'wait_max_ms': round(self.wait_max * 1000, 3)
+            }
+        if isinstance(pool, QueuePool):
+            data.update({
+                'size': pool.size(),
+                'checked_in': pool.checkedin(),
+                'checked_out': pool.checkedout(),
+                'overflow': pool.overflow(),
+                'status': pool.status()
+            })
+        else:
+            data['checked_out'] = data['checkouts'] - data['checkins']
+        return data
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool que mede o tempo de espera por uma conexão livre. Só conta
+    como espera o checkout que encontrou o pool esgotado (nenhuma conexão
+    ociosa e sem overflow disponível) ou que passou de WAIT_THRESHOLD.
+    """
+
+    WAIT_THRESHOLD = 0.001
+
+    def _exhausted(self):
+        if self.checkedin():
+            return False
+        return self._max_overflow > -1 and self.overflow() >= self._max_overflow
+
+    def _do_get(self):
+        exhausted = self._exhausted()
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - start
+            if exhausted or waited >= self.WAIT_THRESHOLD:
+                pool_stats.record_wait(waited)
+
+
+def _int_env(name, default):
+    return int(os.environ.get(name, default))
+
+
+# Perfis de engine. "serverless" abre e fecha uma conexão por requisição e
+# deixa o pooling para o pgbouncer; "long-running" mantém um pool próprio,
+# com recycle abaixo do timeout de ociosidade do pooler e pre-ping para
+# descartar conexões mortas.
+ENGINE_PROFILES = {
+    'serverless': lambda: {
+        'poolclass': NullPool
+    },
+    'long-running': lambda: {
+        'poolclass': InstrumentedQueuePool,
+        'pool_size': _int_env('DB_POOL_SIZE', 5),
+        'max_overflow': _int_env('DB_POOL_MAX_OVERFLOW', 5),
+        'pool_timeout': _int_env('DB_POOL_TIMEOUT', 10),
+        'pool_recycle': _int_env('DB_POOL_RECYCLE', 280),
+        'pool_pre_ping': True
+    },
+    'default': lambda: {}
+}
+
+
+def default_pool_profile(database_uri):
+    if database_uri.startswith('sqlite'):
+        return 'default'
+    if os.environ.get('VERCEL'):
+        return 'serverless'
+    return 'long-running'
+
+
+def engine_options(profile, database_uri):
+    if profile not in ENGINE_PROFILES:
+        raise ValueError(f'Perfil de pool desconhecido: {profile}')
+    options = ENGINE_PROFILES[profile]()
+    if database_uri.startswith('postgres'):
+        options['connect_args'] = {'connect_timeout': _int_env('DB_CONNECT_TIMEOUT', 10)}
+    return options
@@ -0,0 +1,163 @@
+import csv
+import os
+import tempfile
+import time
+from flask import current_app
+from sqlalchemy.orm import aliased
+from models.user import db
+from models.games import Game
+from models.medals import MedalStanding
+from models.sports import Sport
+from models.teams import Team
+from services.cache import response_cache
+from services.serializers import isoformat
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # openpyxl é opcional; sem ele só há exportação em CSV
+    Workbook = None
+
+# Planilhas para os organizadores. Cada arquivo é gerado uma vez por versão
+# dos dados (versões do response_cache) e guardado em disco; downloads
+# seguintes do mesmo conjunto sem alterações apenas enviam o arquivo.
+# Arquivos sem download há mais de EXPORT_CACHE_TTL segundos são apagados,
+# nunca os recém-gerados: outro processo (ou um download em andamento) pode
+# estar usando uma versão que não é a atual para este processo.
+
+BATCH_SIZE = 1000
+MIMETYPES = {
+    'csv': 'text/csv',
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+}
+
+
+class ExportError(ValueError):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def _games_rows():
+    TeamA = aliased(Team, name='team_a')
+    TeamB = aliased(Team, name='team_b')
+    Winner = aliased(Team, name='winner')
+    query = db.session.query(
+        Game.game_id, Game.game_date, Sport.name, TeamA.name, Game.score_a, Game.score_b, TeamB.name,
+        Winner.name, Game.status, Game.location
+    ).join(Sport, Game.sport_id == Sport.sport_id) \
+        .join(TeamA, Game.team_a_id == TeamA.team_id) \
+        .join(TeamB, Game.team_b_id == TeamB.team_id) \
+        .outerjoin(Winner, Game.winner_team_id == Winner.team_id) \
+        .order_by(Game.game_date.asc(), Game.game_id.asc())
+    for row in query.yield_per(BATCH_SIZE):
+        yield (row[0], isoformat(row[1]), *row[2:])
+
+
+def _medals_rows():
+    query = db.session.query(
+        Team.name, MedalStanding.gold_medals, MedalStanding.silver_medals, MedalStanding.bronze_medals
+    ).join(Team, MedalStanding.team_id == Team.team_id) \
+        .order_by(MedalStanding.gold_medals.desc(),
+                  MedalStanding.silver_medals.desc(),
+                  MedalStanding.bronze_medals.desc(),
+                  Team.name.asc())
+    # Mesma regra de empate de medals.with_ranks (1, 1, 3...)
+    previous, rank = None, 0
+    for index, (name, gold, silver, bronze) in enumerate(query.yield_per(BATCH_SIZE), start=1):
+        if (gold, silver, bronze) != previous:
+            rank, previous = index, (gold, silver, bronze)
+        yield (rank, name, gold, silver, bronze, gold + silver + bronze)
+
+
+# conjunto: (tabelas das quais depende, cabeçalho, gerador de linhas)
+DATASETS = {
+    'games': (
+        ('games', 'teams', 'sports'),
+        ('game_id', 'data', 'modalidade', 'equipe_a', 'placar_a', 'placar_b', 'equipe_b',
+         'vencedor', 'status', 'local'),
+        _games_rows
+    ),
+    'medals': (
+        ('medals', 'teams'),
+        ('posicao', 'equipe', 'ouro', 'prata', 'bronze', 'total'),
+        _medals_rows
+    )
+}
+
+
+def cache_dir():
+    path = current_app.config.get('EXPORT_CACHE_DIR') or os.path.join(tempfile.gettempdir(), 'jifma-exports')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _remove_stale(directory, keep):
+    cutoff = time.time() - current_app.config.get('EXPORT_CACHE_TTL', 3600)
+    extensions = tuple(f'.{file_format}' for file_format in MIMETYPES)
+    for entry in os.scandir(directory):
+        if entry.path == keep or not entry.name.endswith(extensions):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _write_csv(path, header, rows):
+    # utf-8-sig para o Excel reconhecer os acentos ao abrir o CSV
+    with open(path, 'w', newline='', encoding='utf-8-sig') as output:
+        writer = csv.writer(output)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _write_xlsx(path, header, rows):
+    # write_only grava as linhas em disco à medida que chegam
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(header)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+def export(dataset, file_format='csv'):
+    """
+    Caminho do arquivo do conjunto na versão atual dos dados, gerando-o se
+    ainda não existir. As linhas vêm de uma única consulta em lotes e vão
+    direto para um arquivo temporário, renomeado ao final; arquivos sem uso
+    há mais de EXPORT_CACHE_TTL são apagados. Retorna (caminho, mimetype, etag).
+    """
+    if dataset not in DATASETS:
+        raise ExportError(f'Conjunto inválido. Use {", ".join(DATASETS)}.', 404)
+    if file_format not in MIMETYPES:
+        raise ExportError('Formato inválido. Use csv ou xlsx.')
+    if file_format == 'xlsx' and Workbook is None:
+        raise ExportError('Exportação em xlsx indisponível: instale o openpyxl', 501)
+
+    tables, header, rows = DATASETS[dataset]
+    # Versões lidas antes da consulta, como no cached_response
+    versions = '-'.join(str(version) for version in response_cache.versions(tables))
+    etag = f'{dataset}-{response_cache.epoch}-{versions}'
+    directory = cache_dir()
+    path = os.path.join(directory, f'{etag}.{file_format}')
+    try:
+        # mtime marca o último uso, para a limpeza por idade
+        os.utime(path)
+        return path, MIMETYPES[file_format], etag
+    except FileNotFoundError:
+        pass
+
+    handle, temp_path = tempfile.mkstemp(dir=directory, prefix=f'.{dataset}-', suffix=f'.{file_format}')
+    os.close(handle)
+    try:
+        writer = _write_xlsx if file_format == 'xlsx' else _write_csv
+        writer(temp_path, header, rows())
+        os.replace(temp_path, path)
+    except Exception:
+        os.remove(temp_path)
+        raise
+
+    _remove_stale(directory, path)
+    return path, MIMETYPES[file_format], etag
@@ -0,0 +1,306 @@
+import math
+import uuid
+from bisect import bisect_right, insort
+from collections import defaultdict
+from datetime import timedelta
+from sqlalchemy import insert
+from models.user import db
+from models.games import Game
+from models.teams import Team
+from models.sports import Sport
+from models.fixtures import BracketSlot
+from services import bulk_games, conflicts
+from services.standings import FINISHED
+
+FORMATS = ('round_robin', 'knockout')
+MAX_TEAMS = 256
+MAX_ROWS_SCANNED = 100000
+
+
+class FixtureError(ValueError):
+    def __init__(self, message, status=400, **extra):
+        super().__init__(message)
+        self.status = status
+        self.extra = extra
+
+
+def round_robin(team_ids, legs=1):
+    """
+    Rodadas pelo método do círculo: a primeira equipe fica fixa e as demais
+    giram, de modo que cada par se enfrenta uma vez por turno. Com número
+    ímpar de equipes, quem enfrentaria o "fantasma" folga na rodada.
+    """
+    teams = list(team_ids)
+    if len(teams) % 2:
+        teams.append(None)
+    count = len(teams)
+    rounds = []
+    for number in range(count - 1):
+        pairs = []
+        for i in range(count // 2):
+            home, away = teams[i], teams[count - 1 - i]
+            if home is None or away is None:
+                continue
+            # Alterna o mando da equipe fixa a cada rodada
+            pairs.append((away, home) if i == 0 and number % 2 else (home, away))
+        rounds.append(pairs)
+        teams = [teams[0], teams[-1]] + teams[1:-1]
+    if legs == 2:
+        rounds += [[(away, home) for home, away in pairs] for pairs in rounds]
+    return rounds
+
+
+def seed_order(size):
+    """Posição dos cabeças de chave num chaveamento de `size` vagas (1 e 2 só se cruzam na final)"""
+    seeds = [1]
+    while len(seeds) < size:
+        total = len(seeds) * 2 + 1
+        seeds = [seed for current in seeds for seed in (current, total - current)]
+    return seeds
+
+
+class SlotPlanner:
+    """
+    Distribui os jogos em horários (start + n * slot) e locais sem choque,
+    com as mesmas regras de services.conflicts: um jogo ocupa o local e as
+    duas equipes por `duration` (GAME_DURATION_MINUTES) e locais que só
+    diferem em maiúsculas/espaços são o mesmo. Jogos já cadastrados e os já
+    distribuídos pelo planner contam como ocupados. Cada rodada só começa
+    depois do fim (início + duration) do último jogo da anterior, já que no
+    mata-mata as equipes da rodada seguinte ainda não são conhecidas.
+    """
+
+    def __init__(self, start, slot, venues, existing=(), duration=None):
+        self.start = start
+        self.slot = slot
+        self.duration = duration or slot
+        self.venues = venues
+        self.row = 0
+        self._venue_busy = defaultdict(list)
+        self._team_busy = defaultdict(list)
+        for game_date, location, team_a_id, team_b_id in existing:
+            if conflicts.venue_key(location):
+                self._venue_busy[conflicts.venue_key(location)].append(game_date)
+            self._team_busy[team_a_id].append(game_date)
+            self._team_busy[team_b_id].append(game_date)
+        for starts in (*self._venue_busy.values(), *self._team_busy.values()):
+            starts.sort()
+
+    def _free(self, busy, key, moment):
+        starts = busy.get(key)
+        if not starts:
+            return True
+        index = bisect_right(starts, moment - self.duration)
+        return index == len(starts) or starts[index] >= moment + self.duration
+
+    def place_round(self, pairs):
+        """Retorna [(game_date, location)] na mesma ordem de pairs"""
+        placements = [None] * len(pairs)
+        pending = list(range(len(pairs)))
+        row = self.row
+        while pending:
+            if row - self.row > MAX_ROWS_SCANNED:
+                raise FixtureError('Não há horários livres suficientes para a tabela')
+            moment = self.start + row * self.slot
+            free_venues = [venue for venue in self.venues
+                           if self._free(self._venue_busy, conflicts.venue_key(venue), moment)]
+            remaining = []
+            for index in pending:
+                teams = [team for team in pairs[index] if team]
+                if free_venues and all(self._free(self._team_busy, team, moment) for team in teams):
+                    venue = free_venues.pop(0)
+                    placements[index] = (moment, venue)
+                    # Ocupa o local e as equipes para as próximas linhas e rodadas
+                    insort(self._venue_busy[conflicts.venue_key(venue)], moment)
+                    for team in teams:
+                        insort(self._team_busy[team], moment)
+                else:
+                    remaining.append(index)
+            pending = remaining
+            row += 1
+        if placements:
+            last = max(moment for moment, _ in placements)
+            row = max(row, math.ceil((last + self.duration - self.start) / self.slot))
+        self.row = row
+        return placements
+
+
+def _existing_games(start, duration):
+    # Faixa de horário no SQL, locais e equipes filtrados pelo planner
+    # (venue_key em Python, como em services.conflicts)
+    return db.session.query(Game.game_date, Game.location, Game.team_a_id, Game.team_b_id) \
+        .filter(Game.game_date > start - duration, Game.status != conflicts.CANCELLED) \
+        .all()
+
+
+def _unique_venues(venues):
+    """Remove espaços e repetições (sem diferenciar maiúsculas), mantendo o primeiro nome"""
+    unique = {}
+    for venue in venues:
+        unique.setdefault(conflicts.venue_key(venue), venue.strip())
+    return list(unique.values())
+
+
+def _validate(sport_id, team_ids, venues, slot_minutes):
+    if not Sport.query.get(sport_id):
+        raise FixtureError('Modalidade não encontrada', 404)
+    if not isinstance(team_ids, list) or len(team_ids) < 2:
+        raise FixtureError('Informe ao menos duas equipes')
+    if len(team_ids) > MAX_TEAMS:
+        raise FixtureError(f'No máximo {MAX_TEAMS} equipes por tabela')
+    if len(set(team_ids)) != len(team_ids):
+        raise FixtureError('Equipes repetidas na lista')
+    found = {team_id for team_id, in db.session.query(Team.team_id).filter(Team.team_id.in_(team_ids))}
+    missing = [team_id for team_id in team_ids if team_id not in found]
+    if missing:
+        raise FixtureError(f'Equipes não encontradas: {", ".join(missing)}', 404)
+    if not isinstance(venues, list) or not venues or not all(isinstance(v, str) and v.strip() for v in venues):
+        raise FixtureError('Informe ao menos um local')
+    if not isinstance(slot_minutes, int) or isinstance(slot_minutes, bool) or slot_minutes <= 0:
+        raise FixtureError('Duração do horário inválida')
+
+
+def _game_values(sport_id, team_a_id, team_b_id, game_date, location):
+    return {
+        'game_id': str(uuid.uuid4()),
+        'sport_id': sport_id,
+        'team_a_id': team_a_id,
+        'team_b_id': team_b_id,
+        'game_date': game_date,
+        'location': location,
+        'status': 'Agendado'
+    }
+
+
+def generate(sport_id, team_ids, start, slot_minutes, venues, format='round_robin', legs=1, dry_run=False):
+    """
+    Gera a tabela de uma modalidade e insere os jogos em lote na transação
+    corrente. Retorna {'format', 'bracket_id', 'rounds', 'games', 'slots'};
+    em dry_run só calcula o plano.
+    """
+    if format not in FORMATS:
+        raise FixtureError('Formato inválido. Use round_robin ou knockout.')
+    if legs not in (1, 2):
+        raise FixtureError('Use 1 ou 2 turnos')
+    _validate(sport_id, team_ids, venues, slot_minutes)
+    # Mesmo tratamento de horário e local que a checagem de conflitos
+    start = conflicts.naive(start)
+    venues = _unique_venues(venues)
+    duration = conflicts.game_duration()
+    planner = SlotPlanner(start, timedelta(minutes=slot_minutes), venues,
+                          _existing_games(start, duration), duration)
+
+    if format == 'round_robin':
+        rounds = round_robin(team_ids, legs)
+        games = []
+        for pairs in rounds:
+            for (team_a_id, team_b_id), (game_date, location) in zip(pairs, planner.place_round(pairs)):
+                games.append(_game_values(sport_id, team_a_id, team_b_id, game_date, location))
+        if not dry_run:
+            bulk_games.insert_games(games)
+        return {'format': format, 'bracket_id': None, 'rounds': len(rounds), 'games': games, 'slots': []}
+
+    return _knockout(sport_id, team_ids, planner, dry_run)
+
+
+def _knockout(sport_id, team_ids, planner, dry_run):
+    bracket_id = str(uuid.uuid4())
+    size = 1 << (len(team_ids) - 1).bit_length()
+    rounds = size.bit_length() - 1
+    entrants = [team_ids[seed - 1] if seed <= len(team_ids) else None for seed in seed_order(size)]
+
+    # Vagas de todas as rodadas, ligadas à vaga seguinte
+    slots = {}
+    for number in range(rounds, 0, -1):
+        for position in range(size >> number):
+            following = slots.get((number + 1, position // 2))
+            slots[(number, position)] = {
+                'slot_id': str(uuid.uuid4()),
+                'bracket_id': bracket_id,
+                'sport_id': sport_id,
+                'round': number,
+                'position': position,
+                'team_a_id': entrants[2 * position] if number == 1 else None,
+                'team_b_id': entrants[2 * position + 1] if number == 1 else None,
+                'game_id': None,
+                'game_date': None,
+                'location': None,
+                'next_slot_id': following['slot_id'] if following else None,
+                'next_side': ('a' if position % 2 == 0 else 'b') if following else None
+            }
+
+    # Byes: a equipe sem adversário já ocupa a vaga da segunda rodada
+    byes = set()
+    for position in range(size >> 1):
+        slot = slots[(1, position)]
+        if slot['team_a_id'] is None or slot['team_b_id'] is None:
+            byes.add(position)
+            following = slots[(2, position // 2)]
+            following['team_a_id' if slot['next_side'] == 'a' else 'team_b_id'] = slot['team_a_id'] or slot['team_b_id']
+
+    games = []
+    for number in range(1, rounds + 1):
+        playable = [slots[(number, position)] for position in range(size >> number)
+                    if not (number == 1 and position in byes)]
+        pairs = [(slot['team_a_id'], slot['team_b_id']) for slot in playable]
+        for slot, (game_date, location) in zip(playable, planner.place_round(pairs)):
+            slot['game_date'], slot['location'] = game_date, location
+            if slot['team_a_id'] and slot['team_b_id']:
+                game = _game_values(sport_id, slot['team_a_id'], slot['team_b_id'], game_date, location)
+                slot['game_id'] = game['game_id']
+                games.append(game)
+
+    # Rodadas finais primeiro, para que next_slot_id já exista no INSERT
+    ordered = sorted(slots.values(), key=lambda slot: (-slot['round'], slot['position']))
+    if not dry_run:
+        bulk_games.insert_games(games)
+        db.session.execute(insert(BracketSlot), ordered)
+    return {'format': 'knockout', 'bracket_id': bracket_id, 'rounds': rounds, 'games': games,
+            'slots': sorted(ordered, key=lambda slot: (slot['round'], slot['position']))}
+
+
+def advance(game, check_conflicts=True):
+    """
+    Leva o vencedor de um jogo finalizado de chaveamento para a vaga
+    seguinte, criando o próximo jogo quando os dois lados estiverem
+    definidos. Se o jogo seguinte já existe e ainda não começou, troca a
+    equipe (resultado corrigido). Roda na transação corrente; com
+    check_conflicts, um choque do jogo seguinte levanta FixtureError 409.
+    """
+    if game.status != FINISHED or not game.winner_team_id:
+        return None
+    slot = BracketSlot.query.filter_by(game_id=game.game_id).first()
+    if slot is None or slot.next_slot_id is None:
+        return None
+
+    following = db.session.get(BracketSlot, slot.next_slot_id)
+    side = 'team_a_id' if slot.next_side == 'a' else 'team_b_id'
+    setattr(following, side, game.winner_team_id)
+
+    if following.game_id is None:
+        if following.team_a_id and following.team_b_id:
+            next_game = Game(**_game_values(following.sport_id, following.team_a_id, following.team_b_id,
+                                            following.game_date, following.location))
+            db.session.add(next_game)
+            following.game_id = next_game.game_id
+            return _checked(next_game, check_conflicts)
+        return None
+
+    next_game = db.session.get(Game, following.game_id)
+    if next_game is not None and next_game.status == 'Agendado':
+        setattr(next_game, side, game.winner_team_id)
+        return _checked(next_game, check_conflicts)
+    return next_game
+
+
+def _checked(next_game, check_conflicts):
+    if check_conflicts:
+        clashes = conflicts.check_game(next_game)
+        if clashes:
+            raise FixtureError('Conflito de horário no próximo jogo do chaveamento', 409, conflicts=clashes)
+    return next_game
+
+
+def detach_game(game_id):
+    """Desvincula o jogo excluído da sua vaga de chaveamento"""
+    BracketSlot.query.filter_by(game_id=game_id).update({'game_id': None}, synchronize_session=False)
@@ -0,0 +1,119 @@
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # brotli é opcional; sem ele usamos apenas gzip
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {'application/json', 'application/x-ndjson', 'text/calendar', 'text/csv', 'text/plain'}
+PRIVATE_PREFIXES = ('/api/admin', '/api/internal', '/api/users', '/api/profile', '/api/verify-admin', '/api/login')
+ENCODING_SUFFIXES = {'gzip': '-gzip', 'br': '-br'}
+
+
+def compute_etag(body):
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class _CompressedBodies:
+    """LRU pequeno dos corpos já comprimidos, indexado por (etag, encoding)"""
+
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compress(self, etag, encoding, body, level):
+        key = (etag, encoding)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+        if encoding == 'br':
+            compressed = brotli.compress(body, quality=level)
+        else:
+            compressed = gzip.compress(body, compresslevel=level, mtime=0)
+        with self._lock:
+            self._entries[key] = compressed
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compressed
+
+
+_compressed = _CompressedBodies()
+
+
+def _is_public(path):
+    return path.startswith('/api') and not path.startswith(PRIVATE_PREFIXES) \
+        and 'Authorization' not in request.headers
+
+
+def _choose_encoding():
+    if brotli is not None and request.accept_encodings['br']:
+        return 'br'
+    if request.accept_encodings['gzip']:
+        return 'gzip'
+    return None
+
+
+def _matches(etag):
+    """If-None-Match contra o ETag da representação que seria enviada"""
+    if_none_match = request.if_none_match
+    if not if_none_match:
+        return False
+    return if_none_match.star_tag or if_none_match.contains_weak(etag)
+
+
+def init_app(app):
+    """
+    Registra a camada HTTP comum às respostas JSON: ETag forte com resposta
+    304 para If-None-Match, Cache-Control e compressão gzip/brotli acima de
+    COMPRESS_MIN_SIZE bytes.
+    """
+    max_age = app.config.get('PUBLIC_CACHE_MAX_AGE', 10)
+    min_size = app.config.get('COMPRESS_MIN_SIZE', 1024)
+    gzip_level = app.config.get('COMPRESS_GZIP_LEVEL', 6)
+    brotli_level = app.config.get('COMPRESS_BROTLI_LEVEL', 5)
+
+    @app.after_request
+    def conditional_and_compressed(response):
+        if request.method not in ('GET', 'HEAD') or response.status_code != 200:
+            return response
+        if response.is_streamed or response.direct_passthrough:
+            return response
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return response
+
+        if 'Cache-Control' not in response.headers:
+            if _is_public(request.path):
+                response.headers['Cache-Control'] = f'public, max-age={max_age}'
+            else:
+                response.headers['Cache-Control'] = 'private, no-cache'
+
+        body = response.get_data()
+        etag = response.get_etag()[0] or compute_etag(body)
+        response.vary.add('Accept-Encoding')
+
+        # Cada codificação é uma representação com ETag próprio (sufixo
+        # -gzip/-br): o mesmo valor é comparado no If-None-Match e enviado
+        # tanto no 200 quanto no 304.
+        encoding = _choose_encoding()
+        if not encoding or len(body) < min_size or 'Content-Encoding' in response.headers:
+            encoding = None
+        representation = etag + ENCODING_SUFFIXES[encoding] if encoding else etag
+        response.set_etag(representation)
+
+        if _matches(representation):
+            response.status_code = 304
+            response.set_data(b'')
+            return response
+
+        if encoding:
+            level = brotli_level if encoding == 'br' else gzip_level
+            response.set_data(_compressed.get_or_compress(etag, encoding, body, level))
+            response.headers['Content-Encoding'] = encoding
+        return response
@@ -0,0 +1,48 @@
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional; sem ele fica o provider padrão do Flask
+    orjson = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Provider JSON do Flask baseado no orjson. Mantém as chaves ordenadas e
+    delega ao DefaultJSONProvider os tipos que o orjson não trata do mesmo
+    jeito (datetime continua no formato HTTP do Flask, Decimal, etc.).
+    """
+
+    def _options(self):
+        options = orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self._app.debug:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._options() | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+PROVIDERS = {
+    'orjson': OrjsonProvider,
+    'std': DefaultJSONProvider
+}
+
+
+def init_app(app):
+    """Registra o provider em JSON_PROVIDER (orjson quando instalado, senão std)"""
+    name = app.config.get('JSON_PROVIDER') or ('orjson' if orjson is not None else 'std')
+    if name not in PROVIDERS:
+        raise ValueError(f'Provider JSON desconhecido: {name}')
+    if name == 'orjson' and orjson is None:
+        name = 'std'
+    app.json = PROVIDERS[name](app)
+    app.config['JSON_PROVIDER'] = name
@@ -0,0 +1,274 @@
+import itertools
+import json
+import logging
+import select as select_module
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from sqlalchemy import event, func, or_, select
+from sqlalchemy.orm import Session
+from models.user import db
+from models.games import GameEvent
+
+# Stream de placares ao vivo (/api/games/live).
+#
+# As rotas de escrita chamam publish_change() antes do commit; o broker
+# configurado decide como o evento chega aos assinantes:
+#   memory   - fila em memória, entregue no after_commit (um único worker)
+#   database - tabela game_events gravada na mesma transação do jogo; os
+#              assinantes consultam a tabela e, no Postgres, são acordados
+#              por LISTEN/NOTIFY em vez de esperar o intervalo de polling.
+
+LIVE_FIELDS = ('status', 'score_a', 'score_b', 'winner_team_id')
+NOTIFY_CHANNEL = 'game_events'
+BATCH_SIZE = 100
+GAP_TIMEOUT = 30
+_PENDING_KEY = 'live_events'
+
+logger = logging.getLogger(__name__)
+
+
+def game_state(game):
+    """Campos acompanhados pelo stream, para comparar antes/depois da edição"""
+    return {field: getattr(game, field) for field in LIVE_FIELDS}
+
+
+def event_payload(game, changed):
+    return {
+        'game_id': game.game_id,
+        'sport_id': game.sport_id,
+        'status': game.status,
+        'score_a': int(game.score_a) if game.score_a is not None else None,
+        'score_b': int(game.score_b) if game.score_b is not None else None,
+        'winner_team_id': game.winner_team_id,
+        'changed': changed
+    }
+
+
+class MemoryBroker:
+    """Eventos em memória, com os últimos `retention` guardados para retomada"""
+
+    def __init__(self, retention=1000):
+        self._events = deque(maxlen=retention)
+        self._ids = itertools.count(1)
+        self._last_id = 0
+        self._cond = threading.Condition()
+
+    def stage(self, session, sport_id, game_id, data):
+        session.info.setdefault(_PENDING_KEY, []).append((sport_id, data))
+
+    def flush(self, pending):
+        with self._cond:
+            for sport_id, data in pending:
+                self._last_id = next(self._ids)
+                self._events.append((self._last_id, sport_id, data))
+            self._cond.notify_all()
+
+    def resume_point(self, last_event_id):
+        with self._cond:
+            # Sem Last-Event-ID, ou com um id de antes de um restart, o
+            # assinante passa a receber apenas os próximos eventos
+            if last_event_id is None or last_event_id > self._last_id:
+                return self._last_id
+            return last_event_id
+
+    def events_after(self, cursor, sport_id=None):
+        with self._cond:
+            events = [(event_id, data) for event_id, event_sport, data in self._events
+                      if event_id > cursor and (sport_id is None or event_sport == sport_id)]
+            return events, self._last_id
+
+    def wait(self, cursor, timeout):
+        with self._cond:
+            self._cond.wait_for(lambda: self._last_id > cursor, timeout)
+
+
+class DatabaseBroker:
+    """Eventos na tabela game_events, compartilhada entre workers e consultada por polling"""
+
+    def __init__(self, engine, poll_interval=1.0, retention=3600, gap_timeout=GAP_TIMEOUT):
+        self.engine = engine
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.gap_timeout = gap_timeout
+        self._staged = itertools.count(1)
+
+    def stage(self, session, sport_id, game_id, data):
+        session.add(GameEvent(game_id=game_id, sport_id=sport_id, payload=data))
+        # Poda periódica dos eventos antigos, sem job separado
+        if next(self._staged) % BATCH_SIZE == 0:
+            cutoff = datetime.utcnow() - timedelta(seconds=self.retention)
+            session.query(GameEvent).filter(GameEvent.created_at < cutoff).delete(synchronize_session=False)
+
+    def _last_id(self):
+        with self.engine.connect() as conn:
+            return conn.execute(func.max(GameEvent.event_id).select()).scalar() or 0
+
+    def resume_point(self, last_event_id):
+        last_id = self._last_id()
+        if last_event_id is None or last_event_id > last_id:
+            last_event_id = last_id
+        return last_event_id, {}
+
+    def events_after(self, cursor, sport_id=None):
+        """
+        O cursor é (último id lido, {id faltante: prazo}). O id vem de uma
+        sequence reservada no INSERT, mas a linha só aparece no commit: uma
+        transação mais lenta pode confirmar um id menor depois de um maior já
+        entregue. Os ids pulados ficam como lacunas, consultadas de novo até
+        aparecerem ou o prazo (gap_timeout, rollbacks nunca aparecem) vencer.
+        Sem filtrar a modalidade no SQL, porque só a sequência completa
+        distingue uma lacuna de um evento de outra modalidade.
+        """
+        position, gaps = cursor
+        now = time.monotonic()
+        gaps = {event_id: deadline for event_id, deadline in gaps.items() if deadline > now}
+        condition = GameEvent.event_id > position
+        if gaps:
+            condition = or_(condition, GameEvent.event_id.in_(gaps))
+        query = select(GameEvent.event_id, GameEvent.sport_id, GameEvent.payload) \
+            .where(condition).order_by(GameEvent.event_id).limit(BATCH_SIZE + len(gaps))
+        with self.engine.connect() as conn:
+            rows = conn.execute(query).all()
+
+        events = []
+        for event_id, event_sport, payload in rows:
+            if gaps.pop(event_id, None) is None:
+                # No máximo BATCH_SIZE lacunas por salto (faixas podadas ou reservadas em bloco)
+                for missing in range(max(position + 1, event_id - BATCH_SIZE), event_id):
+                    gaps[missing] = now + self.gap_timeout
+                position = event_id
+            if sport_id is None or event_sport == sport_id:
+                events.append((event_id, payload))
+        return events, (position, gaps)
+
+    def wait(self, cursor, timeout):
+        time.sleep(min(timeout, self.poll_interval))
+
+
+class PostgresBroker(DatabaseBroker):
+    """
+    DatabaseBroker com NOTIFY na transação de escrita e uma thread de LISTEN
+    por processo, que acorda os assinantes assim que o commit acontece. O
+    polling continua como rede de segurança, em intervalo maior.
+    """
+
+    def __init__(self, engine, poll_interval=5.0, retention=3600, gap_timeout=GAP_TIMEOUT):
+        super().__init__(engine, poll_interval, retention, gap_timeout)
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._listener = None
+        self._listener_lock = threading.Lock()
+
+    def stage(self, session, sport_id, game_id, data):
+        super().stage(session, sport_id, game_id, data)
+        session.execute(func.pg_notify(NOTIFY_CHANNEL, sport_id).select())
+
+    def _listen(self):
+        while True:
+            try:
+                connection = self.engine.raw_connection()
+                try:
+                    dbapi_connection = connection.driver_connection
+                    dbapi_connection.autocommit = True
+                    dbapi_connection.cursor().execute(f'LISTEN {NOTIFY_CHANNEL}')
+                    while True:
+                        if select_module.select([dbapi_connection], [], [], 60) == ([], [], []):
+                            continue
+                        dbapi_connection.poll()
+                        if dbapi_connection.notifies:
+                            dbapi_connection.notifies.clear()
+                            with self._cond:
+                                self._generation += 1
+                                self._cond.notify_all()
+                finally:
+                    connection.invalidate()
+            except Exception:
+                logger.exception('LISTEN %s interrompido; reconectando', NOTIFY_CHANNEL)
+                time.sleep(self.poll_interval)
+
+    def _ensure_listener(self):
+        with self._listener_lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen, name='live-listen', daemon=True)
+                self._listener.start()
+
+    def wait(self, cursor, timeout):
+        self._ensure_listener()
+        with self._cond:
+            generation = self._generation
+            self._cond.wait_for(lambda: self._generation != generation, min(timeout, self.poll_interval))
+
+
+broker = None
+
+
+def init_app(app, engine):
+    """Escolhe o broker em LIVE_BROKER (memory ou database)"""
+    global broker
+    name = app.config.get('LIVE_BROKER', 'memory')
+    poll_interval = app.config.get('LIVE_POLL_INTERVAL')
+    if name == 'memory':
+        broker = MemoryBroker(app.config.get('LIVE_EVENT_RETENTION', 1000))
+    elif name == 'database':
+        broker_class = PostgresBroker if engine.dialect.name == 'postgresql' else DatabaseBroker
+        options = {'poll_interval': poll_interval} if poll_interval else {}
+        broker = broker_class(engine, gap_timeout=app.config.get('LIVE_GAP_TIMEOUT', GAP_TIMEOUT), **options)
+    else:
+        raise ValueError(f'Broker de eventos desconhecido: {name}')
+
+
+def publish_change(before, game):
+    """
+    Publica o jogo no stream se algum dos campos acompanhados mudou. Deve ser
+    chamada antes do commit: a entrega só acontece se a transação confirmar.
+    """
+    after = game_state(game)
+    publish(game, [field for field in LIVE_FIELDS if before.get(field) != after[field]])
+
+
+def publish(game, changed):
+    """Publica o estado atual do jogo (objeto ou linha com os LIVE_FIELDS)"""
+    if broker is None or not changed:
+        return
+    data = json.dumps(event_payload(game, changed), separators=(',', ':'))
+    broker.stage(db.session, game.sport_id, game.game_id, data)
+
+
+@event.listens_for(Session, 'after_commit')
+def _deliver_pending(session):
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending and isinstance(broker, MemoryBroker):
+        broker.flush(pending)
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_pending(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def stream(last_event_id=None, sport_id=None, heartbeat=15, max_duration=300, retry_ms=3000):
+    """
+    Gera o corpo text/event-stream: eventos "game" com id crescente,
+    comentários de heartbeat e encerramento após max_duration segundos (o
+    EventSource reconecta sozinho enviando Last-Event-ID).
+    """
+    cursor = broker.resume_point(last_event_id)
+    started = last_sent = time.monotonic()
+    yield f'retry: {retry_ms}\n\n'
+    while True:
+        events, cursor_after = broker.events_after(cursor, sport_id)
+        for event_id, data in events:
+            yield f'id: {event_id}\nevent: game\ndata: {data}\n\n'
+        if events:
+            last_sent = time.monotonic()
+        cursor = cursor_after
+
+        now = time.monotonic()
+        if now - started >= max_duration:
+            return
+        if now - last_sent >= heartbeat:
+            yield ': ping\n\n'
+            last_sent = now
+        broker.wait(cursor, min(heartbeat - (now - last_sent), started + max_duration - now))
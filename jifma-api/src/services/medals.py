@@ -0,0 +1,184 @@
+from sqlalchemy import case, func
+from models.user import db
+from models.medals import MEDAL_TYPES, MedalAward, MedalStanding
+from models.teams import Team
+
+MEDAL_COLUMNS = {
+    'gold': MedalStanding.gold_medals,
+    'silver': MedalStanding.silver_medals,
+    'bronze': MedalStanding.bronze_medals
+}
+MEDAL_ALIASES = {'ouro': 'gold', 'prata': 'silver'}
+
+
+class MedalError(ValueError):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def normalize_medal_type(value):
+    medal_type = MEDAL_ALIASES.get(str(value or '').lower(), str(value or '').lower())
+    if medal_type not in MEDAL_TYPES:
+        raise MedalError('Tipo de medalha inválido. Use gold, silver ou bronze.')
+    return medal_type
+
+
+def _adjust_totals(team_id, medal_type, delta):
+    """Atualiza o total materializado da equipe na transação corrente"""
+    if delta == 0:
+        return
+    column = MEDAL_COLUMNS[medal_type]
+    updated = MedalStanding.query.filter_by(team_id=team_id).update(
+        {column: column + delta}, synchronize_session=False)
+    if not updated:
+        if delta < 0:
+            raise MedalError('Quadro de medalhas não encontrado para esta equipe', 404)
+        standing = MedalStanding(team_id=team_id, gold_medals=0, silver_medals=0, bronze_medals=0)
+        setattr(standing, column.key, delta)
+        db.session.add(standing)
+
+
+def award(sport_id, team_id, medal_type, game_id=None, user_id=None):
+    entry = MedalAward(
+        sport_id=sport_id,
+        team_id=team_id,
+        game_id=game_id,
+        medal_type=normalize_medal_type(medal_type),
+        kind='award',
+        delta=1,
+        created_by=user_id
+    )
+    db.session.add(entry)
+    _adjust_totals(team_id, entry.medal_type, 1)
+    return entry
+
+
+def detach_game(game_id):
+    """Mantém as medalhas do jogo excluído, apenas sem o vínculo com ele"""
+    MedalAward.query.filter_by(game_id=game_id).update({'game_id': None}, synchronize_session=False)
+
+
+def revoke(award_id, user_id=None):
+    original = MedalAward.query.get(award_id)
+    if not original or original.kind != 'award':
+        raise MedalError('Medalha não encontrada', 404)
+    if MedalAward.query.filter_by(revokes_award_id=award_id).first():
+        raise MedalError('Medalha já revogada')
+    entry = MedalAward(
+        sport_id=original.sport_id,
+        team_id=original.team_id,
+        game_id=original.game_id,
+        medal_type=original.medal_type,
+        kind='revoke',
+        delta=-1,
+        revokes_award_id=original.award_id,
+        created_by=user_id
+    )
+    db.session.add(entry)
+    _adjust_totals(original.team_id, original.medal_type, -1)
+    return entry
+
+
+def with_ranks(rows):
+    """
+    Adiciona a posição com empates (1, 1, 3...) a linhas já ordenadas por
+    ouro, prata e bronze.
+    """
+    previous, rank = None, 0
+    for index, row in enumerate(rows, start=1):
+        key = (row['gold_medals'], row['silver_medals'], row['bronze_medals'])
+        if key != previous:
+            rank, previous = index, key
+        row['rank'] = rank
+    return rows
+
+
+def sport_table(sport_id):
+    """Quadro de medalhas de uma modalidade, somado a partir do livro-razão"""
+    totals = [
+        func.sum(case((MedalAward.medal_type == medal_type, MedalAward.delta), else_=0)).label(medal_type)
+        for medal_type in MEDAL_TYPES
+    ]
+    rows = db.session.query(MedalAward.team_id, Team.name, *totals) \
+        .join(Team, MedalAward.team_id == Team.team_id) \
+        .filter(MedalAward.sport_id == sport_id) \
+        .group_by(MedalAward.team_id, Team.name) \
+        .all()
+    result = [{
+        'team_id': team_id,
+        'team_name': team_name,
+        'gold_medals': int(gold or 0),
+        'silver_medals': int(silver or 0),
+        'bronze_medals': int(bronze or 0),
+        'total_medals': int((gold or 0) + (silver or 0) + (bronze or 0))
+    } for team_id, team_name, gold, silver, bronze in rows]
+    result = [row for row in result if row['total_medals'] > 0]
+    result.sort(key=lambda r: (-r['gold_medals'], -r['silver_medals'], -r['bronze_medals'], r['team_name']))
+    return with_ranks(result)
+
+
+def _ledger_sums(team_id=None):
+    """{team_id: {medal_type: soma dos deltas}} a partir do livro-razão"""
+    totals = [
+        func.sum(case((MedalAward.medal_type == medal_type, MedalAward.delta), else_=0)).label(medal_type)
+        for medal_type in MEDAL_TYPES
+    ]
+    query = db.session.query(MedalAward.team_id, *totals).group_by(MedalAward.team_id)
+    if team_id is not None:
+        query = query.filter(MedalAward.team_id == team_id)
+    return {row[0]: dict(zip(MEDAL_TYPES, (int(value or 0) for value in row[1:]))) for row in query}
+
+
+def set_totals(team_id, targets, user_id=None):
+    """
+    Ajuste manual do quadro: grava lançamentos kind='adjustment' com a
+    diferença entre o total pedido e a soma do livro-razão, de modo que
+    totais e livro-razão continuem iguais. targets: {medal_type: total}.
+    Retorna os lançamentos criados.
+    """
+    for medal_type, target in targets.items():
+        if medal_type not in MEDAL_TYPES:
+            raise MedalError('Tipo de medalha inválido. Use gold, silver ou bronze.')
+        if not isinstance(target, int) or isinstance(target, bool) or target < 0:
+            raise MedalError('Quantidade de medalhas inválida')
+
+    sums = _ledger_sums(team_id).get(team_id, dict.fromkeys(MEDAL_TYPES, 0))
+    standing = MedalStanding.query.filter_by(team_id=team_id).first()
+    entries = []
+    for medal_type, target in targets.items():
+        delta = target - sums[medal_type]
+        if delta:
+            entries.append(MedalAward(team_id=team_id, medal_type=medal_type, kind='adjustment',
+                                      delta=delta, created_by=user_id))
+        if standing is not None:
+            setattr(standing, MEDAL_COLUMNS[medal_type].key, target)
+    db.session.add_all(entries)
+    return entries
+
+
+def diff():
+    """Equipes cujo total materializado difere do livro-razão: [(team_id, atual, livro)]"""
+    sums = _ledger_sums()
+    standings = {standing.team_id: standing for standing in MedalStanding.query.all()}
+    differences = []
+    for team_id in sorted(set(sums) | set(standings)):
+        expected = sums.get(team_id, dict.fromkeys(MEDAL_TYPES, 0))
+        standing = standings.get(team_id)
+        actual = {medal_type: getattr(standing, MEDAL_COLUMNS[medal_type].key) if standing else 0
+                  for medal_type in MEDAL_TYPES}
+        if actual != expected:
+            differences.append((team_id, actual, expected))
+    return differences
+
+
+def rebuild():
+    """Recalcula os totais materializados a partir do livro-razão"""
+    for team_id, _, expected in diff():
+        standing = MedalStanding.query.filter_by(team_id=team_id).first()
+        if standing is None:
+            standing = MedalStanding(team_id=team_id)
+            db.session.add(standing)
+        for medal_type, value in expected.items():
+            setattr(standing, MEDAL_COLUMNS[medal_type].key, value)
+    db.session.commit()
@@ -0,0 +1,266 @@
+from datetime import datetime
+import uuid
+from sqlalchemy import inspect, text
+from models.user import db
+
+# Lista ordenada de migrações: (versão, descrição, função que recebe a conexão)
+MIGRATIONS = []
+
+
+def migration(version, description):
+    def register(fn):
+        MIGRATIONS.append((version, description, fn))
+        return fn
+    return register
+
+
+def create_index(conn, name, table, columns, unique=False):
+    """CREATE INDEX IF NOT EXISTS funciona tanto no SQLite quanto no Postgres"""
+    kind = 'UNIQUE INDEX' if unique else 'INDEX'
+    conn.execute(text(f'CREATE {kind} IF NOT EXISTS {name} ON {table} ({", ".join(columns)})'))
+
+
+def add_column(conn, table, column, ddl):
+    """ADD COLUMN só quando a coluna ainda não existe (o SQLite não tem IF NOT EXISTS)"""
+    if column in {c['name'] for c in inspect(conn).get_columns(table)}:
+        return
+    conn.execute(text(f'ALTER TABLE {table} ADD COLUMN {column} {ddl}'))
+
+
+def _ensure_migrations_table(conn):
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS schema_migrations ('
+        'version VARCHAR(64) PRIMARY KEY, '
+        'description VARCHAR(255) NOT NULL, '
+        'applied_at TIMESTAMP NOT NULL)'
+    ))
+
+
+def applied_versions(conn):
+    _ensure_migrations_table(conn)
+    return {row[0] for row in conn.execute(text('SELECT version FROM schema_migrations'))}
+
+
+def upgrade(engine=None, log=print):
+    """Aplica, em ordem, as migrações ainda não registradas em schema_migrations"""
+    engine = engine or db.engine
+    applied = []
+    with engine.begin() as conn:
+        done = applied_versions(conn)
+    for version, description, fn in sorted(MIGRATIONS, key=lambda m: m[0]):
+        if version in done:
+            continue
+        with engine.begin() as conn:
+            log(f'Aplicando {version}: {description}')
+            fn(conn)
+            conn.execute(
+                text('INSERT INTO schema_migrations (version, description, applied_at) '
+                     'VALUES (:version, :description, :applied_at)'),
+                {'version': version, 'description': description, 'applied_at': datetime.utcnow()}
+            )
+        applied.append(version)
+    return applied
+
+
+@migration('0001', 'Índices nas colunas das consultas públicas')
+def _hot_query_indexes(conn):
+    duplicated = conn.execute(text(
+        'SELECT team_id FROM medal_standings GROUP BY team_id HAVING COUNT(*) > 1'
+    )).first()
+    if duplicated:
+        raise RuntimeError(
+            f'Quadro de medalhas duplicado para a equipe {duplicated[0]}; '
+            'remova as linhas repetidas antes de migrar.'
+        )
+
+    create_index(conn, 'ix_games_game_date', 'games', ['game_date', 'game_id'])
+    create_index(conn, 'ix_games_sport_date', 'games', ['sport_id', 'game_date'])
+    create_index(conn, 'ix_games_status_date', 'games', ['status', 'game_date'])
+    create_index(conn, 'ix_games_team_a', 'games', ['team_a_id'])
+    create_index(conn, 'ix_games_team_b', 'games', ['team_b_id'])
+    create_index(conn, 'ix_games_winner', 'games', ['winner_team_id'])
+    create_index(conn, 'ix_news_publication_date', 'news', ['publication_date', 'news_id'])
+    create_index(conn, 'ux_medal_standings_team', 'medal_standings', ['team_id'], unique=True)
+
+
+@migration('0002', 'Versão do token dos usuários')
+def _user_token_version(conn):
+    add_column(conn, 'users', 'token_version', 'INTEGER NOT NULL DEFAULT 0')
+
+
+@migration('0003', 'Resumo pré-calculado das notícias')
+def _news_summary(conn):
+    from models.news import EXCERPT_LENGTH, summarize
+
+    add_column(conn, 'news', 'excerpt', f'VARCHAR({EXCERPT_LENGTH + 1})')
+    add_column(conn, 'news', 'word_count', 'INTEGER NOT NULL DEFAULT 0')
+    add_column(conn, 'news', 'reading_time', 'INTEGER NOT NULL DEFAULT 1')
+
+    rows = conn.execute(text('SELECT news_id, content FROM news WHERE excerpt IS NULL')).fetchall()
+    for news_id, content in rows:
+        excerpt, word_count, reading_time = summarize(content)
+        conn.execute(
+            text('UPDATE news SET excerpt = :excerpt, word_count = :word_count, '
+                 'reading_time = :reading_time WHERE news_id = :news_id'),
+            {'excerpt': excerpt, 'word_count': word_count, 'reading_time': reading_time, 'news_id': news_id}
+        )
+
+
+@migration('0004', 'Índice de busca textual das notícias')
+def _news_search_index(conn):
+    from services import search
+    search.create_index(conn)
+
+
+@migration('0005', 'Tabelas de tags e conversão das tags separadas por vírgula')
+def _normalized_tags(conn):
+    from models.tags import Tag, news_tags, slugify
+    from services.tags import normalize_tags
+
+    Tag.__table__.create(conn, checkfirst=True)
+    news_tags.create(conn, checkfirst=True)
+
+    tags = {row.slug: row.tag_id for row in conn.execute(text('SELECT slug, tag_id FROM tags'))}
+    counts = {}
+    rows = conn.execute(text("SELECT news_id, tags FROM news WHERE tags IS NOT NULL AND tags <> ''")).fetchall()
+    for news_id, value in rows:
+        names = normalize_tags(value)
+        for name in names:
+            slug = slugify(name)
+            if slug not in tags:
+                tags[slug] = str(uuid.uuid4())
+                conn.execute(text('INSERT INTO tags (tag_id, name, slug, news_count) VALUES (:tag_id, :name, :slug, 0)'),
+                             {'tag_id': tags[slug], 'name': name, 'slug': slug})
+            conn.execute(text('INSERT INTO news_tags (news_id, tag_id) VALUES (:news_id, :tag_id)'),
+                         {'news_id': news_id, 'tag_id': tags[slug]})
+            counts[tags[slug]] = counts.get(tags[slug], 0) + 1
+        conn.execute(text('UPDATE news SET tags = :tags WHERE news_id = :news_id'),
+                     {'tags': ','.join(names) or None, 'news_id': news_id})
+    for tag_id, count in counts.items():
+        conn.execute(text('UPDATE tags SET news_count = news_count + :count WHERE tag_id = :tag_id'),
+                     {'count': count, 'tag_id': tag_id})
+
+
+@migration('0006', 'Tabela de classificação por modalidade')
+def _standings(conn):
+    from models.standings import TeamStanding
+    from services import standings
+
+    TeamStanding.__table__.create(conn, checkfirst=True)
+    # A carga inicial usa o mesmo cálculo do comando rebuild-standings
+    totals = standings.aggregate(conn.execute(text(
+        "SELECT sport_id, team_a_id, team_b_id, score_a, score_b FROM games "
+        "WHERE status = :status AND score_a IS NOT NULL AND score_b IS NOT NULL"
+    ), {'status': standings.FINISHED}))
+    conn.execute(text('DELETE FROM standings'))
+    for (sport_id, team_id), row in totals.items():
+        conn.execute(TeamStanding.__table__.insert().values(sport_id=sport_id, team_id=team_id, **row))
+
+
+def _backfill_medal_ledger(conn):
+    """
+    Lança como ajuste (kind='adjustment', sem modalidade) a diferença entre o
+    quadro materializado e a soma do livro-razão, para que os totais gravados
+    antes do livro-razão, ou editados direto na tabela, não se percam num
+    recálculo. Sem diferença, não grava nada.
+    """
+    from models.medals import MEDAL_TYPES, MedalAward
+
+    columns = {'gold': 'gold_medals', 'silver': 'silver_medals', 'bronze': 'bronze_medals'}
+    ledger = {}
+    for team_id, medal_type, total in conn.execute(text(
+        'SELECT team_id, medal_type, SUM(delta) FROM medal_awards GROUP BY team_id, medal_type'
+    )):
+        ledger[(team_id, medal_type)] = int(total or 0)
+
+    entries = []
+    now = datetime.utcnow()
+    for row in conn.execute(text(
+        'SELECT team_id, gold_medals, silver_medals, bronze_medals FROM medal_standings'
+    )).mappings():
+        for medal_type in MEDAL_TYPES:
+            delta = (row[columns[medal_type]] or 0) - ledger.get((row['team_id'], medal_type), 0)
+            if delta:
+                entries.append({'award_id': str(uuid.uuid4()), 'sport_id': None, 'team_id': row['team_id'],
+                                'game_id': None, 'medal_type': medal_type, 'kind': 'adjustment', 'delta': delta,
+                                'revokes_award_id': None, 'created_by': None, 'created_at': now})
+    if entries:
+        conn.execute(MedalAward.__table__.insert(), entries)
+
+
+@migration('0007', 'Livro-razão de medalhas por modalidade')
+def _medal_ledger(conn):
+    from models.medals import MedalAward
+
+    MedalAward.__table__.create(conn, checkfirst=True)
+    create_index(conn, 'ix_medal_standings_ranking', 'medal_standings',
+                 ['gold_medals', 'silver_medals', 'bronze_medals'])
+    _backfill_medal_ledger(conn)
+
+
+@migration('0008', 'Tabela de eventos do stream de placares ao vivo')
+def _game_events(conn):
+    from models.games import GameEvent
+
+    GameEvent.__table__.create(conn, checkfirst=True)
+
+
+@migration('0009', 'Versão dos jogos para controle otimista de concorrência')
+def _game_version(conn):
+    add_column(conn, 'games', 'version', 'INTEGER NOT NULL DEFAULT 1')
+
+
+@migration('0010', 'Vagas dos chaveamentos eliminatórios')
+def _bracket_slots(conn):
+    from models.fixtures import BracketSlot
+
+    BracketSlot.__table__.create(conn, checkfirst=True)
+
+
+@migration('0011', 'Versões dos caches compartilhadas entre instâncias')
+def _cache_versions(conn):
+    from models.cache_versions import CacheVersion
+
+    CacheVersion.__table__.create(conn, checkfirst=True)
+
+
+@migration('0012', 'Ajustes manuais no livro-razão de medalhas')
+def _medal_adjustments(conn):
+    from models.medals import MedalAward
+
+    columns = {column['name']: column for column in inspect(conn).get_columns('medal_awards')}
+    if 'kind' not in columns or not columns['sport_id']['nullable']:
+        if conn.dialect.name == 'sqlite':
+            # O SQLite não altera NOT NULL: recria a tabela e copia os lançamentos
+            conn.execute(text('ALTER TABLE medal_awards RENAME TO medal_awards_old'))
+            for index in MedalAward.__table__.indexes:
+                conn.execute(text(f'DROP INDEX IF EXISTS {index.name}'))
+            MedalAward.__table__.create(conn)
+            conn.execute(text(
+                'INSERT INTO medal_awards (award_id, sport_id, team_id, game_id, medal_type, kind, delta, '
+                'revokes_award_id, created_by, created_at) '
+                'SELECT award_id, sport_id, team_id, game_id, medal_type, '
+                "CASE WHEN revokes_award_id IS NULL THEN 'award' ELSE 'revoke' END, delta, "
+                'revokes_award_id, created_by, created_at FROM medal_awards_old'
+            ))
+            conn.execute(text('DROP TABLE medal_awards_old'))
+        else:
+            conn.execute(text('ALTER TABLE medal_awards ALTER COLUMN sport_id DROP NOT NULL'))
+            add_column(conn, 'medal_awards', 'kind', "VARCHAR(20) NOT NULL DEFAULT 'award'")
+            conn.execute(text("UPDATE medal_awards SET kind = 'revoke' WHERE revokes_award_id IS NOT NULL"))
+    _backfill_medal_ledger(conn)
+
+
+@migration('0013', 'Lançamentos de medalhas sobrevivem à exclusão do jogo')
+def _medal_award_game_fk(conn):
+    # O SQLite não aplica as chaves estrangeiras aqui (PRAGMA foreign_keys
+    # desligado) e a rota de exclusão já desvincula os lançamentos
+    if conn.dialect.name == 'sqlite':
+        return
+    for fk in inspect(conn).get_foreign_keys('medal_awards'):
+        if fk['referred_table'] == 'games' and fk['constrained_columns'] == ['game_id']:
+            conn.execute(text(f'ALTER TABLE medal_awards DROP CONSTRAINT {fk["name"]}'))
+    conn.execute(text(
+        'ALTER TABLE medal_awards ADD CONSTRAINT medal_awards_game_id_fkey '
+        'FOREIGN KEY (game_id) REFERENCES games (game_id) ON DELETE SET NULL'
+    ))
@@ -0,0 +1,73 @@
+import base64
+import json
+from datetime import datetime
+from flask import request
+from sqlalchemy import tuple_
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+class PaginationError(ValueError):
+    pass
+
+
+def encode_cursor(sort_value, row_id):
+    """Gera um cursor opaco a partir da chave de ordenação da última linha"""
+    if isinstance(sort_value, datetime):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Retorna (data, id) a partir de um cursor gerado por encode_cursor"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(sort_value), str(row_id)
+    except Exception:
+        raise PaginationError('Cursor inválido')
+
+
+def parse_date_arg(name):
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise PaginationError(f'Formato de data inválido em {name}. Use ISO format.')
+
+
+def wants_page():
+    """A paginação só é aplicada quando o cliente informa limit ou cursor"""
+    return 'limit' in request.args or 'cursor' in request.args
+
+
+def parse_page_args():
+    try:
+        limit = int(request.args.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        raise PaginationError('Parâmetro limit inválido')
+    limit = max(1, min(limit, MAX_LIMIT))
+    cursor = request.args.get('cursor')
+    return limit, decode_cursor(cursor) if cursor else None
+
+
+def keyset_page(query, sort_column, id_column, limit, after, descending=False):
+    """
+    Aplica paginação por chave (keyset) sobre (sort_column, id_column).
+
+    Busca limit + 1 linhas para saber se existe uma próxima página sem
+    precisar de COUNT ou OFFSET. Retorna (linhas, tem_mais).
+    """
+    key = tuple_(sort_column, id_column)
+    if after is not None:
+        query = query.filter(key < after if descending else key > after)
+    if descending:
+        query = query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        query = query.order_by(sort_column.asc(), id_column.asc())
+    rows = query.limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
@@ -0,0 +1,63 @@
+from sqlalchemy import select, or_, text
+from sqlalchemy.orm import aliased
+from models.user import db
+from models.games import Game
+from models.news import News
+from models.teams import Team
+from models.sports import Sport
+from models.medals import MedalStanding
+from models.tags import Tag, news_tags
+
+SAMPLE_ID = '00000000-0000-0000-0000-000000000000'
+
+
+def public_queries():
+    """Consultas usadas pelas rotas públicas e pelas verificações administrativas"""
+    TeamA = aliased(Team, name='team_a')
+    TeamB = aliased(Team, name='team_b')
+    return [
+        ('GET /api/games', select(Game, TeamA.name, TeamB.name, Sport.name)
+            .join(TeamA, Game.team_a_id == TeamA.team_id)
+            .join(TeamB, Game.team_b_id == TeamB.team_id)
+            .join(Sport, Game.sport_id == Sport.sport_id)
+            .order_by(Game.game_date.asc(), Game.game_id.asc())),
+        ('GET /api/games?status=', select(Game)
+            .where(Game.status == 'Agendado')
+            .order_by(Game.game_date.asc())),
+        ('GET /api/games/sport/<sport_id>', select(Game)
+            .where(Game.sport_id == SAMPLE_ID)
+            .order_by(Game.game_date.asc())),
+        ('GET /api/news', select(News)
+            .order_by(News.publication_date.desc(), News.news_id.desc())),
+        ('GET /api/news?tag=', select(News)
+            .join(news_tags, news_tags.c.news_id == News.news_id)
+            .join(Tag, Tag.tag_id == news_tags.c.tag_id)
+            .where(Tag.slug == 'futsal')
+            .order_by(News.publication_date.desc(), News.news_id.desc())),
+        ('DELETE /api/admin/teams/<team_id>', select(Game)
+            .where(or_(Game.team_a_id == SAMPLE_ID,
+                       Game.team_b_id == SAMPLE_ID,
+                       Game.winner_team_id == SAMPLE_ID))
+            .limit(1)),
+        ('GET /api/admin/medals/<team_id>', select(MedalStanding)
+            .where(MedalStanding.team_id == SAMPLE_ID)),
+    ]
+
+
+def explain(statement, engine=None):
+    """Retorna as linhas do plano de execução da consulta no banco configurado"""
+    engine = engine or db.engine
+    sql = str(statement.compile(engine, compile_kwargs={'literal_binds': True}))
+    prefix = 'EXPLAIN QUERY PLAN ' if engine.dialect.name == 'sqlite' else 'EXPLAIN '
+    with engine.connect() as conn:
+        rows = conn.execute(text(prefix + sql)).fetchall()
+    if engine.dialect.name == 'sqlite':
+        return [row[-1] for row in rows]
+    return [row[0] for row in rows]
+
+
+def explain_public_queries(engine=None, log=print):
+    for name, statement in public_queries():
+        log(name)
+        for line in explain(statement, engine):
+            log(f'    {line}')
@@ -0,0 +1,80 @@
+from sqlalchemy import Integer, case, literal, or_, update
+from models.user import db
+from models.games import Game
+from services.standings import FINISHED
+
+SCORE_FIELDS = ('score_a', 'score_b')
+
+
+class ScoreError(ValueError):
+    def __init__(self, message, status=400, **extra):
+        super().__init__(message)
+        self.status = status
+        self.extra = extra
+
+
+def parse_score(value):
+    """
+    Converte o placar recebido para inteiro não negativo. None ou texto em
+    branco (campo apagado no painel) limpam o placar.
+    """
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return None
+    if isinstance(value, int) and not isinstance(value, bool):
+        score = value
+    elif isinstance(value, str) and value.strip().isdigit():
+        score = int(value)
+    else:
+        raise ScoreError('Placar inválido')
+    if score < 0:
+        raise ScoreError('Placar inválido')
+    return score
+
+
+def winner_of(team_a_id, team_b_id, score_a, score_b, current=None):
+    """Vencedor pelos placares inteiros; sem os dois placares mantém o atual"""
+    if score_a is None or score_b is None:
+        return current
+    if score_a > score_b:
+        return team_a_id
+    if score_b > score_a:
+        return team_b_id
+    return None  # Empate
+
+
+def update_score(game_id, version, scores):
+    """
+    Atualiza o placar de um jogo não finalizado com um único UPDATE
+    condicional (game_id, versão e status), calculando o vencedor no próprio
+    banco. Retorna a linha atualizada; em caso de falha levanta ScoreError
+    com 404 ou 409.
+    """
+    new_a = literal(scores['score_a'], Integer) if 'score_a' in scores else Game.score_a
+    new_b = literal(scores['score_b'], Integer) if 'score_b' in scores else Game.score_b
+    values = {field: scores[field] for field in SCORE_FIELDS if field in scores}
+    values['winner_team_id'] = case(
+        (or_(new_a.is_(None), new_b.is_(None)), Game.winner_team_id),
+        (new_a > new_b, Game.team_a_id),
+        (new_b > new_a, Game.team_b_id),
+        else_=None
+    )
+    values['version'] = Game.version + 1
+
+    statement = update(Game) \
+        .where(Game.game_id == game_id, Game.version == version, Game.status != FINISHED) \
+        .values(values) \
+        .returning(Game.game_id, Game.sport_id, Game.team_a_id, Game.team_b_id, Game.status,
+                   Game.score_a, Game.score_b, Game.winner_team_id, Game.version) \
+        .execution_options(synchronize_session=False)
+    row = db.session.execute(statement).first()
+    if row is not None:
+        return row
+
+    # Caminho de erro: descobrir por que nenhuma linha foi atualizada
+    current = db.session.query(Game.version, Game.status).filter(Game.game_id == game_id).first()
+    if current is None:
+        raise ScoreError('Jogo não encontrado', 404)
+    if current.status == FINISHED:
+        raise ScoreError('Jogo finalizado. Use a edição completa do jogo.', 409)
+    raise ScoreError('Placar desatualizado. Recarregue o jogo e tente novamente.', 409,
+                     version=current.version)
@@ -0,0 +1,91 @@
+import re
+from sqlalchemy import text
+from models.user import db
+from models.news import News
+
+# Busca textual das notícias.
+# SQLite: tabela virtual FTS5 news_fts, mantida pelas rotas de escrita.
+# Postgres: coluna gerada news.search_vector (tsvector) com índice GIN,
+# atualizada pelo próprio banco na mesma instrução do INSERT/UPDATE.
+
+FTS_LANGUAGE = 'portuguese'
+_WORDS = re.compile(r'\w+', re.UNICODE)
+
+
+def _dialect(bind=None):
+    return (bind or db.session.get_bind()).dialect.name
+
+
+def create_index(conn):
+    """Cria a estrutura de busca e indexa as notícias existentes"""
+    if conn.dialect.name == 'sqlite':
+        conn.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS news_fts USING fts5("
+            "news_id UNINDEXED, title, content, tokenize = 'unicode61 remove_diacritics 2')"
+        ))
+        conn.execute(text('DELETE FROM news_fts'))
+        conn.execute(text('INSERT INTO news_fts (news_id, title, content) SELECT news_id, title, content FROM news'))
+    elif conn.dialect.name == 'postgresql':
+        conn.execute(text(
+            f"ALTER TABLE news ADD COLUMN IF NOT EXISTS search_vector tsvector GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('{FTS_LANGUAGE}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{FTS_LANGUAGE}', coalesce(content, '')), 'B')) STORED"
+        ))
+        conn.execute(text('CREATE INDEX IF NOT EXISTS ix_news_search_vector ON news USING GIN (search_vector)'))
+
+
+def index_news(news):
+    """Atualiza o índice de uma notícia na transação corrente (antes do commit)"""
+    if _dialect() != 'sqlite':
+        return
+    db.session.execute(text('DELETE FROM news_fts WHERE news_id = :news_id'), {'news_id': news.news_id})
+    db.session.execute(
+        text('INSERT INTO news_fts (news_id, title, content) VALUES (:news_id, :title, :content)'),
+        {'news_id': news.news_id, 'title': news.title, 'content': news.content}
+    )
+
+
+def remove_news(news_id):
+    if _dialect() != 'sqlite':
+        return
+    db.session.execute(text('DELETE FROM news_fts WHERE news_id = :news_id'), {'news_id': news_id})
+
+
+def _sqlite_match(query):
+    # Cada termo vira um prefixo entre aspas, evitando erros de sintaxe do FTS5
+    return ' '.join(f'"{word}"*' for word in _WORDS.findall(query))
+
+
+def search_news(query, limit, offset):
+    """
+    Retorna até limit notícias que casam com a consulta, da mais relevante
+    para a menos relevante, como linhas com as colunas da projeção summary,
+    rank e snippet.
+    """
+    # Mesma ordem de News.SUMMARY_COLUMNS, lida por news_summary_row
+    columns = ', '.join(f'n.{name}' for name in News.SUMMARY_COLUMNS)
+    if _dialect() == 'sqlite':
+        match = _sqlite_match(query)
+        if not match:
+            return []
+        sql = text(
+            f"SELECT {columns}, bm25(news_fts, 0.0, 10.0, 1.0) AS rank, "
+            f"snippet(news_fts, 2, '<mark>', '</mark>', '…', 16) AS snippet "
+            f"FROM news_fts JOIN news n ON n.news_id = news_fts.news_id "
+            f"WHERE news_fts MATCH :match "
+            f"ORDER BY rank, n.news_id LIMIT :limit OFFSET :offset"
+        ).columns(publication_date=db.DateTime)
+        params = {'match': match, 'limit': limit, 'offset': offset}
+    else:
+        sql = text(
+            f"SELECT {columns}, rank, "
+            f"ts_headline('{FTS_LANGUAGE}', n.content, q, "
+            f"'StartSel=<mark>, StopSel=</mark>, MaxWords=16, MinWords=8') AS snippet "
+            f"FROM (SELECT news.*, ts_rank_cd(search_vector, q) AS rank, q "
+            f"      FROM news, websearch_to_tsquery('{FTS_LANGUAGE}', :query) q "
+            f"      WHERE search_vector @@ q "
+            f"      ORDER BY rank DESC, news_id LIMIT :limit OFFSET :offset) n "
+            f"ORDER BY rank DESC, n.news_id"
+        )
+        params = {'query': query, 'limit': limit, 'offset': offset}
+    return db.session.execute(sql, params).fetchall()
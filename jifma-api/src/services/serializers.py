@@ -0,0 +1,35 @@
+# Serializadores de linhas para as listagens somente leitura: a consulta
+# seleciona tuplas de colunas (sem hidratar objetos do ORM) e cada linha vira
+# um dict por uma função montada uma única vez por formato.
+
+
+def isoformat(value):
+    return value.isoformat() if value is not None else None
+
+
+def split_list(value):
+    return value.split(',') if value else []
+
+
+def row_serializer(names, **converters):
+    """
+    Retorna uma função que converte uma linha (tupla na ordem de names) em
+    dict, aplicando os conversores indicados por nome de coluna.
+    """
+    names = tuple(names)
+    unknown = set(converters) - set(names)
+    if unknown:
+        raise ValueError(f'Conversores para colunas inexistentes: {", ".join(sorted(unknown))}')
+    steps = tuple((names.index(name), convert) for name, convert in converters.items())
+
+    if not steps:
+        def serialize(row):
+            return dict(zip(names, row))
+        return serialize
+
+    def serialize(row):
+        values = list(row)
+        for index, convert in steps:
+            values[index] = convert(values[index])
+        return dict(zip(names, values))
+    return serialize
@@ -0,0 +1,305 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from flask import current_app
+from werkzeug.test import EnvironBuilder
+from models.user import db
+from models.games import Game, game_row
+from models.news import News, news_row
+from models.sports import Sport
+from models.teams import Team
+from services.cache import response_cache
+
+# Snapshots estáticos das leituras públicas, para o front-end buscar direto
+# do host estático/CDN. Cada documento é gravado com o hash do conteúdo no
+# nome (imutável, pode ter cache longo) e o manifest.json (cache curto)
+# aponta para a versão atual de cada um. Cada publicação compara as versões
+# do response_cache com as registradas na anterior e refaz só as listagens
+# das tabelas alteradas e os detalhes dos registros alterados
+# ('<tipo>:id:<id>'; '<tipo>:all' refaz todos os do tipo). Após o commit de
+# uma escrita de admin, o bump_version acorda uma thread do processo que
+# publica em segundo plano, fora da requisição; `flask publish-snapshots`
+# cobre ambientes sem threads de fundo (serverless) e publicações completas.
+
+MANIFEST = 'manifest.json'
+# Versões da última publicação; arquivos com '.' inicial não são publicados
+STATE = '.publish-state.json'
+LOCK = '.publish.lock'
+LOCK_TIMEOUT = 600
+HASH_LENGTH = 12
+
+# Listagens: nome -> (rota pública, tabelas das quais dependem). São geradas
+# pela própria rota, então o conteúdo é idêntico ao da API.
+LISTS = {
+    'games': ('/api/games', ('games', 'teams', 'sports')),
+    'news': ('/api/news?view=summary', ('news',)),
+    'teams': ('/api/teams', ('teams',)),
+    'sports': ('/api/sports', ('sports',)),
+    'medals': ('/api/medals', ('medals', 'teams')),
+}
+
+
+def _game_details(ids=None):
+    query = db.session.query(*Game.list_columns())
+    if ids is not None:
+        query = query.filter(Game.game_id.in_(ids))
+    for row in query:
+        yield row.game_id, game_row(row)
+
+
+def _news_details(ids=None):
+    query = db.session.query(*News.full_columns())
+    if ids is not None:
+        query = query.filter(News.news_id.in_(ids))
+    for row in query:
+        yield row.news_id, news_row(row)
+
+
+def _team_details(ids=None):
+    query = Team.query if ids is None else Team.query.filter(Team.team_id.in_(ids))
+    for team in query:
+        yield team.team_id, team.to_dict()
+
+
+def _sport_details(ids=None):
+    query = Sport.query if ids is None else Sport.query.filter(Sport.sport_id.in_(ids))
+    for sport in query:
+        yield sport.sport_id, sport.to_dict()
+
+
+# Detalhes por entidade (mesmo corpo de /api/<tipo>/<id>): tipo -> gerador de
+# (id, documento), de todos os registros ou só dos ids informados. Uma
+# consulta por tipo, sem passar pelas rotas.
+DETAILS = {
+    'games': _game_details,
+    'news': _news_details,
+    'teams': _team_details,
+    'sports': _sport_details,
+}
+
+
+class LocalTarget:
+    """
+    Destino em disco local (também usado nos testes); caminhos relativos com
+    '/'. O diretório deve ser exclusivo dos snapshots: arquivos .json que não
+    estejam no manifesto são apagados.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _path(self, name):
+        return os.path.join(self.directory, *name.split('/'))
+
+    def exists(self, name):
+        return os.path.exists(self._path(name))
+
+    def read(self, name):
+        try:
+            with open(self._path(name), 'rb') as source:
+                return source.read()
+        except FileNotFoundError:
+            return None
+
+    def write(self, name, body):
+        path = self._path(name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.snapshot-')
+        with os.fdopen(handle, 'wb') as output:
+            output.write(body)
+        os.replace(temp_path, path)
+
+    def delete(self, name):
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def lock(self, wait=60):
+        """
+        Exclusão entre publicadores (processos ou máquinas com o mesmo
+        diretório): arquivo criado com O_EXCL, considerado abandonado após
+        LOCK_TIMEOUT segundos.
+        """
+        path = self._path(LOCK)
+        os.makedirs(self.directory, exist_ok=True)
+        deadline = time.monotonic() + wait
+        while True:
+            try:
+                os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(path) > LOCK_TIMEOUT:
+                        os.remove(path)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.monotonic() >= deadline:
+                    raise RuntimeError('Outra publicação de snapshots está em andamento')
+                time.sleep(0.5)
+        try:
+            yield
+        finally:
+            self.delete(LOCK)
+
+    def list(self):
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                if filename.endswith('.json') and not filename.startswith('.'):
+                    yield os.path.relpath(os.path.join(root, filename), self.directory).replace(os.sep, '/')
+
+
+def hashed_name(name, body):
+    digest = hashlib.blake2b(body, digest_size=HASH_LENGTH // 2).hexdigest()
+    return f'{name}.{digest}.json'
+
+
+def _load(body):
+    return json.loads(body) if body else {}
+
+
+class SnapshotPublisher:
+    """
+    Publica os snapshots no destino configurado (SNAPSHOT_DIR). Todo o estado
+    fica no destino (manifest.json e .publish-state.json), então qualquer
+    processo pode publicar, um de cada vez (lock no destino). Com
+    SNAPSHOT_AUTO_PUBLISH, cada bump_version agenda uma publicação
+    incremental numa thread de fundo; escritas dentro de
+    SNAPSHOT_PUBLISH_DELAY segundos são publicadas juntas.
+    """
+
+    def __init__(self):
+        self.target = None
+        self.delay = 1.0
+        self._app = None
+        self._worker = None
+        self._pending = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._worker_lock = threading.Lock()
+
+    def init_app(self, app):
+        directory = app.config.get('SNAPSHOT_DIR')
+        app.extensions['snapshot_publisher'] = self
+        self.target = LocalTarget(directory) if directory else None
+        self.delay = app.config.get('SNAPSHOT_PUBLISH_DELAY', self.delay)
+        self._app = app if directory and app.config.get('SNAPSHOT_AUTO_PUBLISH', True) else None
+        response_cache.add_listener(self.schedule)
+
+    def schedule(self, tables=()):
+        """Agenda uma publicação em segundo plano (chamado após o commit, pelo bump_version)"""
+        if self._app is None:
+            return
+        self._idle.clear()
+        self._pending.set()
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name='snapshot-publisher', daemon=True)
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            self._pending.wait()
+            time.sleep(self.delay)
+            self._pending.clear()
+            app = self._app
+            try:
+                if app is not None:
+                    with app.app_context():
+                        self.publish()
+            except Exception:
+                app.logger.exception('Falha ao publicar os snapshots')
+            finally:
+                if not self._pending.is_set():
+                    self._idle.set()
+
+    def wait_idle(self, timeout=None):
+        """Espera as publicações agendadas terminarem; False se o timeout vencer"""
+        return self._idle.wait(timeout)
+
+    def _render_list(self, path):
+        app = current_app._get_current_object()
+        builder = EnvironBuilder(path=path, method='GET')
+        try:
+            with app.request_context(builder.get_environ()):
+                response = app.full_dispatch_request()
+        finally:
+            builder.close()
+        if response.status_code != 200:
+            raise RuntimeError(f'{path} respondeu {response.status_code}')
+        return response.get_data()
+
+    def _put(self, name, body, documents, written):
+        filename = hashed_name(name, body)
+        if not self.target.exists(filename):
+            self.target.write(filename, body)
+            written.append(filename)
+        documents[name] = filename
+
+    def publish(self, full=False):
+        """
+        Republica os documentos cujas versões mudaram desde a última
+        publicação (todos com full=True, sem publicação anterior ou com
+        versões de outro epoch, como as do armazenamento em memória) e grava
+        o manifesto. Arquivos fora do manifesto novo e do substituído são
+        removidos. Retorna {'documents', 'written', 'removed'}.
+        """
+        if self.target is None:
+            raise RuntimeError('SNAPSHOT_DIR não configurado')
+        with self.target.lock():
+            previous = _load(self.target.read(MANIFEST)).get('documents', {})
+            state = _load(self.target.read(STATE))
+            # Lidas antes das consultas: uma escrita durante a publicação
+            # muda a versão de novo e entra na próxima
+            versions = response_cache.store.all()
+            if state.get('epoch') != response_cache.epoch or not previous:
+                full = True
+            recorded = state.get('versions', {})
+            changed = {name for name in versions.keys() | recorded.keys()
+                       if versions.get(name, 0) != recorded.get(name, 0)}
+            documents = {} if full else dict(previous)
+            written = []
+
+            for name, (path, tables) in LISTS.items():
+                if full or changed.intersection(tables):
+                    self._put(name, self._render_list(path), documents, written)
+
+            for kind, rows in DETAILS.items():
+                prefix = f'{kind}/'
+                if full or f'{kind}:all' in changed:
+                    ids = None
+                    documents = {name: filename for name, filename in documents.items()
+                                 if not name.startswith(prefix)}
+                else:
+                    scope = f'{kind}:id:'
+                    ids = sorted(name[len(scope):] for name in changed if name.startswith(scope))
+                    if not ids:
+                        continue
+                    # Registros excluídos não voltam da consulta e saem do manifesto
+                    for entity_id in ids:
+                        documents.pop(prefix + entity_id, None)
+                for entity_id, document in rows(ids):
+                    # Mesmo encoder e formato do jsonify das rotas de detalhe
+                    body = current_app.json.response(document).get_data()
+                    self._put(prefix + entity_id, body, documents, written)
+
+            manifest = {'generated_at': datetime.utcnow().isoformat() + 'Z', 'documents': documents}
+            self.target.write(MANIFEST, current_app.json.response(manifest).get_data())
+            self.target.write(STATE, json.dumps({'epoch': response_cache.epoch, 'versions': versions}).encode())
+
+            # Mantém a geração substituída para clientes com o manifesto antigo
+            keep = {MANIFEST, *documents.values(), *previous.values()}
+            removed = [name for name in self.target.list() if name not in keep]
+            for name in removed:
+                self.target.delete(name)
+            return {'documents': len(documents), 'written': len(written), 'removed': len(removed)}
+
+
+snapshot_publisher = SnapshotPublisher()
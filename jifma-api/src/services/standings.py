@@ -0,0 +1,109 @@
+from models.user import db
+from models.games import Game
+from models.standings import TeamStanding
+
+FINISHED = 'Finalizado'
+POINTS_WIN = 3
+POINTS_DRAW = 1
+POINTS_LOSS = 0
+
+
+def snapshot(game):
+    """
+    Contribuição do jogo para a classificação: (sport_id, team_a_id, team_b_id,
+    score_a, score_b) se estiver finalizado com placar, senão None.
+    """
+    if game is None or game.status != FINISHED or game.score_a is None or game.score_b is None:
+        return None
+    return (game.sport_id, game.team_a_id, game.team_b_id, int(game.score_a), int(game.score_b))
+
+
+def _deltas(own, other):
+    if own > other:
+        wins, draws, losses, points = 1, 0, 0, POINTS_WIN
+    elif own == other:
+        wins, draws, losses, points = 0, 1, 0, POINTS_DRAW
+    else:
+        wins, draws, losses, points = 0, 0, 1, POINTS_LOSS
+    return {'played': 1, 'wins': wins, 'draws': draws, 'losses': losses,
+            'points_for': own, 'points_against': other, 'points': points}
+
+
+def _contributions(snap):
+    sport_id, team_a_id, team_b_id, score_a, score_b = snap
+    yield (sport_id, team_a_id), _deltas(score_a, score_b)
+    yield (sport_id, team_b_id), _deltas(score_b, score_a)
+
+
+def _apply(snap, sign):
+    for key, deltas in _contributions(snap):
+        row = db.session.get(TeamStanding, key)
+        if row is None:
+            row = TeamStanding(sport_id=key[0], team_id=key[1],
+                               **{field: 0 for field in TeamStanding.STAT_FIELDS})
+            db.session.add(row)
+            db.session.flush()
+        # Incremento no próprio UPDATE (col = col + delta) para não perder
+        # escritas concorrentes
+        db.session.query(TeamStanding).filter_by(sport_id=key[0], team_id=key[1]).update(
+            {getattr(TeamStanding, field): getattr(TeamStanding, field) + sign * value
+             for field, value in deltas.items()},
+            synchronize_session=False
+        )
+
+
+def record_change(before, after):
+    """
+    Ajusta a classificação para a troca de estado de um jogo, na transação
+    corrente. before/after são resultados de snapshot().
+    """
+    if before == after:
+        return
+    if before is not None:
+        _apply(before, -1)
+    if after is not None:
+        _apply(after, +1)
+
+
+def aggregate(results):
+    """Soma as contribuições de (sport_id, team_a_id, team_b_id, score_a, score_b)"""
+    totals = {}
+    for sport_id, team_a_id, team_b_id, score_a, score_b in results:
+        for key, deltas in _contributions((sport_id, team_a_id, team_b_id, int(score_a), int(score_b))):
+            row = totals.setdefault(key, dict.fromkeys(TeamStanding.STAT_FIELDS, 0))
+            for field, value in deltas.items():
+                row[field] += value
+    return totals
+
+
+def compute_all():
+    """Recalcula a classificação completa a partir dos jogos finalizados"""
+    return aggregate(db.session.query(
+        Game.sport_id, Game.team_a_id, Game.team_b_id, Game.score_a, Game.score_b
+    ).filter(Game.status == FINISHED, Game.score_a.isnot(None), Game.score_b.isnot(None)))
+
+
+def stored():
+    return {
+        (row.sport_id, row.team_id): {field: getattr(row, field) for field in TeamStanding.STAT_FIELDS}
+        for row in TeamStanding.query.all()
+    }
+
+
+def diff():
+    """Lista as linhas em que a tabela incremental difere do recálculo completo"""
+    expected, actual = compute_all(), stored()
+    empty = dict.fromkeys(TeamStanding.STAT_FIELDS, 0)
+    return [
+        (key, actual.get(key, empty), expected.get(key, empty))
+        for key in sorted(set(expected) | set(actual))
+        if actual.get(key, empty) != expected.get(key, empty)
+    ]
+
+
+def rebuild():
+    """Substitui a tabela de classificação pelo recálculo completo"""
+    TeamStanding.query.delete()
+    for (sport_id, team_id), row in compute_all().items():
+        db.session.add(TeamStanding(sport_id=sport_id, team_id=team_id, **row))
+    db.session.commit()
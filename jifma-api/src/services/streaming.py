@@ -0,0 +1,59 @@
+from flask import Response, current_app, request, stream_with_context
+
+# Respostas em stream para listagens grandes: as linhas vêm do banco em lotes
+# (yield_per) e cada lote é codificado e enviado antes de buscar o próximo,
+# então a memória fica constante qualquer que seja o tamanho da tabela.
+
+BATCH_SIZE = 1000
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def stream_format():
+    """'ndjson', 'json' ou None (resposta normal), a partir de format=/stream= ou do Accept"""
+    requested = request.args.get('format')
+    if requested == 'ndjson' or (not requested and request.accept_mimetypes.best == NDJSON_MIMETYPE):
+        return 'ndjson'
+    if request.args.get('stream', '').lower() in ('1', 'true'):
+        return 'json'
+    return None
+
+
+def _batches(query, batch_size):
+    batch = []
+    for row in query.yield_per(batch_size):
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def json_array_chunks(query, serialize, dumps, batch_size=BATCH_SIZE):
+    """Gera um array JSON em pedaços, um por lote de linhas"""
+    yield '['
+    separator = ''
+    for batch in _batches(query, batch_size):
+        yield separator + ','.join(dumps(serialize(row)) for row in batch)
+        separator = ','
+    yield ']\n'
+
+
+def ndjson_chunks(query, serialize, dumps, batch_size=BATCH_SIZE):
+    """Gera um objeto JSON por linha (NDJSON)"""
+    for batch in _batches(query, batch_size):
+        yield ''.join(dumps(serialize(row)) + '\n' for row in batch)
+
+
+def streaming_response(query, serialize, mode):
+    """
+    Resposta em stream da consulta (de preferência por colunas) já ordenada.
+    O contexto da requisição fica ativo durante o stream para a sessão do banco.
+    """
+    dumps = current_app.json.dumps
+    if mode == 'ndjson':
+        chunks, mimetype = ndjson_chunks(query, serialize, dumps), NDJSON_MIMETYPE
+    else:
+        chunks, mimetype = json_array_chunks(query, serialize, dumps), 'application/json'
+    return Response(stream_with_context(chunks), mimetype=mimetype,
+                    headers={'Cache-Control': 'private, no-cache', 'X-Accel-Buffering': 'no'})
@@ -0,0 +1,66 @@
+from sqlalchemy import delete, insert, select
+from models.user import db
+from models.tags import Tag, news_tags, slugify
+
+
+def normalize_tags(value):
+    """Aceita lista ou string separada por vírgulas; remove vazios e repetidos"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(',')
+    names, seen = [], set()
+    for name in value:
+        name = ' '.join(str(name).split())[:50]
+        slug = slugify(name)
+        if slug and slug not in seen:
+            seen.add(slug)
+            names.append(name)
+    return names
+
+
+def set_news_tags(news, value):
+    """
+    Substitui as tags da notícia na transação corrente, ajustando apenas as
+    associações que mudaram e os contadores news_count das tags envolvidas.
+    """
+    names = normalize_tags(value)
+    wanted = {slugify(name): name for name in names}
+
+    existing = {tag.slug: tag for tag in Tag.query.filter(Tag.slug.in_(list(wanted))).all()} if wanted else {}
+    for slug, name in wanted.items():
+        if slug not in existing:
+            tag = Tag(name=name, slug=slug, news_count=0)
+            db.session.add(tag)
+            existing[slug] = tag
+    db.session.flush()
+
+    wanted_ids = {existing[slug].tag_id for slug in wanted}
+    current_ids = set(db.session.execute(
+        select(news_tags.c.tag_id).where(news_tags.c.news_id == news.news_id)
+    ).scalars())
+
+    added = wanted_ids - current_ids
+    removed = current_ids - wanted_ids
+    if added:
+        db.session.execute(insert(news_tags), [{'news_id': news.news_id, 'tag_id': tag_id} for tag_id in added])
+        Tag.query.filter(Tag.tag_id.in_(added)).update(
+            {Tag.news_count: Tag.news_count + 1}, synchronize_session=False)
+    if removed:
+        db.session.execute(delete(news_tags).where(
+            news_tags.c.news_id == news.news_id, news_tags.c.tag_id.in_(removed)))
+        Tag.query.filter(Tag.tag_id.in_(removed)).update(
+            {Tag.news_count: Tag.news_count - 1}, synchronize_session=False)
+
+    # Cópia desnormalizada usada na serialização das notícias
+    news.tags = ','.join(existing[slug].name for slug in wanted) or None
+
+
+def clear_news_tags(news):
+    set_news_tags(news, [])
+
+
+def filter_by_tag(query, News, tag):
+    return query.join(news_tags, news_tags.c.news_id == News.news_id) \
+        .join(Tag, Tag.tag_id == news_tags.c.tag_id) \
+        .filter(Tag.slug == slugify(tag))
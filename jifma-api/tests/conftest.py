@@ -0,0 +1,72 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
+
+# main.py cria um app ao ser importado; aponta-o para um banco descartável
+# para que os testes nunca toquem o jifma.db do repositório.
+_import_dir = tempfile.mkdtemp(prefix='jifma-tests-')
+os.environ['POSTGRES_URL'] = 'sqlite:///' + os.path.join(_import_dir, 'import.db')
+
+import main  # noqa: E402
+from models.user import db  # noqa: E402
+from services import bootstrap  # noqa: E402
+from services.cache import response_cache  # noqa: E402
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    """App novo por teste, com banco SQLite provisionado como no `init-db`"""
+    monkeypatch.setenv('POSTGRES_URL', 'sqlite:///' + str(tmp_path / 'test.db'))
+    app = main.create_app()
+    app.config['TESTING'] = True
+    with app.app_context():
+        bootstrap.init_schema(log=lambda *args: None)
+        bootstrap.seed_defaults()
+    response_cache.clear()
+    yield app
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def admin_headers(client):
+    response = client.post('/api/login', json={'username': 'admin', 'password': 'admin@123'})
+    return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+
+@pytest.fixture
+def ids(client):
+    """IDs das modalidades e equipes padrão"""
+    return {
+        'sports': [sport['sport_id'] for sport in client.get('/api/sports').get_json()],
+        'teams': [team['team_id'] for team in client.get('/api/teams').get_json()]
+    }
+
+
+@pytest.fixture
+def make_game(client, admin_headers, ids):
+    """Cria um jogo pela rota de admin (equipes 0 x 1 da primeira modalidade por padrão)"""
+    def make(**fields):
+        payload = {
+            'sport_id': ids['sports'][0],
+            'team_a_id': ids['teams'][0],
+            'team_b_id': ids['teams'][1],
+            'game_date': '2030-03-01T10:00:00',
+            'location': 'Quadra',
+            **fields
+        }
+        response = client.post('/api/admin/games', json=payload, headers=admin_headers)
+        assert response.status_code == 201, response.get_json()
+        return response.get_json()['game']
+    return make
@@ -0,0 +1,84 @@
+from sqlalchemy import event
+
+from models.user import User, db
+from services.auth import admin_tokens
+
+
+def _login(client, username, password):
+    response = client.post('/api/login', json={'username': username, 'password': password})
+    assert response.status_code == 200
+    return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+
+def _user(client, admin_headers, username='mesario', is_admin=False):
+    response = client.post('/api/users', json={
+        'username': username, 'email': f'{username}@ifma.edu.br', 'password': 'senha@123'
+    }, headers=admin_headers)
+    assert response.status_code == 201
+    user = response.get_json()['user']
+    if is_admin:
+        assert client.put(f"/api/users/{user['user_id']}", json={'is_admin': True},
+                          headers=admin_headers).status_code == 200
+    return user
+
+
+def test_admin_check_does_not_query_users(app, client, admin_headers):
+    assert client.get('/api/admin/games', headers=admin_headers).status_code == 200
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        assert client.get('/api/admin/games', headers=admin_headers).status_code == 200
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    assert statements
+    assert not [statement for statement in statements if 'users' in statement]
+
+
+def test_non_admin_token_is_forbidden(client, admin_headers):
+    _user(client, admin_headers)
+    headers = _login(client, 'mesario', 'senha@123')
+    assert client.get('/api/admin/games', headers=headers).status_code == 403
+
+
+def test_demoted_or_deleted_admin_is_rejected_at_once(client, admin_headers):
+    user = _user(client, admin_headers, is_admin=True)
+    headers = _login(client, 'mesario', 'senha@123')
+    assert client.get('/api/admin/games', headers=headers).status_code == 200
+
+    assert client.put(f"/api/users/{user['user_id']}", json={'is_admin': False},
+                      headers=admin_headers).status_code == 200
+    response = client.get('/api/admin/games', headers=headers)
+    assert response.status_code == 401
+    assert response.get_json()['error'] == 'token_revoked'
+
+    other = _user(client, admin_headers, 'arbitro', is_admin=True)
+    headers = _login(client, 'arbitro', 'senha@123')
+    client.delete(f"/api/users/{other['user_id']}", headers=admin_headers)
+    assert client.get('/api/admin/games', headers=headers).status_code == 401
+
+
+def test_password_change_revokes_old_tokens(client, admin_headers):
+    user = _user(client, admin_headers, is_admin=True)
+    old = _login(client, 'mesario', 'senha@123')
+    assert client.put(f"/api/users/{user['user_id']}", json={'password': 'nova@123'},
+                      headers=admin_headers).status_code == 200
+    assert client.get('/api/admin/games', headers=old).status_code == 401
+    assert client.get('/api/admin/games', headers=_login(client, 'mesario', 'nova@123')).status_code == 200
+
+
+def test_revocation_from_another_instance_applies_after_ttl(app, client, admin_headers, monkeypatch):
+    assert client.get('/api/admin/games', headers=admin_headers).status_code == 200
+    with app.app_context():
+        # Rebaixamento gravado por outra instância: este cache ainda não sabe
+        User.query.filter_by(username='admin').update({User.token_version: User.token_version + 1})
+        db.session.commit()
+    assert client.get('/api/admin/games', headers=admin_headers).status_code == 200
+
+    monkeypatch.setattr(admin_tokens, '_expires_at', 0.0)
+    assert client.get('/api/admin/games', headers=admin_headers).status_code == 401
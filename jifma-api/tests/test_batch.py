@@ -0,0 +1,17 @@
+def _results(client, headers, paths):
+    response = client.post('/api/batch', json=paths, headers=headers)
+    assert response.status_code == 200
+    return {result['path']: result for result in response.get_json()['results']}
+
+
+def test_error_responses_keep_their_status(client):
+    results = _results(client, {}, ['/api/rota-inexistente', '/api/teams'])
+    assert results['/api/rota-inexistente']['status'] == 404
+    assert results['/api/teams']['status'] == 200
+
+
+def test_streamed_json_is_buffered_and_ndjson_is_refused(client, admin_headers):
+    results = _results(client, admin_headers, ['/api/admin/games?stream=1', '/api/admin/games?format=ndjson'])
+    assert results['/api/admin/games?stream=1']['status'] == 200
+    assert isinstance(results['/api/admin/games?stream=1']['body'], list)
+    assert results['/api/admin/games?format=ndjson']['status'] == 400
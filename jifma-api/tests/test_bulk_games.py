@@ -0,0 +1,54 @@
+def _row(ids, **fields):
+    return {
+        'sport_id': ids['sports'][0], 'team_a_id': ids['teams'][0], 'team_b_id': ids['teams'][1],
+        'game_date': '2030-06-01T10:00:00', 'location': 'Quadra', **fields
+    }
+
+
+def _errors(response):
+    return {error['row']: error['errors'] for error in response.get_json()['errors']}
+
+
+def test_bulk_import_reports_each_invalid_row(client, admin_headers, ids):
+    rows = [
+        _row(ids),
+        _row(ids, team_a_id=[ids['teams'][2]], game_date='2030-06-02T10:00:00'),
+        _row(ids, sport_id={'id': ids['sports'][0]}, game_date='2030-06-03T10:00:00'),
+        _row(ids, team_b_id='inexistente', game_date='2030-06-04T10:00:00'),
+        _row(ids, team_b_id=ids['teams'][0], game_date='2030-06-05T10:00:00'),
+        _row(ids, game_date='ontem'),
+        {'sport_id': ids['sports'][0]},
+        'texto',
+    ]
+    response = client.post('/api/admin/games/bulk', json=rows, headers=admin_headers)
+    assert response.status_code == 201
+    body = response.get_json()
+    assert (body['total'], body['valid'], body['created']) == (8, 1, 1)
+    errors = _errors(response)
+    assert errors[2] == ['Campo inválido: team_a_id']
+    assert errors[3] == ['Campo inválido: sport_id']
+    assert errors[4] == ['Equipe B não encontrada']
+    assert errors[5] == ['As equipes A e B devem ser diferentes']
+    assert errors[6] == ['Formato de data inválido. Use ISO format.']
+    assert 'Campo obrigatório: location' in errors[7]
+    assert errors[8] == ['Linha deve ser um objeto']
+
+
+def test_bulk_import_conflicts_dry_run_and_force(client, admin_headers, ids):
+    rows = [_row(ids), _row(ids, location='Campo')]
+    response = client.post('/api/admin/games/bulk?dry_run=1', json=rows, headers=admin_headers)
+    assert response.status_code == 200
+    assert _errors(response) == {2: ['Conflito de horário']}
+    assert client.get('/api/admin/games', headers=admin_headers).get_json() == []
+
+    response = client.post('/api/admin/games/bulk?force=1', json=rows, headers=admin_headers)
+    assert response.get_json()['created'] == 2
+
+
+def test_bulk_import_from_csv(client, admin_headers, ids):
+    header = 'sport_id,team_a_id,team_b_id,game_date,location\n'
+    line = f"{ids['sports'][0]},{ids['teams'][0]},{ids['teams'][1]},2030-06-01T10:00:00,Quadra\n"
+    response = client.post('/api/admin/games/bulk', data='\ufeff' + header + line,
+                           content_type='text/csv', headers=admin_headers)
+    assert response.status_code == 201
+    assert response.get_json()['created'] == 1
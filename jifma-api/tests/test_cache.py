@@ -0,0 +1,34 @@
+from models.cache_versions import CacheVersion
+from models.user import db
+from services.cache import response_cache
+
+
+def test_write_bumps_shared_version_row(app, client, admin_headers, ids):
+    team_id = ids['teams'][0]
+    response = client.put(f'/api/admin/teams/{team_id}', json={'name': 'Química'}, headers=admin_headers)
+    assert response.status_code == 200
+    with app.app_context():
+        assert db.session.get(CacheVersion, 'teams').version == 1
+    assert client.get(f'/api/teams/{team_id}').get_json()['name'] == 'Química'
+
+
+def test_bump_from_another_instance_invalidates_cached_body(app, client):
+    assert client.get('/api/teams').headers['X-Cache'] == 'MISS'
+    assert client.get('/api/teams').headers['X-Cache'] == 'HIT'
+
+    # Outra instância só compartilha o banco: simula o incremento dela
+    with app.app_context():
+        row = db.session.get(CacheVersion, 'teams') or CacheVersion(name='teams', version=0)
+        row.version += 1
+        db.session.add(row)
+        db.session.commit()
+
+    assert client.get('/api/teams').headers['X-Cache'] == 'MISS'
+
+
+def test_entries_expire_after_ttl(app, client, monkeypatch):
+    client.get('/api/teams')
+    assert client.get('/api/teams').headers['X-Cache'] == 'HIT'
+    monkeypatch.setattr(response_cache, 'entry_ttl', 0)
+    client.get('/api/sports')
+    assert client.get('/api/sports').headers['X-Cache'] == 'MISS'
@@ -0,0 +1,53 @@
+from services import calendar
+
+
+def _events(body):
+    return body.count('BEGIN:VEVENT')
+
+
+def test_team_feed_lists_only_the_team_games(client, ids, make_game):
+    teams = ids['teams']
+    make_game(location='Ginásio; quadra 1, coberta')
+    make_game(team_a_id=teams[2], team_b_id=teams[3], game_date='2030-03-01T15:00:00')
+
+    response = client.get(f'/api/calendar/team/{teams[0]}.ics')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/calendar'
+    body = response.get_data(as_text=True)
+    assert body.startswith('BEGIN:VCALENDAR\r\n') and body.endswith('END:VCALENDAR\r\n')
+    assert _events(body) == 1
+    assert 'DTSTART:20300301T100000' in body
+    assert r'LOCATION:Ginásio\; quadra 1\, coberta' in body
+
+    sport = client.get(f"/api/calendar/sport/{ids['sports'][0]}.ics").get_data(as_text=True)
+    assert _events(sport) == 2
+    assert client.get('/api/calendar/team/inexistente.ics').status_code == 404
+
+
+def test_feed_is_regenerated_only_for_games_of_the_team(client, admin_headers, ids, make_game):
+    teams = ids['teams']
+    own = make_game()
+    other = make_game(team_a_id=teams[2], team_b_id=teams[3], game_date='2030-03-01T15:00:00')
+    url = f'/api/calendar/team/{teams[0]}.ics'
+    etag = client.get(url).headers['ETag']
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+    response = client.put(f"/api/admin/games/{other['game_id']}", json={'location': 'Campo'}, headers=admin_headers)
+    assert response.status_code == 200
+    assert client.get(url, headers={'If-None-Match': etag}).status_code == 304
+
+    response = client.put(f"/api/admin/games/{own['game_id']}", json={'score_a': 2, 'score_b': 1},
+                          headers=admin_headers)
+    assert response.status_code == 200
+    changed = client.get(url, headers={'If-None-Match': etag})
+    assert changed.status_code == 200
+    assert changed.headers['ETag'] != etag
+    assert '2 x 1' in changed.get_data(as_text=True)
+
+
+def test_long_lines_are_folded_without_splitting_characters():
+    line = 'SUMMARY:' + 'ção ' * 40
+    folded = calendar.fold(line)
+    parts = folded.split('\r\n ')
+    assert ''.join(parts) == line
+    assert all(len(part.encode('utf-8')) <= 75 for part in parts)
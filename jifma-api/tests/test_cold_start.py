@@ -0,0 +1,52 @@
+import importlib.util
+import os
+import statistics
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+import main
+from models.user import db
+
+BENCHMARK = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'cold_start.py')
+# Folga para máquinas de CI lentas; o benchmark local fica bem abaixo disso
+MAX_MS = float(os.environ.get('COLD_START_MAX_MS', 3000))
+SCHEMA_PREFIXES = ('CREATE', 'ALTER', 'DROP', 'INSERT', 'UPDATE', 'DELETE')
+
+
+def _load_benchmark():
+    spec = importlib.util.spec_from_file_location('cold_start', BENCHMARK)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_time_to_first_response(tmp_path):
+    cold_start = _load_benchmark()
+    env = dict(os.environ, POSTGRES_URL='sqlite:///' + str(tmp_path / 'bench.db'))
+    cold_start.provision(env)
+    firsts = [cold_start.run_once(env)['first_response_ms'] for _ in range(3)]
+    assert statistics.median(firsts) < MAX_MS
+
+
+def test_create_app_and_first_request_issue_no_schema_or_seed_statements(app):
+    # Banco já provisionado pelo fixture app; um app novo só deve ler
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lstrip().upper())
+
+    fresh = None
+    event.listen(Engine, 'before_cursor_execute', record)
+    try:
+        fresh = main.create_app()
+        assert fresh.test_client().get('/api/sports').status_code == 200
+    finally:
+        event.remove(Engine, 'before_cursor_execute', record)
+        if fresh is not None:
+            with fresh.app_context():
+                db.session.remove()
+                db.engine.dispose()
+
+    assert statements
+    assert not [statement for statement in statements if statement.startswith(SCHEMA_PREFIXES)]
@@ -0,0 +1,36 @@
+def test_venue_clash_ignores_case_accents_and_spaces(client, admin_headers, ids, make_game):
+    make_game(location=' Ginásio A', game_date='2030-04-01T10:00:00')
+    response = client.post('/api/admin/games', json={
+        'sport_id': ids['sports'][0], 'team_a_id': ids['teams'][2], 'team_b_id': ids['teams'][3],
+        'game_date': '2030-04-01T10:30:00', 'location': 'GINÁSIO a'
+    }, headers=admin_headers)
+    assert response.status_code == 409
+    assert {conflict['type'] for conflict in response.get_json()['conflicts']} == {'location'}
+
+    # A listagem geral enxerga o mesmo choque
+    make_game(team_a_id=ids['teams'][2], team_b_id=ids['teams'][3], game_date='2030-04-01T10:30:00',
+              location='GINÁSIO a', force=True)
+    listed = client.get('/api/admin/games/conflicts', headers=admin_headers).get_json()
+    assert [(conflict['type'], conflict['key']) for conflict in listed] == [('location', 'ginásio a')]
+
+
+def test_team_clash_and_free_slots(client, admin_headers, ids, make_game):
+    make_game(game_date='2030-04-02T10:00:00', location='Quadra 1')
+    payload = {'sport_id': ids['sports'][1], 'team_a_id': ids['teams'][0], 'team_b_id': ids['teams'][2],
+               'location': 'Quadra 2'}
+    response = client.post('/api/admin/games', json={**payload, 'game_date': '2030-04-02T10:59:00'},
+                           headers=admin_headers)
+    assert response.status_code == 409
+    assert response.get_json()['conflicts'][0]['type'] == 'team'
+
+    # Começar quando o outro jogo termina não é choque
+    response = client.post('/api/admin/games', json={**payload, 'game_date': '2030-04-02T11:00:00'},
+                           headers=admin_headers)
+    assert response.status_code == 201
+
+
+def test_cancelled_games_do_not_occupy(client, admin_headers, ids, make_game):
+    game = make_game(game_date='2030-04-03T10:00:00')
+    assert client.put(f"/api/admin/games/{game['game_id']}", json={'status': 'Cancelado'},
+                      headers=admin_headers).status_code == 200
+    make_game(game_date='2030-04-03T10:00:00')
@@ -0,0 +1,33 @@
+import sqlite3
+import threading
+import time
+
+from services.database import InstrumentedQueuePool, pool_stats
+
+
+def _pool(tmp_path):
+    path = str(tmp_path / 'pool.db')
+    return InstrumentedQueuePool(lambda: sqlite3.connect(path, check_same_thread=False),
+                                 pool_size=1, max_overflow=0, timeout=5)
+
+
+def test_idle_checkouts_are_not_counted_as_waits(tmp_path):
+    pool = _pool(tmp_path)
+    pool.connect().close()
+    pool_stats.reset()
+    for _ in range(20):
+        pool.connect().close()
+    assert pool_stats.snapshot()['wait_count'] == 0
+
+
+def test_checkout_from_exhausted_pool_is_a_wait(tmp_path):
+    pool = _pool(tmp_path)
+    held = pool.connect()
+    pool_stats.reset()
+    threading.Timer(0.05, held.close).start()
+    started = time.perf_counter()
+    pool.connect().close()
+    assert time.perf_counter() - started >= 0.04
+    stats = pool_stats.snapshot()
+    assert stats['wait_count'] == 1
+    assert stats['wait_max_ms'] >= 40
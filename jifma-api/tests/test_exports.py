@@ -0,0 +1,32 @@
+import os
+import time
+
+from services.cache import bump_version
+
+
+def test_cleanup_removes_only_stale_files(app, client, admin_headers, tmp_path):
+    directory = tmp_path / 'exports'
+    app.config['EXPORT_CACHE_DIR'] = str(directory)
+    app.config['EXPORT_CACHE_TTL'] = 60
+
+    first = client.get('/api/admin/export/medals', headers=admin_headers)
+    assert first.status_code == 200
+    first.close()
+    (previous,) = os.listdir(directory)
+    stale = directory / 'games-old-1.csv'
+    stale.write_text('x')
+    old = time.time() - 120
+    os.utime(stale, (old, old))
+
+    with app.app_context():
+        bump_version('medals')
+    second = client.get('/api/admin/export/medals', headers=admin_headers)
+    assert second.status_code == 200
+    assert second.headers['ETag'] != first.headers['ETag']
+    second.close()
+
+    # A versão anterior ainda pode estar em download em outro processo
+    files = set(os.listdir(directory))
+    assert previous in files
+    assert 'games-old-1.csv' not in files
+    assert len(files) == 2
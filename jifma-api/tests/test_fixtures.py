@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta
+
+
+def _generate(client, headers, ids, **fields):
+    payload = {
+        'sport_id': ids['sports'][0],
+        'team_ids': ids['teams'][:4],
+        'start_date': '2030-05-01T08:00:00-03:00',
+        'slot_minutes': 30,
+        'venues': ['Quadra 1', ' quadra 1 ', 'Quadra 2'],
+        **fields
+    }
+    return client.post('/api/admin/fixtures', json=payload, headers=headers)
+
+
+def test_timezone_aware_start_is_accepted(client, admin_headers, ids):
+    response = _generate(client, admin_headers, ids, dry_run=True)
+    assert response.status_code == 200
+    games = response.get_json()['games']
+    assert games[0]['game_date'] == '2030-05-01T08:00:00'
+    # ' quadra 1 ' é o mesmo local que 'Quadra 1'
+    assert {game['location'] for game in games} <= {'Quadra 1', 'Quadra 2'}
+
+
+def test_short_slots_respect_game_duration(client, admin_headers, ids):
+    assert _generate(client, admin_headers, ids).status_code == 201
+    # Segunda tabela com as mesmas equipes e locais: precisa desviar da primeira
+    assert _generate(client, admin_headers, ids, legs=2).status_code == 201
+
+    response = client.get('/api/admin/games/conflicts', headers=admin_headers)
+    assert response.status_code == 200
+    assert response.get_json() == []
+
+
+def _finish(client, headers, game, winner_side, **extra):
+    scores = {'score_a': 2, 'score_b': 0} if winner_side == 'a' else {'score_a': 0, 'score_b': 2}
+    return client.put(f"/api/admin/games/{game['game_id']}", json={'status': 'Finalizado', **scores, **extra},
+                      headers=headers)
+
+
+def test_knockout_rounds_wait_for_the_previous_round(app, client, admin_headers, ids):
+    response = _generate(client, admin_headers, ids, format='knockout', venues=['Quadra 1', 'Quadra 2'])
+    assert response.status_code == 201
+    plan = response.get_json()
+    duration = app.config.get('GAME_DURATION_MINUTES', 60)
+    semis = [slot for slot in plan['slots'] if slot['round'] == 1]
+    final = next(slot for slot in plan['slots'] if slot['round'] == 2)
+    last_semi = max(slot['game_date'] for slot in semis)
+    gap = datetime.fromisoformat(final['game_date']) - datetime.fromisoformat(last_semi)
+    assert gap >= timedelta(minutes=duration)
+
+    for game in plan['games']:
+        assert _finish(client, admin_headers, game, 'a').status_code == 200
+    response = client.get('/api/admin/games/conflicts', headers=admin_headers)
+    assert response.get_json() == []
+
+
+def test_advance_reports_conflicts_of_the_next_game(client, admin_headers, ids, make_game):
+    plan = _generate(client, admin_headers, ids, format='knockout', venues=['Quadra 1', 'Quadra 2']).get_json()
+    final = next(slot for slot in plan['slots'] if slot['round'] == 2)
+    first, second = plan['games']
+    # Outro compromisso da equipe A da primeira semifinal no horário da final
+    make_game(team_a_id=first['team_a_id'], team_b_id=first['team_b_id'], game_date=final['game_date'],
+              location='Campo')
+    assert _finish(client, admin_headers, first, 'a').status_code == 200
+
+    response = _finish(client, admin_headers, second, 'a')
+    assert response.status_code == 409
+    assert response.get_json()['conflicts']
+    assert _finish(client, admin_headers, second, 'a', force=True).status_code == 200
@@ -0,0 +1,67 @@
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from models.user import db
+from services.cache import response_cache
+
+
+@contextmanager
+def _count_selects(app):
+    selects = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            selects.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        yield selects
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+
+
+def _games(make_game, ids, days):
+    teams = ids['teams']
+    for day in days:
+        make_game(team_a_id=teams[day % 4], team_b_id=teams[(day + 1) % 4], game_date=f'2030-03-{day:02d}T10:00:00')
+
+
+def test_include_embeds_teams_and_sport(client, ids, make_game):
+    game = make_game()
+    team_a = client.get(f"/api/teams/{game['team_a_id']}").get_json()
+    sport = client.get(f"/api/sports/{game['sport_id']}").get_json()
+
+    for url in (f"/api/games/{game['game_id']}?include=teams,sport",
+                f"/api/games/sport/{game['sport_id']}?include=teams,sport",
+                '/api/games?include=teams,sport'):
+        body = client.get(url).get_json()
+        embedded = body[0] if isinstance(body, list) else body
+        assert embedded['team_a'] == team_a
+        assert embedded['team_b']['team_id'] == game['team_b_id']
+        assert embedded['winner'] is None
+        assert embedded['sport'] == sport
+
+    plain = client.get(f"/api/games/{game['game_id']}").get_json()
+    assert 'team_a' not in plain and 'sport' not in plain
+
+
+def test_include_uses_a_fixed_number_of_queries(app, client, ids, make_game):
+    counts = []
+    for days in (range(1, 3), range(3, 9)):
+        _games(make_game, ids, days)
+        response_cache.clear()
+        with _count_selects(app) as selects:
+            for url in (f"/api/games/sport/{ids['sports'][0]}?include=teams,sport", '/api/games?include=teams,sport'):
+                assert client.get(url).status_code == 200
+        counts.append(len(selects))
+    assert counts[0] == counts[1]
+
+
+def test_unknown_include_is_rejected(client, ids, make_game):
+    game = make_game()
+    response = client.get(f"/api/games/{game['game_id']}?include=venue")
+    assert response.status_code == 400
+    assert 'include' in response.get_json()['error']
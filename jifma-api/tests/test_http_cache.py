@@ -0,0 +1,34 @@
+import pytest
+
+
+@pytest.fixture
+def news_list(client, admin_headers):
+    response = client.post('/api/admin/news', json={
+        'title': 'Abertura dos jogos', 'content': 'Cerimônia no ginásio. ' * 200, 'author': 'Comissão'
+    }, headers=admin_headers)
+    assert response.status_code == 201
+    return '/api/news'
+
+
+def test_compressed_representation_revalidates_with_its_own_etag(client, news_list):
+    first = client.get(news_list, headers={'Accept-Encoding': 'gzip'})
+    assert first.headers['Content-Encoding'] == 'gzip'
+    etag = first.headers['ETag']
+    assert etag.endswith('-gzip"')
+
+    again = client.get(news_list, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert again.status_code == 304
+    assert again.headers['ETag'] == etag
+    assert 'Accept-Encoding' in again.headers['Vary']
+    assert 'Content-Encoding' not in again.headers
+
+
+def test_identity_etag_does_not_validate_compressed_representation(client, news_list):
+    identity = client.get(news_list)
+    assert 'Content-Encoding' not in identity.headers
+    etag = identity.headers['ETag']
+
+    assert client.get(news_list, headers={'If-None-Match': etag}).status_code == 304
+    compressed = client.get(news_list, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert compressed.status_code == 200
+    assert compressed.headers['Content-Encoding'] == 'gzip'
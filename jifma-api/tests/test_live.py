@@ -0,0 +1,92 @@
+import logging
+import socket
+import threading
+import time
+
+from models.user import db
+from models.games import GameEvent
+from services.live import DatabaseBroker, PostgresBroker
+
+
+def _insert(event_id, sport_id='s1'):
+    with db.engine.begin() as conn:
+        conn.execute(GameEvent.__table__.insert().values(
+            event_id=event_id, game_id='g1', sport_id=sport_id, payload=f'{{"n":{event_id}}}'))
+
+
+def test_events_committed_out_of_order_are_delivered(app):
+    with app.app_context():
+        broker = DatabaseBroker(db.engine)
+        cursor = broker.resume_point(None)
+        # O id 2 foi reservado por uma transação que ainda não confirmou
+        _insert(1)
+        _insert(3, 's2')
+        events, cursor = broker.events_after(cursor, 's1')
+        assert [event_id for event_id, _ in events] == [1]
+
+        _insert(2)
+        events, cursor = broker.events_after(cursor, 's1')
+        assert [event_id for event_id, _ in events] == [2]
+        events, cursor = broker.events_after(cursor, 's1')
+        assert events == []
+
+
+def test_gaps_expire(app):
+    with app.app_context():
+        broker = DatabaseBroker(db.engine, gap_timeout=0)
+        cursor = broker.resume_point(None)
+        _insert(1)
+        _insert(3)
+        events, cursor = broker.events_after(cursor)
+        assert [event_id for event_id, _ in events] == [1, 3]
+        # Rollback: o id 2 nunca aparece e a lacuna é descartada no prazo
+        events, cursor = broker.events_after(cursor)
+        assert events == [] and cursor == (3, {})
+
+
+class _FakeNotifyConnection:
+    """Conexão psycopg mínima: um socket sinaliza a chegada de um NOTIFY"""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.autocommit = False
+        self.notifies = []
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def cursor(self):
+        return self
+
+    def execute(self, statement):
+        self.listening = statement
+
+    def poll(self):
+        self.sock.recv(1)
+        self.notifies.append('game_events')
+
+
+class _FakeEngine:
+    def __init__(self, connection):
+        self.driver_connection = connection
+
+    def raw_connection(self):
+        return self
+
+    def invalidate(self):
+        pass
+
+
+def test_postgres_listener_wakes_waiting_subscribers(caplog):
+    reader, writer = socket.socketpair()
+    connection = _FakeNotifyConnection(reader)
+    broker = PostgresBroker(_FakeEngine(connection), poll_interval=5)
+    threading.Timer(0.2, writer.send, (b'x',)).start()
+
+    started = time.monotonic()
+    with caplog.at_level(logging.ERROR, logger='services.live'):
+        broker.wait((0, {}), 5)
+    # Acordado pelo NOTIFY, não pelo intervalo de polling
+    assert time.monotonic() - started < 2
+    assert connection.listening == 'LISTEN game_events'
+    assert not caplog.records
@@ -0,0 +1,91 @@
+from sqlalchemy import event
+
+from models.medals import MedalAward
+from models.user import db
+from services import medals
+
+
+def _standing(client, team_id):
+    return client.get(f'/api/admin/medals/{team_id}').get_json()
+
+
+def test_manual_edits_go_through_the_ledger(app, client, admin_headers, ids):
+    team_id, sport_id = ids['teams'][0], ids['sports'][0]
+    assert client.post('/api/admin/medals/awards', json={
+        'sport_id': sport_id, 'team_id': team_id, 'medal_type': 'ouro'
+    }, headers=admin_headers).status_code == 201
+
+    response = client.put(f'/api/admin/medals/{team_id}', json={'gold_medals': 3, 'bronze_medals': 1},
+                          headers=admin_headers)
+    assert response.status_code == 200
+    assert (response.get_json()['gold_medals'], response.get_json()['bronze_medals']) == (3, 1)
+
+    with app.app_context():
+        adjustments = MedalAward.query.filter_by(team_id=team_id, kind='adjustment').all()
+        assert sorted((entry.medal_type, entry.delta) for entry in adjustments) == [('bronze', 1), ('gold', 2)]
+        assert medals.diff() == []
+        # Um recálculo a partir do livro-razão mantém a edição manual
+        medals.rebuild()
+    assert _standing(client, team_id)['gold_medals'] == 3
+
+
+def test_create_and_delete_standing_keep_ledger_consistent(app, client, admin_headers, ids):
+    team_id = ids['teams'][1]
+    response = client.post('/api/admin/medals', json={'team_id': team_id, 'silver_medals': 2},
+                           headers=admin_headers)
+    assert response.status_code == 201
+    assert response.get_json()['silver_medals'] == 2
+
+    assert client.delete(f'/api/admin/medals/{team_id}', headers=admin_headers).status_code == 200
+    with app.app_context():
+        assert medals.diff() == []
+        medals.rebuild()
+    assert client.get(f'/api/admin/medals/{team_id}').status_code == 404
+
+
+def test_invalid_manual_total_is_rejected(client, admin_headers, ids):
+    team_id = ids['teams'][2]
+    client.post('/api/admin/medals', json={'team_id': team_id}, headers=admin_headers)
+    response = client.put(f'/api/admin/medals/{team_id}', json={'gold_medals': -1}, headers=admin_headers)
+    assert response.status_code == 400
+
+
+def test_admin_panel_payload_with_text_values(client, admin_headers, ids):
+    team_id = ids['teams'][3]
+    # O painel envia o valor dos inputs como texto, e "" quando o campo é apagado
+    response = client.post('/api/admin/medals', json={
+        'team_id': team_id, 'gold_medals': '2', 'silver_medals': '', 'bronze_medals': '1'
+    }, headers=admin_headers)
+    assert response.status_code == 201
+    standing = response.get_json()
+    assert (standing['gold_medals'], standing['silver_medals'], standing['bronze_medals']) == (2, 0, 1)
+
+    response = client.put(f'/api/admin/medals/{team_id}', json={**standing, 'gold_medals': '3', 'bronze_medals': ''},
+                          headers=admin_headers)
+    assert response.status_code == 200
+    assert (response.get_json()['gold_medals'], response.get_json()['bronze_medals']) == (3, 1)
+
+    for value in ('abc', '-1'):
+        response = client.put(f'/api/admin/medals/{team_id}', json={'gold_medals': value}, headers=admin_headers)
+        assert response.status_code == 400
+
+
+def test_deleting_a_game_keeps_its_awards(app, client, admin_headers, ids, make_game):
+    # Chaves estrangeiras aplicadas como no Postgres
+    with app.app_context():
+        db.engine.dispose()
+        event.listen(db.engine, 'connect', lambda connection, record: connection.execute('PRAGMA foreign_keys=ON'))
+    game = make_game()
+    team_id = ids['teams'][0]
+    response = client.post('/api/admin/medals/awards', json={
+        'sport_id': ids['sports'][0], 'team_id': team_id, 'medal_type': 'gold', 'game_id': game['game_id']
+    }, headers=admin_headers)
+    assert response.status_code == 201
+    award_id = response.get_json()['award_id']
+
+    assert client.delete(f"/api/admin/games/{game['game_id']}", headers=admin_headers).status_code == 200
+    with app.app_context():
+        award = MedalAward.query.get(award_id)
+        assert award is not None and award.game_id is None
+        assert medals.diff() == []
+    assert _standing(client, team_id)['gold_medals'] == 1
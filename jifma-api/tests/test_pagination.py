@@ -0,0 +1,72 @@
+from datetime import datetime
+
+from models.news import News
+from models.user import db
+
+
+def _walk(client, url, **params):
+    """Percorre todas as páginas seguindo next_cursor"""
+    items, cursor = [], None
+    while True:
+        query = {**params, **({'cursor': cursor} if cursor else {})}
+        response = client.get(url, query_string=query)
+        assert response.status_code == 200, response.get_json()
+        page = response.get_json()
+        assert len(page['items']) <= params['limit']
+        items += page['items']
+        cursor = page['next_cursor']
+        if cursor is None:
+            return items
+
+
+def test_game_pages_cover_the_list_with_ties(client, ids, make_game):
+    teams = ids['teams']
+    for index in range(5):
+        # Mesmo horário em quase todos: o game_id desempata a ordem
+        make_game(team_a_id=teams[index % 4], team_b_id=teams[(index + 1) % 4], force=True,
+                  game_date='2030-03-01T10:00:00' if index < 4 else '2030-02-28T10:00:00')
+
+    expected = [game['game_id'] for game in client.get('/api/games').get_json()]
+    assert [game['game_id'] for game in _walk(client, '/api/games', limit=2)] == expected
+    assert len(expected) == 5
+
+
+def test_game_filters(client, admin_headers, ids, make_game):
+    teams = ids['teams']
+    first = make_game(game_date='2030-03-01T10:00:00')
+    second = make_game(team_a_id=teams[2], team_b_id=teams[0], game_date='2030-03-02T10:00:00')
+    third = make_game(team_a_id=teams[2], team_b_id=teams[3], game_date='2030-03-03T10:00:00')
+    response = client.put(f"/api/admin/games/{second['game_id']}", json={'status': 'Em Andamento'},
+                          headers=admin_headers)
+    assert response.status_code == 200
+
+    def listed(**params):
+        return {game['game_id'] for game in client.get('/api/games', query_string=params).get_json()}
+
+    assert listed(team_id=teams[0]) == {first['game_id'], second['game_id']}
+    assert listed(status='Em Andamento') == {second['game_id']}
+    assert listed(date_from='2030-03-02T00:00:00', date_to='2030-03-03T23:59:59') == {second['game_id'], third['game_id']}
+    assert listed(sport_id=ids['sports'][0], team_id=teams[3]) == {third['game_id']}
+    assert listed(sport_id='inexistente') == set()
+
+
+def test_invalid_cursor_and_dates_are_rejected(client):
+    assert client.get('/api/games', query_string={'cursor': 'nao-e-cursor'}).status_code == 400
+    assert client.get('/api/games', query_string={'date_from': 'ontem'}).status_code == 400
+    assert client.get('/api/news', query_string={'cursor': 'x'}).status_code == 400
+
+
+def test_news_pages_are_newest_first(app, client):
+    with app.app_context():
+        same = datetime(2030, 3, 1, 12, 0)
+        db.session.add_all(
+            News(title=f'Notícia {index}', content='Texto.', author='Comissão',
+                 publication_date=same if index < 3 else datetime(2030, 3, 2, 12, 0))
+            for index in range(5)
+        )
+        db.session.commit()
+
+    expected = [news['news_id'] for news in client.get('/api/news').get_json()]
+    items = _walk(client, '/api/news', limit=2, view='summary')
+    assert [news['news_id'] for news in items] == expected
+    assert items[0]['title'] in ('Notícia 3', 'Notícia 4')
@@ -0,0 +1,42 @@
+import pytest
+
+from services import query_plans
+
+# Índice que o plano do SQLite deve citar para cada consulta pública
+EXPECTED_INDEXES = {
+    'GET /api/games': ['ix_games_game_date'],
+    'GET /api/games?status=': ['ix_games_status_date'],
+    'GET /api/games/sport/<sport_id>': ['ix_games_sport_date'],
+    'GET /api/news': ['ix_news_publication_date'],
+    'GET /api/news?tag=': ['ix_news_tags_tag'],
+    'DELETE /api/admin/teams/<team_id>': ['ix_games_team_a', 'ix_games_team_b', 'ix_games_winner'],
+    'GET /api/admin/medals/<team_id>': ['ux_medal_standings_team'],
+}
+
+
+def _plans(app):
+    with app.app_context():
+        return {name: query_plans.explain(statement) for name, statement in query_plans.public_queries()}
+
+
+def test_every_public_query_has_an_expectation(app):
+    assert set(_plans(app)) == set(EXPECTED_INDEXES)
+
+
+@pytest.mark.parametrize('name', sorted(EXPECTED_INDEXES))
+def test_public_query_uses_index(app, name):
+    plan = _plans(app)[name]
+    text = '\n'.join(plan)
+    for index in EXPECTED_INDEXES[name]:
+        assert index in text, f'{name}: {index} ausente do plano\n{text}'
+    # Nenhuma varredura completa das tabelas grandes
+    for table in ('games', 'news'):
+        assert not any(line.strip() == f'SCAN {table}' for line in plan), text
+
+
+def test_explain_public_queries_logs_each_query(app):
+    lines = []
+    with app.app_context():
+        query_plans.explain_public_queries(log=lines.append)
+    for name in EXPECTED_INDEXES:
+        assert name in lines
@@ -0,0 +1,47 @@
+def _patch(client, headers, game_id, **body):
+    return client.patch(f'/api/admin/games/{game_id}/score', json=body, headers=headers)
+
+
+def test_score_fast_path_updates_winner_and_version(client, admin_headers, make_game):
+    game = make_game()
+    response = _patch(client, admin_headers, game['game_id'], score_a=2, score_b=1, version=game['version'])
+    assert response.status_code == 200
+    body = response.get_json()
+    assert (body['score_a'], body['score_b'], body['winner_team_id']) == (2, 1, game['team_a_id'])
+    assert body['version'] == game['version'] + 1
+
+    # Versão antiga: 409 com a versão atual para o próximo envio
+    response = _patch(client, admin_headers, game['game_id'], score_b=5, version=game['version'])
+    assert response.status_code == 409
+    assert response.get_json()['version'] == body['version']
+
+    response = _patch(client, admin_headers, game['game_id'], score_b=3, version=body['version'])
+    assert response.get_json()['winner_team_id'] == game['team_b_id']
+
+
+def test_score_fast_path_rejects_invalid_requests(client, admin_headers, make_game):
+    game = make_game()
+    assert _patch(client, admin_headers, game['game_id'], score_a='x', version=game['version']).status_code == 400
+    assert _patch(client, admin_headers, game['game_id'], score_a=-1, version=game['version']).status_code == 400
+    assert _patch(client, admin_headers, game['game_id'], score_a=1).status_code == 400
+    assert _patch(client, admin_headers, 'inexistente', score_a=1, version=1).status_code == 404
+
+    finished = client.put(f"/api/admin/games/{game['game_id']}", json={'status': 'Finalizado'},
+                          headers=admin_headers).get_json()['game']
+    response = _patch(client, admin_headers, game['game_id'], score_a=1, version=finished['version'])
+    assert response.status_code == 409
+
+
+def test_blank_scores_clear_the_score(client, admin_headers, make_game):
+    game = make_game()
+    body = _patch(client, admin_headers, game['game_id'], score_a=1, score_b=0, version=game['version']).get_json()
+
+    # O painel envia "" quando a caixa de placar fica vazia
+    response = _patch(client, admin_headers, game['game_id'], score_a='', score_b=' ', version=body['version'])
+    assert response.status_code == 200
+    assert (response.get_json()['score_a'], response.get_json()['score_b']) == (None, None)
+
+    response = client.put(f"/api/admin/games/{game['game_id']}", json={'score_a': '3', 'score_b': ''},
+                          headers=admin_headers)
+    assert response.status_code == 200
+    assert (response.get_json()['game']['score_a'], response.get_json()['game']['score_b']) == (3, None)
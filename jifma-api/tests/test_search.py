@@ -0,0 +1,57 @@
+import pytest
+
+
+@pytest.fixture
+def post_news(client, admin_headers):
+    def post(title, content):
+        response = client.post('/api/admin/news', json={'title': title, 'content': content, 'author': 'Comissão'},
+                               headers=admin_headers)
+        assert response.status_code == 201
+        return response.get_json()['news']
+    return post
+
+
+def _search(client, query, **params):
+    response = client.get('/api/news/search', query_string={'q': query, **params})
+    assert response.status_code == 200
+    return response.get_json()
+
+
+def test_title_matches_rank_first_and_accents_are_ignored(client, post_news):
+    in_content = post_news('Resultados do dia', 'O ginásio recebeu a final de vôlei.')
+    in_title = post_news('Final de vôlei no ginásio', 'Partida decidida no tie-break.')
+    post_news('Abertura', 'Cerimônia de abertura dos jogos.')
+
+    result = _search(client, 'volei')
+    assert [item['news_id'] for item in result['items']] == [in_title['news_id'], in_content['news_id']]
+    assert '<mark>' in result['items'][1]['snippet']
+    # Prefixo e caracteres especiais não quebram a consulta
+    assert len(_search(client, 'gin')['items']) == 2
+    assert _search(client, 'vôlei" (*')['items']
+
+
+def test_index_follows_admin_updates_and_deletes(client, admin_headers, post_news):
+    news = post_news('Atletismo', 'Prova de revezamento adiada.')
+    assert _search(client, 'revezamento')['items']
+
+    response = client.put(f"/api/admin/news/{news['news_id']}", json={'content': 'Prova de salto em distância.'},
+                          headers=admin_headers)
+    assert response.status_code == 200
+    assert not _search(client, 'revezamento')['items']
+    assert _search(client, 'salto')['items']
+
+    assert client.delete(f"/api/admin/news/{news['news_id']}", headers=admin_headers).status_code == 200
+    assert not _search(client, 'salto')['items']
+
+
+def test_results_are_paginated(client, post_news):
+    for number in range(3):
+        post_news(f'Boletim {number}', 'Quadro de medalhas atualizado.')
+    first = _search(client, 'medalhas', limit=2)
+    assert len(first['items']) == 2 and first['next_page'] == 2
+    second = _search(client, 'medalhas', limit=2, page=2)
+    assert len(second['items']) == 1 and second['next_page'] is None
+    ids = {item['news_id'] for item in first['items'] + second['items']}
+    assert len(ids) == 3
+
+    assert client.get('/api/news/search').status_code == 400
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from services.snapshots import MANIFEST, LocalTarget, snapshot_publisher
+
+
+@pytest.fixture
+def target(tmp_path, monkeypatch):
+    target = LocalTarget(str(tmp_path / 'snapshots'))
+    monkeypatch.setattr(snapshot_publisher, 'target', target)
+    return target
+
+
+def _publish(app, full=False):
+    with app.app_context():
+        return snapshot_publisher.publish(full=full)
+
+
+def _documents(target):
+    return json.loads(target.read(MANIFEST))['documents']
+
+
+def _game(client, headers, ids):
+    response = client.post('/api/admin/games', json={
+        'sport_id': ids['sports'][0], 'team_a_id': ids['teams'][0], 'team_b_id': ids['teams'][1],
+        'game_date': '2030-03-01T10:00:00', 'location': 'Quadra'
+    }, headers=headers)
+    return response.get_json()['game']
+
+
+def test_admin_write_publishes_in_background(app, client, admin_headers, ids, tmp_path):
+    app.config.update(SNAPSHOT_DIR=str(tmp_path / 'auto'), SNAPSHOT_PUBLISH_DELAY=0)
+    snapshot_publisher.init_app(app)
+    game = _game(client, admin_headers, ids)
+    assert snapshot_publisher.wait_idle(10)
+    documents = _documents(snapshot_publisher.target)
+    assert f"games/{game['game_id']}" in documents
+
+    response = client.put(f"/api/admin/teams/{ids['teams'][2]}", json={'city': 'Timon'}, headers=admin_headers)
+    assert response.status_code == 200
+    assert snapshot_publisher.wait_idle(10)
+    after = _documents(snapshot_publisher.target)
+    assert after[f"teams/{ids['teams'][2]}"] != documents[f"teams/{ids['teams'][2]}"]
+    assert after[f"games/{game['game_id']}"] == documents[f"games/{game['game_id']}"]
+
+
+def test_full_publish_matches_the_api(app, client, target):
+    _publish(app)
+    documents = _documents(target)
+    assert target.read(documents['teams']) == client.get('/api/teams').data
+    team = client.get('/api/teams').get_json()[0]
+    assert json.loads(target.read(documents[f"teams/{team['team_id']}"])) == team
+
+
+def test_incremental_publish_rewrites_only_changed_documents(app, client, admin_headers, ids, target):
+    game = _game(client, admin_headers, ids)
+    _publish(app)
+    before = _documents(target)
+
+    response = client.put(f"/api/admin/teams/{ids['teams'][2]}", json={'city': 'Timon'}, headers=admin_headers)
+    assert response.status_code == 200
+    result = _publish(app)
+    after = _documents(target)
+    # Só as listagens que dependem de teams e o detalhe da equipe alterada
+    changed = {name for name in after if after[name] != before.get(name)}
+    detail = f"teams/{ids['teams'][2]}"
+    assert {'teams', detail} <= changed <= {'teams', 'games', 'medals', detail}
+    assert result['written'] == len(changed)
+    assert after[f"games/{game['game_id']}"] == before[f"games/{game['game_id']}"]
+
+    # Nada mudou: nenhum arquivo novo
+    assert _publish(app)['written'] == 0
+
+
+def test_deleted_entity_leaves_manifest_and_previous_generation_is_kept(app, client, admin_headers, ids, target):
+    game = _game(client, admin_headers, ids)
+    _publish(app)
+    first = _documents(target)
+    assert client.delete(f"/api/admin/games/{game['game_id']}", headers=admin_headers).status_code == 200
+
+    _publish(app)
+    second = _documents(target)
+    assert f"games/{game['game_id']}" not in second
+    files = set(target.list())
+    # O detalhe excluído continua para quem ainda tem o manifesto anterior
+    assert first[f"games/{game['game_id']}"] in files
+
+    _publish(app)
+    assert first[f"games/{game['game_id']}"] not in set(target.list())
+    assert set(target.list()) == {MANIFEST, *second.values()}
+
+
+def test_lock_excludes_concurrent_publishers(target):
+    with target.lock():
+        with pytest.raises(RuntimeError):
+            with target.lock(wait=0):
+                pass
+    with target.lock(wait=0):
+        pass
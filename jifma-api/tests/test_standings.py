@@ -0,0 +1,56 @@
+from services import standings
+from services.cache import response_cache
+
+
+def _finish(client, headers, game, score_a, score_b, status='Finalizado'):
+    response = client.put(f"/api/admin/games/{game['game_id']}", json={
+        'score_a': score_a, 'score_b': score_b, 'status': status
+    }, headers=headers)
+    assert response.status_code == 200, response.get_json()
+    return response.get_json()['game']
+
+
+def _table(client, sport_id):
+    response = client.get(f'/api/standings/{sport_id}')
+    assert response.status_code == 200
+    return {row['team_id']: row for row in response.get_json()}
+
+
+def test_incremental_table_matches_rebuild(app, client, admin_headers, ids, make_game):
+    sport_id = ids['sports'][0]
+    a, b, c = ids['teams'][:3]
+    first = make_game(game_date='2030-03-01T10:00:00')
+    second = make_game(team_a_id=b, team_b_id=c, game_date='2030-03-02T10:00:00')
+    third = make_game(team_a_id=a, team_b_id=c, game_date='2030-03-03T10:00:00')
+    cancelled = make_game(team_a_id=c, team_b_id=a, game_date='2030-03-04T10:00:00')
+
+    _finish(client, admin_headers, first, 2, 1)
+    _finish(client, admin_headers, second, 0, 0)
+    _finish(client, admin_headers, third, 1, 3)
+    # Correção de placar, reabertura e exclusão de jogos já finalizados
+    _finish(client, admin_headers, first, 1, 2)
+    _finish(client, admin_headers, second, 0, 0, status='Em Andamento')
+    _finish(client, admin_headers, cancelled, 5, 0)
+    assert client.delete(f"/api/admin/games/{cancelled['game_id']}", headers=admin_headers).status_code == 200
+
+    table = _table(client, sport_id)
+    assert (table[a]['played'], table[a]['losses'], table[a]['points']) == (2, 2, 0)
+    assert (table[b]['wins'], table[b]['points_for'], table[b]['points']) == (1, 2, 3)
+    assert (table[c]['wins'], table[c]['points_against'], table[c]['points']) == (1, 1, 3)
+
+    with app.app_context():
+        assert standings.diff() == []
+        standings.rebuild()
+    response_cache.clear()
+    assert _table(client, sport_id) == table
+
+
+def test_live_score_does_not_touch_the_table(app, client, admin_headers, ids, make_game):
+    game = make_game()
+    response = client.patch(f"/api/admin/games/{game['game_id']}/score", json={
+        'score_a': 3, 'score_b': 0, 'version': game['version']
+    }, headers=admin_headers)
+    assert response.status_code == 200
+    assert _table(client, ids['sports'][0]) == {}
+    with app.app_context():
+        assert standings.diff() == []
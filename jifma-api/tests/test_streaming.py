@@ -0,0 +1,16 @@
+import json
+
+
+def test_stream_lists_games(client, admin_headers):
+    response = client.get('/api/admin/games?format=ndjson', headers=admin_headers)
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert lines == client.get('/api/admin/games', headers=admin_headers).get_json()
+
+
+def test_stream_with_include_is_rejected(client, admin_headers):
+    for query in ('stream=1&include=teams', 'format=ndjson&include=sport'):
+        response = client.get(f'/api/admin/games?{query}', headers=admin_headers)
+        assert response.status_code == 400
+        assert 'include' in response.get_json()['error']
@@ -0,0 +1,63 @@
+from sqlalchemy import func, select
+
+from models.news import News
+from models.tags import Tag, news_tags
+from models.user import db
+from services import migrations
+
+
+def _post(client, headers, title, tags):
+    response = client.post('/api/admin/news', json={
+        'title': title, 'content': 'Texto da notícia.', 'author': 'Comissão', 'tags': tags
+    }, headers=headers)
+    assert response.status_code == 201
+    return response.get_json()['news']
+
+
+def _counts(client):
+    return {tag['slug']: tag['news_count'] for tag in client.get('/api/tags').get_json()}
+
+
+def _assert_counts_match_associations(app):
+    with app.app_context():
+        actual = dict(db.session.execute(
+            select(news_tags.c.tag_id, func.count()).group_by(news_tags.c.tag_id)
+        ).all())
+        for tag in Tag.query.all():
+            assert tag.news_count == actual.get(tag.tag_id, 0)
+
+
+def test_tags_are_normalized_counted_and_filterable(app, client, admin_headers):
+    first = _post(client, admin_headers, 'Final', ['Vôlei', ' volei ', 'Final'])
+    assert first['tags'] == ['Vôlei', 'Final']
+    second = _post(client, admin_headers, 'Semifinal', 'vôlei, Futsal')
+    assert _counts(client) == {'volei': 2, 'final': 1, 'futsal': 1}
+
+    for tag in ('volei', 'Vôlei'):
+        titles = {item['title'] for item in client.get('/api/news', query_string={'tag': tag}).get_json()}
+        assert titles == {'Final', 'Semifinal'}
+
+    response = client.put(f"/api/admin/news/{second['news_id']}", json={'tags': ['Futsal', 'Resultado']},
+                          headers=admin_headers)
+    assert response.status_code == 200
+    assert client.delete(f"/api/admin/news/{first['news_id']}", headers=admin_headers).status_code == 200
+    # Tags sem notícias somem da listagem
+    assert _counts(client) == {'futsal': 1, 'resultado': 1}
+    assert client.get('/api/news', query_string={'tag': 'volei'}).get_json() == []
+    _assert_counts_match_associations(app)
+
+
+def test_migration_converts_comma_strings(app, client):
+    with app.app_context():
+        db.session.add_all([
+            News(title='Antiga', content='Texto.', author='Comissão', tags='Atletismo, atletismo,,Xadrez'),
+            News(title='Outra', content='Texto.', author='Comissão', tags='Xadrez')
+        ])
+        db.session.commit()
+        with db.engine.begin() as conn:
+            migrations._normalized_tags(conn)
+
+    assert _counts(client) == {'xadrez': 2, 'atletismo': 1}
+    item, = client.get('/api/news', query_string={'tag': 'atletismo'}).get_json()
+    assert item['tags'] == ['Atletismo', 'Xadrez']
+    _assert_counts_match_associations(app)